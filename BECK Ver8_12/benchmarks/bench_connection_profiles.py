@@ -0,0 +1,134 @@
+"""
+Compares DataManager's connection profiles on insert and select workloads.
+
+Every profile gets a fresh database in a temporary directory, so settings that persist in
+the file (journal_mode) don't leak between runs. The read-only profile cannot insert; it
+reads a copy of the database the bulk-import run wrote.
+
+Run from the BECK Ver8_12 directory:
+
+    python -m benchmarks.bench_connection_profiles --rows 50000 --commits 500
+"""
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import date
+from typing import Callable, Dict, List, Optional
+
+from PyQt6.QtCore import QCoreApplication
+from PyQt6.QtSql import QSqlDatabase
+
+from database.connection_profiles import PROFILES
+from database.database_manager import DataManager, close_database
+from database.database_utility.beck_table_model import BeckTableModel
+
+CONNECTION = 'bench_connection_profiles'
+WRITABLE_PROFILES = ('sqlite-defaults', 'interactive', 'bulk-import')
+READ_ONLY_PROFILE = 'read-only analytics'
+
+
+def _record(index: int) -> tuple:
+    items = [random.randint(0, 3) for _ in range(21)]
+    day = date.fromordinal(date(2015, 1, 1).toordinal() + index % 3650)
+    return (day.isoformat(), f"{index % 24:02d}:{index % 60:02d}:00", *items, sum(items))
+
+
+def _timed(work: Callable[..., object], *args) -> float:
+    start = time.perf_counter()
+    work(*args)
+    return time.perf_counter() - start
+
+
+def _single_row_commits(manager: DataManager, commits: int) -> None:
+    for index in range(commits):
+        manager.insert_into_beck_table_aug_8(*_record(index))
+
+
+def _bulk_insert(manager: DataManager, rows: int) -> None:
+    manager.insert_many(_record(index) for index in range(rows))
+
+
+def _range_scans(manager: DataManager) -> None:
+    for year in range(2015, 2025):
+        manager.fetch_range(date(year, 1, 1), date(year + 1, 1, 1))
+
+
+def _paged_table_read(manager: DataManager) -> None:
+    model = BeckTableModel('beck_table_aug_8', db=manager.db)
+    model.select()
+    while model.canFetchMore():
+        model.fetchMore()
+
+
+def _monthly_trend(manager: DataManager) -> None:
+    manager.trend('month', date(2015, 1, 1), date(2025, 1, 1))
+
+
+def _run_profile(profile: str, path: str, rows: int, commits: int,
+                 seed_from: Optional[str] = None) -> Dict[str, float]:
+    """
+    Times every workload on a fresh connection with the given profile.
+
+    Args:
+        profile (str): The connection profile to benchmark.
+        path (str): The database file to use.
+        rows (int): The number of rows the bulk insert writes.
+        commits (int): The number of rows written one transaction each.
+        seed_from (Optional[str]): A database to copy to path and only read, for read-only
+            profiles.
+
+    Returns:
+        Dict[str, float]: The seconds each workload took.
+    """
+    if seed_from is not None:
+        shutil.copy(seed_from, path)
+    manager = DataManager(path, connection_name=CONNECTION, profile=profile)
+    results: Dict[str, float] = {}
+    try:
+        if seed_from is None:
+            results['single-row commits'] = _timed(_single_row_commits, manager, commits)
+            results['bulk insert'] = _timed(_bulk_insert, manager, rows)
+        results['range scans'] = _timed(_range_scans, manager)
+        results['paged table read'] = _timed(_paged_table_read, manager)
+        results['monthly trend'] = _timed(_monthly_trend, manager)
+    finally:
+        close_database(manager)
+        del manager
+        QSqlDatabase.removeDatabase(CONNECTION)
+    return results
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--rows', type=int, default=50000, help='rows written by the bulk insert')
+    parser.add_argument('--commits', type=int, default=500, help='rows written one commit each')
+    parser.add_argument('--seed', type=int, default=8, help='random seed for the generated rows')
+    args = parser.parse_args(argv)
+
+    app = QCoreApplication(sys.argv[:1])
+    results: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for profile in WRITABLE_PROFILES:
+            random.seed(args.seed)
+            path = os.path.join(directory, f"{profile}.db")
+            results[profile] = _run_profile(profile, path, args.rows, args.commits)
+        results[READ_ONLY_PROFILE] = _run_profile(
+            READ_ONLY_PROFILE, os.path.join(directory, 'read-only.db'), args.rows, args.commits,
+            seed_from=os.path.join(directory, 'bulk-import.db'))
+
+    workloads = list(results[WRITABLE_PROFILES[0]])
+    width = max(len(profile) for profile in PROFILES) + 2
+    print(f"{'seconds':<{width}}" + ''.join(f"{workload:>20}" for workload in workloads))
+    for profile, timings in results.items():
+        print(f"{profile:<{width}}" + ''.join(
+            f"{timings[workload]:>20.3f}" if workload in timings else f"{'n/a':>20}"
+            for workload in workloads))
+    del app
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,97 @@
+"""
+Compares the time to the main window's first frame with every exam page built up front against
+only the first page, as MainWindow does.
+
+Both modes build the window from ui.main_ui.gui and its pages with ui.beck_pages, with the
+application theme applied, and time from the start of setupUi to the first paint event. The on-demand mode then builds the remaining
+pages one at a time and reports the median cost of one, which is what navigating to an unbuilt
+page adds. Each run happens in a fresh process, so fonts and stylesheets are never warm.
+
+Run from the BECK Ver8_12 directory:
+
+    python -m benchmarks.bench_exam_pages --runs 10
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+MODES = ('eager', 'on-demand')
+
+
+def _run_once(mode: str, theme: str) -> None:
+    from PyQt6.QtCore import QEvent, QObject
+    from PyQt6.QtWidgets import QApplication, QMainWindow, QStyleFactory
+
+    from ui.beck_pages import BECK_PAGE_SLIDERS, build_beck_page
+    from ui.main_ui.gui import Ui_MainWindow
+    from ui.theme import apply_theme
+
+    class FirstPaint(QObject):
+        painted = None
+
+        def eventFilter(self, watched, event):
+            if event.type() == QEvent.Type.Paint and self.painted is None:
+                self.painted = time.perf_counter()
+            return False
+
+    app = QApplication(sys.argv[:1])
+    app.setStyle(QStyleFactory.create("Fusion"))
+    apply_theme(app, theme)
+    first_paint = FirstPaint()
+    app.installEventFilter(first_paint)
+
+    start = time.perf_counter()
+    window = QMainWindow()
+    ui = Ui_MainWindow()
+    ui.setupUi(window)
+    for index in range(len(BECK_PAGE_SLIDERS) if mode == 'eager' else 1):
+        build_beck_page(ui.stackedWidget.widget(index), index)
+    window.show()
+    window.setFixedSize(500, 135)
+    while first_paint.painted is None:
+        app.processEvents()
+    painted = first_paint.painted - start
+
+    page = float('nan')
+    if mode == 'on-demand':
+        pages = []
+        for index in range(1, len(BECK_PAGE_SLIDERS)):
+            start = time.perf_counter()
+            build_beck_page(ui.stackedWidget.widget(index), index)
+            pages.append(time.perf_counter() - start)
+        page = statistics.median(pages)
+    print(f"{painted} {page}")
+    window.close()
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--runs', type=int, default=10, help='fresh processes per mode')
+    parser.add_argument('--theme', default='dark', help='theme to build the window with')
+    parser.add_argument('--run', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.run:
+        _run_once(args.run, args.theme)
+        return
+
+    results: Dict[str, List[Tuple[float, float]]] = {mode: [] for mode in MODES}
+    for _ in range(args.runs):
+        for mode in MODES:
+            output = subprocess.run(
+                [sys.executable, '-m', 'benchmarks.bench_exam_pages', '--run', mode, '--theme', args.theme],
+                check=True, capture_output=True, text=True).stdout
+            painted, page = (float(value) for value in output.split())
+            results[mode].append((painted, page))
+
+    print(f"{'ms (median)':<14}{'first paint':>16}{'one more page':>16}")
+    for mode, timings in results.items():
+        painted = statistics.median(timing[0] for timing in timings) * 1000
+        page = statistics.median(timing[1] for timing in timings) * 1000
+        print(f"{mode:<14}{painted:>16.1f}" + (f"{page:>16.2f}" if page == page else f"{'n/a':>16}"))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,106 @@
+"""
+Compares what a log call costs the calling thread with synchronous file logging against the
+queued logging of logger_setup.
+
+The synchronous mode reproduces how logging was set up before: a FileHandler on the calling
+thread, truncating the file, and messages built as f-strings. The queued mode calls
+configure_logging, so the calling thread only puts records on a queue and a background thread
+formats and writes them, and messages use %-style arguments. Both time --calls INFO records,
+which are written, and as many DEBUG records, which the level filters out. Every call is timed
+on its own, --interval ms after the last, as the GUI thread logs now and then rather than in
+bursts, and the median is reported. Each run happens in a fresh process with its own home
+directory, since logging is configured once per process.
+
+Run from the BECK Ver8_12 directory:
+
+    python -m benchmarks.bench_logging --runs 10 --calls 2000
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+import tracker_config as tkc
+
+MODES = ('synchronous', 'queued')
+MODULE = 'bench'
+
+
+def _time_calls(log, calls: int, interval: float) -> float:
+    timings = []
+    for index in range(calls):
+        time.sleep(interval)
+        start = time.perf_counter()
+        log(index)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def _run_once(mode: str, calls: int, interval: float) -> None:
+    import logging
+
+    if mode == 'synchronous':
+        logger = logging.getLogger(MODULE)
+        handler = logging.FileHandler(os.path.join(os.path.expanduser('~'), tkc.LOG_FILE), mode='w')
+        handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s',
+                                               datefmt=tkc.DATEFORMAT))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        written = _time_calls(
+            lambda index: logger.info(f"Background write of {index} records failed: {MODES}"),
+            calls, interval)
+        filtered = _time_calls(
+            lambda index: logger.debug(f"Background write of {index} records failed: {MODES}"),
+            calls, interval)
+    else:
+        from logger_setup import configure_logging, get_logger, stop_logging
+
+        configure_logging()
+        logger = get_logger(MODULE)
+        written = _time_calls(
+            lambda index: logger.info("Background write of %s records failed: %s", index, MODES),
+            calls, interval)
+        filtered = _time_calls(
+            lambda index: logger.debug("Background write of %s records failed: %s", index, MODES),
+            calls, interval)
+        stop_logging()
+    print(f"{written} {filtered}")
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--runs', type=int, default=10, help='fresh processes per mode')
+    parser.add_argument('--calls', type=int, default=2000, help='log calls per level and run')
+    parser.add_argument('--interval', type=float, default=0.5, help='ms between calls')
+    parser.add_argument('--run', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.run:
+        _run_once(args.run, args.calls, args.interval / 1000)
+        return
+
+    results: Dict[str, List[Tuple[float, float]]] = {mode: [] for mode in MODES}
+    for _ in range(args.runs):
+        for mode in MODES:
+            with tempfile.TemporaryDirectory() as home:
+                env = dict(os.environ, HOME=home)
+                env[tkc.LOG_LEVELS_ENV] = f"{MODULE}=INFO"
+                output = subprocess.run(
+                    [sys.executable, '-m', 'benchmarks.bench_logging', '--run', mode,
+                     '--calls', str(args.calls), '--interval', str(args.interval)],
+                    env=env, check=True, capture_output=True, text=True).stdout
+            written, filtered = (float(value) for value in output.split())
+            results[mode].append((written, filtered))
+
+    print(f"{'µs per call (median)':<22}{'written':>12}{'filtered':>12}")
+    for mode, timings in results.items():
+        written = statistics.median(timing[0] for timing in timings) * 1e6
+        filtered = statistics.median(timing[1] for timing in timings) * 1e6
+        print(f"{mode:<22}{written:>12.2f}{filtered:>12.3f}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
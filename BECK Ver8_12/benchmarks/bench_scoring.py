@@ -0,0 +1,61 @@
+"""
+Compares score_matrix with scoring row by row in plain Python.
+
+Both score the same random (N, 21) matrix of item scores; the Python loop works on lists, as
+the row-at-a-time code did before, so the comparison includes no NumPy conversions.
+
+Run from the BECK Ver8_12 directory:
+
+    python -m benchmarks.bench_scoring --rows 1000000
+"""
+import argparse
+import sys
+import time
+from typing import List, Tuple
+
+import numpy as np
+
+from database.scoring import COGNITIVE_AFFECTIVE_ITEMS, SEVERITY_BANDS, SOMATIC_ITEMS, score_matrix
+
+
+def _score_loop(rows: List[List[int]]) -> Tuple[List[int], List[int], List[int], List[int]]:
+    totals, bands, cognitive_affective, somatic = [], [], [], []
+    for items in rows:
+        cognitive = sum(items[position] for position in COGNITIVE_AFFECTIVE_ITEMS)
+        body = sum(items[position] for position in SOMATIC_ITEMS)
+        total = cognitive + body
+        band = next(band for band, (_, low, high) in enumerate(SEVERITY_BANDS) if low <= total <= high)
+        totals.append(total)
+        bands.append(band)
+        cognitive_affective.append(cognitive)
+        somatic.append(body)
+    return totals, bands, cognitive_affective, somatic
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--rows', type=int, default=1000000, help='assessments to score')
+    parser.add_argument('--seed', type=int, default=8, help='random seed for the generated scores')
+    args = parser.parse_args(argv)
+
+    items = np.random.default_rng(args.seed).integers(0, 4, size=(args.rows, 21), dtype=np.uint8)
+    rows = items.tolist()
+
+    start = time.perf_counter()
+    expected = _score_loop(rows)
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scores = score_matrix(items)
+    vector_seconds = time.perf_counter() - start
+
+    for name, loop_values, vector_values in zip(scores._fields, expected, scores):
+        if not np.array_equal(np.asarray(loop_values), vector_values):
+            raise SystemExit(f"{name} differ between the loop and score_matrix")
+    print(f"{args.rows} rows")
+    print(f"{'python loop':<14}{loop_seconds:>10.3f} s")
+    print(f"{'score_matrix':<14}{vector_seconds:>10.3f} s  ({loop_seconds / vector_seconds:.0f}x)")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,110 @@
+"""
+Times cold and warm starts of main.py, phase by phase, from the startup trace it writes.
+
+Every run launches main.py in a fresh process, offscreen, with tkc.STARTUP_TRACE_ENV and
+tkc.STARTUP_TRACE_QUIT_ENV set, so it quits once storage is ready and leaves its trace behind.
+All runs share a home directory whose database is seeded with --rows assessments. A cold run
+also gets an empty bytecode cache through PYTHONPYCACHEPREFIX, so every module it imports,
+the standard library's included, is compiled again as after an install or upgrade; warm runs
+share a cache primed by one untimed run. PYTHONDONTWRITEBYTECODE is cleared for the runs. The
+operating system's file cache is not dropped.
+
+Run from the BECK Ver8_12 directory:
+
+    python -m benchmarks.bench_startup --runs 10 --rows 10000
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+from typing import Dict, List
+
+import tracker_config as tkc
+from database.sqlite_storage import SqliteStorage
+from utility.app_operations.startup_profile import FIRST_FRAME, READY
+
+MODES = ('cold', 'warm')
+APP_DIRECTORY = Path(__file__).resolve().parent.parent
+PROCESS = 'process exit'
+
+
+def _record(index: int) -> tuple:
+    items = [random.randint(0, 3) for _ in range(21)]
+    day = date.fromordinal(date(2015, 1, 1).toordinal() + index % 3650)
+    return (day.isoformat(), f"{index % 24:02d}:{index % 60:02d}:00", *items, sum(items))
+
+
+def _seed(home: str, rows: int) -> None:
+    storage = SqliteStorage(os.path.join(home, tkc.DB_NAME))
+    try:
+        storage.insert_many(_record(index) for index in range(rows))
+    finally:
+        storage.close()
+
+
+def _launch(home: str, pycache: str) -> Dict[str, float]:
+    """
+    Starts main.py until storage is ready and reads back its trace.
+
+    Returns:
+        Dict[str, float]: Milliseconds per phase, when the first frame was painted and storage
+            was ready, and when the process exited as seen from here.
+    """
+    trace = os.path.join(home, 'startup.json')
+    env = dict(os.environ, HOME=home, QT_QPA_PLATFORM='offscreen', PYTHONPYCACHEPREFIX=pycache)
+    # The bytecode cache is what tells cold from warm, so it must be written.
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    env[tkc.STARTUP_TRACE_ENV] = trace
+    env[tkc.STARTUP_TRACE_QUIT_ENV] = '1'
+    start = time.perf_counter()
+    subprocess.run([sys.executable, 'main.py'], cwd=APP_DIRECTORY, env=env, check=True,
+                   capture_output=True)
+    wall = (time.perf_counter() - start) * 1000
+    with open(trace, encoding='utf-8') as file:
+        events = json.load(file)['traceEvents']
+    timings = {event['name']: event['dur'] / 1000 for event in events if event['ph'] == 'X'}
+    for mark in (FIRST_FRAME, READY):
+        timings[mark] = next(event['ts'] for event in events if event['name'] == mark) / 1000
+    timings[PROCESS] = wall
+    return timings
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--runs', type=int, default=10, help='launches per mode')
+    parser.add_argument('--rows', type=int, default=10000, help='assessments in the database')
+    parser.add_argument('--seed', type=int, default=8, help='random seed for the generated rows')
+    args = parser.parse_args(argv)
+
+    results: Dict[str, List[Dict[str, float]]] = {mode: [] for mode in MODES}
+    with tempfile.TemporaryDirectory() as home, tempfile.TemporaryDirectory() as warm_cache:
+        random.seed(args.seed)
+        _seed(home, args.rows)
+        _launch(home, warm_cache)
+        for _ in range(args.runs):
+            with tempfile.TemporaryDirectory() as cold_cache:
+                results['cold'].append(_launch(home, cold_cache))
+            results['warm'].append(_launch(home, warm_cache))
+
+    # Phases in the order they ended, which puts a phase after the phases inside it.
+    rows: List[str] = []
+    for timings in results['cold'] + results['warm']:
+        rows.extend(name for name in timings if name not in rows and name not in (FIRST_FRAME, READY, PROCESS))
+    rows += [FIRST_FRAME, READY, PROCESS]
+    width = max(len(name) for name in rows) + 2
+    print(f"{'ms (median)':<{width}}" + ''.join(f"{mode:>12}" for mode in MODES))
+    for name in rows:
+        print(f"{name:<{width}}" + ''.join(
+            f"{statistics.median(timings.get(name, 0.0) for timings in results[mode]):>12.1f}"
+            for mode in MODES))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
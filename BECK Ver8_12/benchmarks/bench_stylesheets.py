@@ -0,0 +1,115 @@
+"""
+Compares building the main window with one application stylesheet against one per widget.
+
+Both modes use the same rules from ui.theme. The per-widget mode reproduces how the window was
+styled before: the unscoped rules set on the main window and every object-name rule, with the
+name removed, set on its own widget. Every exam page is built up front in both modes, as the
+window was when it had per-widget stylesheets. Each run happens in a fresh process, since Qt
+caches parsed stylesheets for the life of the application.
+
+Run from the BECK Ver8_12 directory:
+
+    python -m benchmarks.bench_stylesheets --runs 10
+"""
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+MODES = ('per-widget', 'application')
+RULE = re.compile(r'([^{}]+)\{([^{}]*)\}')
+COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+OBJECT_NAME = re.compile(r'#(\w+)')
+
+
+def _split_by_widget(stylesheet: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Splits a stylesheet into its unscoped rules and, per object name, the rules scoped to it.
+    """
+    unscoped: List[str] = []
+    scoped: Dict[str, List[str]] = defaultdict(list)
+    for selectors, body in RULE.findall(COMMENT.sub('', stylesheet)):
+        for selector in selectors.split(','):
+            selector = selector.strip()
+            match = OBJECT_NAME.search(selector)
+            if match is None:
+                unscoped.append(f"{selector} {{{body}}}")
+            else:
+                scoped[match.group(1)].append(f"{OBJECT_NAME.sub('', selector, count=1)} {{{body}}}")
+    return '\n'.join(unscoped), {name: '\n'.join(rules) for name, rules in scoped.items()}
+
+
+def _run_once(mode: str, theme: str) -> None:
+    from PyQt6.QtWidgets import QApplication, QMainWindow, QStyleFactory, QWidget
+
+    from ui.beck_pages import BECK_PAGE_SLIDERS, build_beck_page
+    from ui.main_ui.gui import Ui_MainWindow
+    from ui.theme import THEMES, apply_theme, stylesheet
+
+    app = QApplication(sys.argv[:1])
+    app.setStyle(QStyleFactory.create("Fusion"))
+    start = time.perf_counter()
+    window = QMainWindow()
+    ui = Ui_MainWindow()
+    if mode == 'application':
+        apply_theme(app, theme)
+        ui.setupUi(window)
+        for index in range(len(BECK_PAGE_SLIDERS)):
+            build_beck_page(ui.stackedWidget.widget(index), index)
+    else:
+        unscoped, scoped = _split_by_widget(stylesheet(theme))
+        window.setStyleSheet(unscoped)
+        ui.setupUi(window)
+        for index in range(len(BECK_PAGE_SLIDERS)):
+            build_beck_page(ui.stackedWidget.widget(index), index)
+        for name, rules in scoped.items():
+            window.findChild(QWidget, name).setStyleSheet(rules)
+    window.show()
+    app.processEvents()
+    built = time.perf_counter() - start
+
+    switch = float('nan')
+    if mode == 'application':
+        other = next(name for name in THEMES if name != theme)
+        start = time.perf_counter()
+        apply_theme(app, other)
+        app.processEvents()
+        apply_theme(app, theme)
+        app.processEvents()
+        switch = (time.perf_counter() - start) / 2
+    print(f"{built} {switch}")
+    window.close()
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--runs', type=int, default=10, help='fresh processes per mode')
+    parser.add_argument('--theme', default='dark', help='theme to build the window with')
+    parser.add_argument('--run', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.run:
+        _run_once(args.run, args.theme)
+        return
+
+    results: Dict[str, List[Tuple[float, float]]] = {mode: [] for mode in MODES}
+    for _ in range(args.runs):
+        for mode in MODES:
+            output = subprocess.run(
+                [sys.executable, '-m', 'benchmarks.bench_stylesheets', '--run', mode, '--theme', args.theme],
+                check=True, capture_output=True, text=True).stdout
+            built, switch = (float(value) for value in output.split())
+            results[mode].append((built, switch))
+
+    print(f"{'ms (median)':<14}{'build + show':>16}{'theme switch':>16}")
+    for mode, timings in results.items():
+        built = statistics.median(timing[0] for timing in timings) * 1000
+        switch = statistics.median(timing[1] for timing in timings) * 1000
+        print(f"{mode:<14}{built:>16.1f}" + (f"{switch:>16.1f}" if switch == switch else f"{'n/a':>16}"))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -1,6 +1,12 @@
+import queue
+
 from PyQt6.QtCore import QDate, QTime
 import tracker_config as tkc
-from logger_setup import logger
+from database.beck_columns import BECK_ITEM_COLUMNS
+from database.database_manager import beck_timestamp
+from logger_setup import get_logger
+
+logger = get_logger(__name__)
 
 
 def add_beck_data(main_window_instance, widget_names, db_insert_method):
@@ -10,13 +16,16 @@ def add_beck_data(main_window_instance, widget_names, db_insert_method):
     Args:
         main_window_instance (object): The instance of the main window.
         widget_names (dict): A dictionary containing the names of the widgets.
-        db_insert_method (function): The method used to insert data into the database.
+        db_insert_method (function): The method used to insert data into the database, or to queue
+            it for the background writer.
 
     Returns:
         None
 
     Raises:
-        Exception: If there is an error getting the value from a widget or inserting data into the database.
+        RuntimeError: If the data cannot be inserted or queued, for instance because the
+            background writer's queue is full. The form then keeps its values; it is only
+            reset once the data is handed over.
     """
     widget_methods = {
         widget_names['beck_date']: (None, 'date', "yyyy-MM-dd"),
@@ -47,26 +56,41 @@ def add_beck_data(main_window_instance, widget_names, db_insert_method):
 
     data_to_insert = []
     for widget_name, (widget_attr, method, format_type) in widget_methods.items():
-        widget = getattr(main_window_instance, widget_name)
         try:
-            value = getattr(widget, method)()
+            if method == 'value':
+                # Read without building exam pages that were never shown.
+                value = main_window_instance.form_value(widget_name)
+            else:
+                value = getattr(main_window_instance.form_widget(widget_name), method)()
             if format_type:
                 value = value.toString(format_type)
             data_to_insert.append(value)
         except Exception as e:
-            logger.error(f"Error getting value from widget {widget_name}: {e}")
+            logger.error("Error getting value from widget %s: %s", widget_name, e)
+
+    # beck_date and beck_time are the first two values collected above
+    data_to_insert.append(beck_timestamp(*data_to_insert[:2]))
 
     try:
         db_insert_method(*data_to_insert)
-        reset_beck_exam(main_window_instance, widget_names)
+    except queue.Full as e:
+        error_message = ("Error inserting data into the database: too many assessments are "
+                         "already waiting to be written")
+        logger.error(error_message)
+        raise RuntimeError(error_message) from e
     except Exception as e:
-        logger.error(f"Error inserting data into the database: {e}")
+        error_message = f"Error inserting data into the database: {e}"
+        logger.error(error_message)
+        raise RuntimeError(error_message) from e
+    reset_beck_exam(main_window_instance, widget_names)
 
 
 def reset_beck_exam(main_window_instance, widget_names):
     """
     Reset the values of the mental_mental form in the main window.
 
+    The date and time go to now and every item to 0 in one batch, see set_beck_form.
+
     Args:
         main_window_instance (object): An instance of the main window.
         widget_names (dict): A dictionary containing the names of the widgets used in the mental_mental form.
@@ -78,30 +102,37 @@ def reset_beck_exam(main_window_instance, widget_names):
         None
     """
     try:
-        getattr(main_window_instance, widget_names['beck_date']).setDate(QDate.currentDate())
-        getattr(main_window_instance, widget_names['beck_time']).setTime(QTime.currentTime())
-        getattr(main_window_instance, widget_names['b_slider']).setValue(0)
-        getattr(main_window_instance, widget_names['b_slider_2']).setValue(0)
-        getattr(main_window_instance, widget_names['b_slider_3']).setValue(0)
-        getattr(main_window_instance, widget_names['b_slider_4']).setValue(0)
-        getattr(main_window_instance, widget_names['b_slider_5']).setValue(0)
-        getattr(main_window_instance, widget_names['b_slider_6']).setValue(0)
-        getattr(main_window_instance, widget_names['b_slider_7']).setValue(0)
-        getattr(main_window_instance, widget_names['b_slider_8']).setValue(0)
-        getattr(main_window_instance, widget_names['b_slider_9']).setValue(0)
-        getattr(main_window_instance, widget_names['b_slider_10']).setValue(0)
-        getattr(main_window_instance, widget_names['b_slider_11']).setValue(0)
-        getattr(main_window_instance, widget_names['b_slider_12']).setValue(0)
-        getattr(main_window_instance, widget_names['b_slider_13']).setValue(0)
-        getattr(main_window_instance, widget_names['b_slider_14']).setValue(0)
-        getattr(main_window_instance, widget_names['b_slider_15']).setValue(0)
-        getattr(main_window_instance, widget_names['b_slider_16']).setValue(0)
-        getattr(main_window_instance, widget_names['b_slider_17']).setValue(0)
-        getattr(main_window_instance, widget_names['b_slider_18']).setValue(0)
-        getattr(main_window_instance, widget_names['b_slider_19']).setValue(0)
-        getattr(main_window_instance, widget_names['b_slider_20']).setValue(0)
-        getattr(main_window_instance, widget_names['b_slider_21']).setValue(0)
-        getattr(main_window_instance, widget_names['beck_summary']).setValue(0)
-        getattr(main_window_instance, widget_names['model']).select()
+        values = {
+            widget_names['beck_date']: QDate.currentDate(),
+            widget_names['beck_time']: QTime.currentTime(),
+        }
+        values.update((widget_names[column], 0) for column in BECK_ITEM_COLUMNS)
+        main_window_instance.set_beck_form(values)
+    except Exception as e:
+        logger.error("Error resetting pain levels form: %s", e)
+
+
+def load_beck_exam(main_window_instance, widget_names, record):
+    """
+    Fill the form with a stored assessment, for a new entry that starts from it.
+
+    Args:
+        main_window_instance (object): An instance of the main window.
+        widget_names (dict): A dictionary containing the names of the widgets used in the form.
+        record (Mapping[str, Any]): The assessment, by column name as beck_table_aug_8 stores it.
+
+    Raises:
+        Exception: If there is an error loading the assessment.
+
+    Returns:
+        None
+    """
+    try:
+        values = {
+            widget_names['beck_date']: QDate.fromString(str(record['beck_date']), "yyyy-MM-dd"),
+            widget_names['beck_time']: QTime.fromString(str(record['beck_time']), "hh:mm:ss"),
+        }
+        values.update((widget_names[column], int(record[column] or 0)) for column in BECK_ITEM_COLUMNS)
+        main_window_instance.set_beck_form(values)
     except Exception as e:
-        logger.error(f"Error resetting pain levels form: {e}")
+        logger.error("Error loading assessment into the form: %s", e)
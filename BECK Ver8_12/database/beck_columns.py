@@ -0,0 +1,5 @@
+# Column names of beck_table_aug_8, shared by the data manager, migrations and codecs.
+BECK_ITEM_COLUMNS = tuple(['b_slider'] + [f'b_slider_{n}' for n in range(2, 22)])
+BECK_FORM_COLUMNS = ('beck_date', 'beck_time') + BECK_ITEM_COLUMNS + ('beck_summary',)
+BECK_INSERT_COLUMNS = BECK_FORM_COLUMNS + ('beck_ts',)
+BECK_TABLE_COLUMNS = ('id',) + BECK_INSERT_COLUMNS
@@ -0,0 +1,108 @@
+from typing import TYPE_CHECKING, Dict, NamedTuple, Tuple, Union
+
+from logger_setup import get_logger
+
+logger = get_logger(__name__)
+
+if TYPE_CHECKING:
+    from database.storage import StorageBackend
+
+
+class ConnectionProfile(NamedTuple):
+    """
+    A named set of SQLite settings applied to a connection right after it is opened.
+
+    Attributes:
+        name (str): The name the profile is selected by.
+        pragmas (Tuple[Tuple[str, Union[str, int]], ...]): The PRAGMAs to set, in order.
+        read_only (bool): Whether the database file is opened read-only, which each storage
+            backend requests before the connection opens.
+    """
+    name: str
+    pragmas: Tuple[Tuple[str, Union[str, int]], ...]
+    read_only: bool = False
+
+
+# cache_size is negative to give it in KiB rather than pages; mmap_size is in bytes.
+PROFILES: Dict[str, ConnectionProfile] = {
+    # The GUI and its background writer: WAL lets the table read while the writer commits,
+    # and synchronous=NORMAL syncs at checkpoints instead of at every commit. A power loss
+    # can lose the last commits but never corrupts the database.
+    'interactive': ConnectionProfile('interactive', (
+        ('journal_mode', 'WAL'),
+        ('synchronous', 'NORMAL'),
+        ('cache_size', -16384),
+        ('mmap_size', 64 * 1024 * 1024),
+        ('temp_store', 'MEMORY'),
+    )),
+    # Large imports that can simply be re-run if the machine goes down mid-way.
+    'bulk-import': ConnectionProfile('bulk-import', (
+        ('journal_mode', 'WAL'),
+        ('synchronous', 'OFF'),
+        ('cache_size', -131072),
+        ('mmap_size', 256 * 1024 * 1024),
+        ('temp_store', 'MEMORY'),
+        ('wal_autocheckpoint', 10000),
+    )),
+    # SQLite's built-in settings, as a baseline for benchmarks. journal_mode persists in the
+    # database file, so this doesn't take a database out of WAL mode.
+    'sqlite-defaults': ConnectionProfile('sqlite-defaults', ()),
+    # Reports and exports over an already migrated database; writes are refused.
+    'read-only analytics': ConnectionProfile('read-only analytics', (
+        ('query_only', 'ON'),
+        ('cache_size', -65536),
+        ('mmap_size', 256 * 1024 * 1024),
+        ('temp_store', 'MEMORY'),
+    ), read_only=True),
+}
+
+
+def get_profile(name: str) -> ConnectionProfile:
+    """
+    Looks up a connection profile by name.
+
+    Args:
+        name (str): The profile name, one of PROFILES.
+
+    Returns:
+        ConnectionProfile: The profile.
+
+    Raises:
+        ValueError: If there is no profile with that name.
+    """
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown connection profile {name!r}, expected one of {', '.join(PROFILES)}") from None
+
+
+def apply_profile(storage: 'StorageBackend', profile: ConnectionProfile) -> Dict[str, str]:
+    """
+    Sets a profile's PRAGMAs on an open connection and logs the settings that took effect.
+
+    SQLite ignores some settings silently (a read-only connection keeps its journal mode,
+    mmap_size is capped at compile time), so the values are read back rather than assumed.
+
+    Args:
+        storage (StorageBackend): The open connection.
+        profile (ConnectionProfile): The profile to apply.
+
+    Returns:
+        Dict[str, str]: The effective value of every PRAGMA in the profile.
+
+    Raises:
+        RuntimeError: If a PRAGMA fails.
+    """
+    for pragma, value in profile.pragmas:
+        try:
+            storage.execute(f"PRAGMA {pragma} = {value}")
+        except RuntimeError as e:
+            error_message = f"Error setting PRAGMA {pragma} = {value}: {e}"
+            logger.error(error_message)
+            raise RuntimeError(error_message) from e
+    effective: Dict[str, str] = {}
+    for pragma, _ in profile.pragmas:
+        effective[pragma] = str(storage.fetch_value(f"PRAGMA {pragma}"))
+    settings = ', '.join(f"{pragma}={value}" for pragma, value in effective.items())
+    logger.info("Connection %s uses profile %s: %s", storage.connection_name, profile.name, settings)
+    return effective
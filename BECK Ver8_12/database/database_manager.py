@@ -1,9 +1,17 @@
 from PyQt6.QtSql import QSqlDatabase, QSqlQuery
 import os
 import shutil
-from typing import List, Union
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 import tracker_config as tkc
-from logger_setup import logger
+from database.connection_profiles import apply_profile, get_profile
+from database.migrations import MigrationProgress
+from database.query_log import timed_commit, timed_exec
+from database.statement_cache import StatementCache
+from database.storage import (  # re-exported for the modules that imported them from here
+    BeckRecord, ChunkTiming, Moment, StorageBackend, beck_timestamp, to_beck_ts)
+from logger_setup import get_logger
+
+logger = get_logger(__name__)
 
 user_dir = os.path.expanduser('~')
 db_path = os.path.join(os.getcwd(), tkc.DB_NAME)  # Database Name
@@ -35,159 +43,183 @@ def initialize_database() -> None:
                     logger.error("Error: Unable to create database")
                 db.close()
     except Exception as e:
-        logger.error("Error: Unable to create database", str(e))
+        logger.error("Error: Unable to create database: %s", e)
+
 
+class DataManager(StorageBackend):
+    """
+    The QtSql storage backend, used by the GUI and its background writer.
 
-class DataManager:
+    The assessment queries come from StorageBackend; database.sqlite_storage.SqliteStorage
+    runs the same ones on the same file without Qt.
+    """
     
     def __init__(self,
-                 db_name: str = target_db_path) -> None:
+                 db_name: str = target_db_path,
+                 connection_name: Optional[str] = None,
+                 migration_progress: Optional[MigrationProgress] = None,
+                 profile: str = tkc.DB_CONNECTION_PROFILE) -> None:
         """
-        Initializes the DataManager object and opens the database connection.
+        Initializes the DataManager object, opens the database connection, applies its
+        connection profile and migrates the schema.
+
+        Statements with bind values are prepared through self.statements, a StatementCache
+        on this connection, so repeated statements are parsed once.
 
         Args:
             db_name (str): The path to the SQLite database file.
+            connection_name (Optional[str]): The name of the QSqlDatabase connection to open.
+                Defaults to Qt's default connection; worker threads must pass their own name
+                because a connection may only be used from the thread that created it.
+            migration_progress (Optional[MigrationProgress]): Called while long migrations
+                rewrite data.
+            profile (str): The connection profile to apply, one of
+                database.connection_profiles.PROFILES. A read-only profile needs a database
+                that is already migrated.
 
         Raises:
-            Exception: If there is an error opening the database.
+            ValueError: If the profile is unknown.
+            RuntimeError: If the database cannot be opened, configured or migrated.
 
         """
-        try:
+        if connection_name is None:
             self.db: QSqlDatabase = QSqlDatabase.addDatabase('QSQLITE')
-            self.db.setDatabaseName(db_name)
-            
-            if not self.db.open():
-                logger.error("Error: Unable to open database")
-            logger.info("DB INITIALIZING")
-            self.query: QSqlQuery = QSqlQuery()
+        else:
+            self.db: QSqlDatabase = QSqlDatabase.addDatabase('QSQLITE', connection_name)
+        self.connection_name: str = self.db.connectionName()
+        self.migration_progress: Optional[MigrationProgress] = migration_progress
+        self.profile = get_profile(profile)
+        self.db.setDatabaseName(db_name)
+        options = [f"QSQLITE_BUSY_TIMEOUT={tkc.DB_BUSY_TIMEOUT_MS}"]
+        if self.profile.read_only:
+            options.append("QSQLITE_OPEN_READONLY")
+        self.db.setConnectOptions(';'.join(options))
+        self.statements = StatementCache(self.db)
+
+        if not self.db.open():
+            error_message = f"Error: Unable to open database {db_name}: {self.db.lastError().text()}"
+            logger.error(error_message)
+            raise RuntimeError(error_message)
+        logger.info("DB INITIALIZING")
+        try:
+            self.settings: Dict[str, str] = apply_profile(self, self.profile)
             self.setup_tables()
-        except Exception as e:
-            logger.error(f"Error: Unable to open database {e}", exc_info=True)
-    
-    def setup_tables(self) -> None:
-        """
-        Sets up the necessary tables in the database.
+        except RuntimeError:
+            self.close()
+            raise
 
-        This method calls the setup_beck_table_aug_8() and setup_altman_table() methods to create the required tables in the database.
+    def _run(self, sql: str, bind_values: Sequence[Any]) -> QSqlQuery:
         """
-        self.setup_beck_table_aug_8()
+        Executes a statement, through the statement cache when it has bind values, and
+        records it in database.query_log.query_log.
 
-    def setup_beck_table_aug_8(self) -> None:
-        """
-        Sets up the 'beck_table_aug_8' in the database if it doesn't already exist.
-
-        This method creates a table named 'beck_table_aug_8' in the database with the following columns:
-        - id: INTEGER (Primary Key, Autoincrement)
-        - beck_date: TEXT
-        - beck_time: TEXT
-        - sadness: INTEGER
-        - outlook: INTEGER
-        - guilt: INTEGER
-        - solitude: INTEGER
-        - hygiene: INTEGER
-        - decisiveness: INTEGER
-        - effort: INTEGER
-        - interest: INTEGER
-        - pessimism: INTEGER
-        - victimhood: INTEGER
-        - sleep: INTEGER
-                
-        If the table already exists, this method does nothing.
+        Args:
+            sql (str): The statement, with '?' placeholders.
+            bind_values (Sequence[Any]): One value per placeholder.
 
         Returns:
-            None
+            QSqlQuery: The executed query, positioned before its first row.
+
+        Raises:
+            ValueError: If the number of bind values doesn't match the placeholders.
+            RuntimeError: If the statement fails.
         """
-        if not self.query.exec(f"""
-                        CREATE TABLE IF NOT EXISTS beck_table_aug_8 (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        beck_date TEXT,
-                        beck_time TEXT,
-                        b_slider INTEGER,
-                        b_slider_2 INTEGER,
-                        b_slider_3 INTEGER,
-                        b_slider_4 INTEGER,
-                        b_slider_5 INTEGER,
-                        b_slider_6 INTEGER,
-                        b_slider_7 INTEGER,
-                        b_slider_8 INTEGER,
-                        b_slider_9 INTEGER,
-                        b_slider_10 INTEGER,
-                        b_slider_11 INTEGER,
-                        b_slider_12 INTEGER,
-                        b_slider_13 INTEGER,
-                        b_slider_14 INTEGER,
-                        b_slider_15 INTEGER,
-                        b_slider_16 INTEGER,
-                        b_slider_17 INTEGER,
-                        b_slider_18 INTEGER,
-                        b_slider_19 INTEGER,
-                        b_slider_20 INTEGER,
-                        b_slider_21 INTEGER,
-                        beck_summary INTEGER
-                        )"""):
-            logger.error(f"Error creating table: beck_table_aug_8",
-                         self.query.lastError().text())
-    
-    def insert_into_beck_table_aug_8(self,
-                               beck_date: str,
-                               beck_time: str,
-                               b_slider: int,
-                               b_slider_2: int,
-                               b_slider_3: int,
-                               b_slider_4: int,
-                               b_slider_5: int,
-                               b_slider_6: int,
-                               b_slider_7: int,
-                               b_slider_8: int,
-                               b_slider_9: int,
-                               b_slider_10: int,
-                               b_slider_11: int,
-                               b_slider_12: int,
-                               b_slider_13: int,
-                               b_slider_14: int,
-                               b_slider_15: int,
-                               b_slider_16: int,
-                               b_slider_17: int,
-                               b_slider_18: int,
-                               b_slider_19: int,
-                               b_slider_20: int,
-                               b_slider_21: int,
-                               beck_summary: int
-                               ) -> None:
-        sql: str = f"""INSERT INTO beck_table_aug_8(
-        beck_date, beck_time, b_slider, b_slider_2, b_slider_3, b_slider_4, b_slider_5, b_slider_6,
-        b_slider_7, b_slider_8, b_slider_9, b_slider_10, b_slider_11, b_slider_12,
-        b_slider_13, b_slider_14, b_slider_15, b_slider_16, b_slider_17, b_slider_18,
-        b_slider_19, b_slider_20, b_slider_21, beck_summary) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
-
-        bind_values: List[Union[str, int]] = [
-            beck_date, beck_time, b_slider, b_slider_2, b_slider_3, b_slider_4, b_slider_5, b_slider_6,
-            b_slider_7, b_slider_8, b_slider_9, b_slider_10, b_slider_11, b_slider_12,
-            b_slider_13, b_slider_14, b_slider_15, b_slider_16, b_slider_17, b_slider_18,
-            b_slider_19, b_slider_20, b_slider_21, beck_summary
-        ]
-        try:
-            self.query.prepare(sql)
-            for value in bind_values:
-                self.query.addBindValue(value)
-            if sql.count('?') != len(bind_values):
-                raise ValueError(f"""Mismatch: beck_table_aug_8 Expected {sql.count('?')}
-                    bind values, got {len(bind_values)}.""")
-            if not self.query.exec():
-                logger.error(
-                    f"Error inserting data: beck_table_aug_8 - {self.query.lastError().text()}")
-        except ValueError as e:
-            logger.error(f"ValueError beck_table_aug_8: {e}")
-        except Exception as e:
-            logger.error(f"Error during data insertion: beck_table_aug_8 {e}", exc_info=True)
+        if bind_values:
+            query = self.statements.prepare(sql, bind_values)
+            executed = timed_exec(query, self.db)
+        else:
+            query = QSqlQuery(self.db)
+            query.setForwardOnly(True)
+            executed = timed_exec(query, self.db, sql)
+        if not executed:
+            raise RuntimeError(query.lastError().text())
+        return query
+
+    def execute(self, sql: str, bind_values: Sequence[Any] = ()) -> int:
+        query = self._run(sql, bind_values)
+        affected = query.numRowsAffected()
+        query.finish()
+        return affected
+
+    def execute_batch(self, sql: str, rows: Sequence[Sequence[Any]]) -> int:
+        query = self.statements.prepare(sql)
+        for index, column_values in enumerate(zip(*rows)):
+            query.bindValue(index, list(column_values))
+        if not timed_exec(query, self.db, batch=True):
+            raise RuntimeError(query.lastError().text())
+        return int(query.lastInsertId())
+
+    def fetch_all(self, sql: str, bind_values: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        query = self._run(sql, bind_values)
+        record = query.record()
+        columns = [record.fieldName(i) for i in range(record.count())]
+        rows: List[Dict[str, Any]] = []
+        while query.next():
+            rows.append({column: None if query.isNull(i) else query.value(i)
+                         for i, column in enumerate(columns)})
+        query.finish()
+        return rows
+
+    def stream(self,
+               sql: str,
+               bind_values: Sequence[Any] = (),
+               batch_size: int = tkc.EXPORT_BATCH_ROWS) -> Tuple[List[str], Iterator[Tuple[Any, ...]]]:
+        # Not cached: the query stays open while the caller iterates, and a cached query
+        # would be finished by the next prepare of the same SQL. QSQLITE steps the forward-only
+        # statement one row at a time, so batch_size has nothing to tune here.
+        query = QSqlQuery(self.db)
+        query.setForwardOnly(True)
+        if not query.prepare(sql):
+            raise RuntimeError(query.lastError().text())
+        for index, value in enumerate(bind_values):
+            query.bindValue(index, value)
+        if not timed_exec(query, self.db):
+            raise RuntimeError(query.lastError().text())
+        record = query.record()
+        columns = [record.fieldName(i) for i in range(record.count())]
+
+        def rows() -> Iterator[Tuple[Any, ...]]:
+            try:
+                while query.next():
+                    yield tuple(None if query.isNull(i) else query.value(i)
+                                for i in range(len(columns)))
+                if query.lastError().isValid():
+                    raise RuntimeError(query.lastError().text())
+            finally:
+                query.finish()
+
+        return columns, rows()
+
+    def begin(self) -> None:
+        if not self.db.transaction():
+            raise RuntimeError(self.db.lastError().text())
+
+    def commit(self) -> None:
+        if not timed_commit(self.db):
+            raise RuntimeError(self.db.lastError().text())
+
+    def rollback(self) -> None:
+        self.db.rollback()
+
+    def has_column(self, table: str, column: str) -> bool:
+        return self.db.record(table).indexOf(column) != -1
+
+    def close(self) -> None:
+        """
+        Drops the cached prepared queries and closes the database connection if it is open.
+        """
+        self.statements.clear()
+        if self.db.isOpen():
+            logger.info("the database is closed successfully")
+            self.db.close()
 
 
 def close_database(self) -> None:
     """
     Closes the database connection if it is open.
 
-    This method checks if the database connection is open and closes it if it is.
+    This method drops the cached prepared queries, then checks if the database connection
+    is open and closes it if it is.
     If the connection is already closed or an error occurs while closing the
     connection, an exception is logged.
 
@@ -199,8 +231,6 @@ def close_database(self) -> None:
     """
     try:
         logger.info("if database is open")
-        if self.db.isOpen():
-            logger.info("the database is closed successfully")
-            self.db.close()
+        self.close()
     except Exception as e:
-        logger.exception(f"Error closing database: {e}")
+        logger.exception("Error closing database: %s", e)
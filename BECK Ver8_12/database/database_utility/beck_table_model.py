@@ -0,0 +1,941 @@
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer
+from PyQt6.QtGui import QColor, QFont
+from PyQt6.QtSql import QSqlDatabase, QSqlError, QSqlQuery
+
+import tracker_config as tkc
+from database.beck_columns import BECK_ITEM_COLUMNS
+from database.packed_items import ITEM_MASK
+from database.query_log import timed_commit, timed_exec
+from database.scoring import score_items
+from logger_setup import get_logger
+
+logger = get_logger(__name__)
+
+ID_COLUMN = 'id'
+SUMMARY_COLUMN = 'beck_summary'
+# Columns that break ties after the sort column, in order; together they make every key unique.
+TIE_BREAK_COLUMNS = ('beck_date', 'beck_time', ID_COLUMN)
+
+
+def _value_key(value: Any) -> Tuple:
+    """
+    Builds a comparison key that orders values the way SQLite's ORDER BY does.
+
+    NULLs sort first, then numbers, then text, so Python comparisons never mix types.
+
+    Args:
+        value (Any): A column value as returned by QSqlQuery.value.
+
+    Returns:
+        Tuple: The sortable key.
+    """
+    if value is None:
+        return (0,)
+    if isinstance(value, (int, float)):
+        return (1, value)
+    return (2, value)
+
+
+# A condition as SQL text and its bind values; '1' and '0' are always true and always false.
+_Condition = Tuple[str, List[Any]]
+_TRUE: _Condition = ('1', [])
+_FALSE: _Condition = ('0', [])
+
+
+def _either(left: _Condition, right: _Condition) -> _Condition:
+    if left[0] == '1' or right[0] == '1':
+        return _TRUE
+    if left[0] == '0':
+        return right
+    if right[0] == '0':
+        return left
+    return f"({left[0]} OR {right[0]})", left[1] + right[1]
+
+
+def _both(left: _Condition, right: _Condition) -> _Condition:
+    if left[0] == '0' or right[0] == '0':
+        return _FALSE
+    if left[0] == '1':
+        return right
+    if right[0] == '1':
+        return left
+    return f"{left[0]} AND {right[0]}", left[1] + right[1]
+
+
+def _contiguous_ranges(rows: List[int]) -> List[Tuple[int, int]]:
+    """
+    Groups sorted, distinct row numbers into (first, last) runs of consecutive rows.
+    """
+    ranges: List[Tuple[int, int]] = []
+    for row in rows:
+        if ranges and ranges[-1][1] == row - 1:
+            ranges[-1] = (ranges[-1][0], row)
+        else:
+            ranges.append((row, row))
+    return ranges
+
+
+class _Page:
+    """
+    A run of consecutive rows, identified by the key of its first row and its row count.
+
+    The rows themselves are dropped when the page is evicted and re-read by key range when
+    it is next needed.
+    """
+    __slots__ = ('start_key', 'count', 'rows', 'last_used', 'pinned')
+
+    def __init__(self, start_key: Tuple, rows: List[List[Any]]) -> None:
+        self.start_key: Tuple = start_key
+        self.count: int = len(rows)
+        self.rows: Optional[List[List[Any]]] = rows
+        self.last_used: int = 0
+        # The number of changes and pending edits holding the page in memory.
+        self.pinned: int = 0
+
+
+class BeckTableModel(QAbstractTableModel):
+    """
+    A lazily paged table model over an assessment table.
+
+    Rows are read a page at a time with keyset pagination, ordered by the sort column and
+    then by (beck_date, beck_time, id), and more pages are fetched as the view scrolls through
+    canFetchMore/fetchMore. Only tkc.TABLE_MAX_LOADED_PAGES pages of rows are held at once;
+    the least recently used pages are evicted and transparently re-read by key range.
+
+    Newly written rows are inserted at their sorted position with beginInsertRows/
+    endInsertRows instead of re-reading the table, which only happens when the sort order
+    changes or a written row does not match the loaded schema. Row removals are written
+    through to the database immediately. Edits are too, unless the model buffers them: then
+    edited cells are held in memory and shown as pending until flush() writes them all in one
+    transaction, which happens on its own once no edit was made for flush_interval_ms, or
+    until discard() drops them. NULL keys sort before every value, as in SQLite, and are
+    paged like any other; see _read_rows.
+
+    Attributes:
+        table_name (str): The table the model reads from.
+    """
+
+    def __init__(self,
+                 table_name: str,
+                 db: Optional[QSqlDatabase] = None,
+                 page_size: int = tkc.TABLE_PAGE_SIZE,
+                 max_loaded_pages: int = tkc.TABLE_MAX_LOADED_PAGES,
+                 flush_interval_ms: Optional[int] = None,
+                 parent=None) -> None:
+        """
+        Initializes the model without reading any rows; call select() to load them.
+
+        Args:
+            table_name (str): The table to read; it must have an 'id' primary key.
+            db (Optional[QSqlDatabase]): The connection to use. Defaults to the default connection.
+            page_size (int): The number of rows read per fetch.
+            max_loaded_pages (int): The number of pages whose rows are kept in memory.
+            flush_interval_ms (Optional[int]): Buffer edits and flush them after this many
+                milliseconds without a further edit. None writes every edit through at once.
+            parent: The optional QObject parent.
+        """
+        super().__init__(parent)
+        self.table_name: str = table_name
+        self._db: QSqlDatabase = db if db is not None else QSqlDatabase.database()
+        self._page_size: int = page_size
+        # Up to two pages are pinned during a change, so one more must always fit. Pages
+        # holding pending edits stay loaded on top of that until the edits are flushed.
+        self._max_loaded_pages: int = max(3, max_loaded_pages)
+        self._columns: List[str] = []
+        self._key_indices: List[int] = []
+        # Where the item scores are, for the summary column's tooltip; empty if not every
+        # item column is in the table.
+        self._item_indices: List[int] = []
+        self._summary_index: int = -1
+        self._pages: List[_Page] = []
+        self._offsets: List[int] = []
+        self._row_count: int = 0
+        self._cursor: Optional[Tuple] = None
+        self._at_end: bool = False
+        self._tick: int = 0
+        self._sort_column: int = 0
+        self._sort_order: Qt.SortOrder = Qt.SortOrder.AscendingOrder
+        self._last_error: QSqlError = QSqlError()
+        # Buffered edits: row id -> {column index: value}, and the page holding each row.
+        self._pending: Dict[Any, Dict[int, Any]] = {}
+        self._pending_pages: Dict[Any, _Page] = {}
+        self._pending_font: QFont = QFont()
+        self._pending_font.setItalic(True)
+        self._pending_color: QColor = QColor(tkc.PENDING_EDIT_COLOR)
+        self._flush_timer: Optional[QTimer] = None
+        if flush_interval_ms is not None:
+            self._flush_timer = QTimer(self)
+            self._flush_timer.setSingleShot(True)
+            self._flush_timer.setInterval(flush_interval_ms)
+            self._flush_timer.timeout.connect(self.flush)
+
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    # LOADING
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    def select(self) -> bool:
+        """
+        Re-reads the schema, discards every page and fetches the first page in the current order.
+
+        Pending edits are flushed first; if that fails they are kept and nothing is re-read.
+
+        Returns:
+            bool: True if the table was read successfully, otherwise False.
+        """
+        if self._pending and not self.flush():
+            return False
+        record = self._db.record(self.table_name)
+        columns = [record.fieldName(i) for i in range(record.count())]
+        if ID_COLUMN not in columns:
+            self._last_error = QSqlError(f"Table {self.table_name} has no '{ID_COLUMN}' column")
+            return False
+        self._sort_column = min(self._sort_column, len(columns) - 1)
+        key_columns = [columns[self._sort_column]] + [
+            column for column in TIE_BREAK_COLUMNS
+            if column in columns and column != columns[self._sort_column]]
+
+        self.beginResetModel()
+        self._columns = columns
+        self._key_indices = [columns.index(column) for column in key_columns]
+        has_scores = SUMMARY_COLUMN in columns and all(column in columns for column in BECK_ITEM_COLUMNS)
+        self._item_indices = [columns.index(column) for column in BECK_ITEM_COLUMNS] if has_scores else []
+        self._summary_index = columns.index(SUMMARY_COLUMN) if has_scores else -1
+        self._pages = []
+        self._cursor = None
+        self._at_end = False
+        self._rebuild_offsets()
+        rows = self._read_rows(None, None)
+        if rows is not None:
+            self._append_page(rows)
+        self.endResetModel()
+        if rows is None:
+            return False
+        self._last_error = QSqlError()
+        return True
+
+    def lastError(self) -> QSqlError:
+        """
+        Returns the error of the last failed database operation.
+
+        Returns:
+            QSqlError: The last error, or an invalid QSqlError if the last operation succeeded.
+        """
+        return self._last_error
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        """
+        Re-reads the table in the new order, unless that order is already loaded.
+
+        Args:
+            column (int): The column to sort on.
+            order (Qt.SortOrder): The sort direction.
+        """
+        if column == self._sort_column and order == self._sort_order and self._columns:
+            return
+        self._sort_column = column
+        self._sort_order = order
+        if self._columns and not self.select():
+            logger.error("Error sorting %s: %s", self.table_name, self._last_error.text())
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and bool(self._columns) and not self._at_end
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        """
+        Reads the page that follows the last fetched row and appends it to the model.
+
+        Args:
+            parent (QModelIndex): Unused; the model is flat.
+        """
+        if not self.canFetchMore(parent):
+            return
+        rows = self._read_rows(self._cursor, None)
+        if rows is None:
+            logger.error("Error fetching rows from %s: %s", self.table_name, self._last_error.text())
+            self._at_end = True
+            return
+        if rows:
+            self.beginInsertRows(QModelIndex(), self._row_count, self._row_count + len(rows) - 1)
+            self._append_page(rows)
+            self.endInsertRows()
+            self._evict()
+        else:
+            self._at_end = True
+
+    def _append_page(self, rows: List[List[Any]]) -> None:
+        """
+        Appends freshly fetched rows as a new page and advances the cursor.
+
+        Args:
+            rows (List[List[Any]]): The rows of the page, in order.
+        """
+        if len(rows) < self._page_size:
+            self._at_end = True
+        if not rows:
+            return
+        page = _Page(self._key_of(rows[0]), rows)
+        page.last_used = self._next_tick()
+        self._pages.append(page)
+        self._cursor = self._key_of(rows[-1])
+        self._rebuild_offsets()
+
+    def _read_rows(self, after: Optional[Tuple], until: Optional[Tuple],
+                   start: Optional[Tuple] = None, until_inclusive: bool = True) -> Optional[List[List[Any]]]:
+        """
+        Runs the keyset queries for a range of rows in the current order.
+
+        With only `after` the next page_size rows past that key are read; with `start` and
+        `until` every row between the two keys is read.
+
+        SQLite sorts NULLs before every value, but a row-value comparison such as
+        (a, b) > (?, ?) is never true where it compares a NULL, so each key is compared column
+        by column with IS NULL tests; see _seek. The rows whose sort column is NULL and the
+        rest are read by separate queries, in the order they sort, so each can still seek on
+        an index of the sort column.
+
+        Args:
+            after (Optional[Tuple]): Read rows strictly past this key.
+            until (Optional[Tuple]): Read rows up to this key.
+            start (Optional[Tuple]): Read rows from this key inclusive.
+            until_inclusive (bool): Whether the row at `until` is included.
+
+        Returns:
+            Optional[List[List[Any]]]: The rows read, or None if a query failed.
+        """
+        descending = self._sort_order == Qt.SortOrder.DescendingOrder
+        direction = 'DESC' if descending else 'ASC'
+        key_columns = self._quoted_key_columns()
+        order_by = ', '.join(f'{column} {direction}' for column in key_columns)
+        # (key, whether rows past it are greater, whether the key itself is included)
+        bounds = [(key, greater, inclusive) for key, greater, inclusive in (
+            (after, not descending, False), (start, not descending, True), (until, descending, until_inclusive))
+            if key is not None]
+        if self._columns[self._key_indices[0]] == ID_COLUMN:
+            parts = (False,)
+        else:
+            parts = (True, False) if not descending else (False, True)
+
+        rows: List[List[Any]] = []
+        for null_part in parts:
+            condition: _Condition = (f"{key_columns[0]} IS {'' if null_part else 'NOT '}NULL", [])
+            for key, greater, inclusive in bounds:
+                condition = _both(condition, self._seek(key, greater, inclusive, null_part))
+            if condition == _FALSE:
+                continue
+            sql = f"SELECT * FROM {self.table_name} WHERE {condition[0]} ORDER BY {order_by}"
+            if until is None:
+                sql += f" LIMIT {self._page_size - len(rows)}"
+
+            query = QSqlQuery(self._db)
+            query.setForwardOnly(True)
+            query.prepare(sql)
+            for value in condition[1]:
+                query.addBindValue(value)
+            if not timed_exec(query, self._db):
+                self._last_error = query.lastError()
+                return None
+            while query.next():
+                rows.append([None if query.isNull(i) else query.value(i)
+                             for i in range(len(self._columns))])
+            if until is None and len(rows) >= self._page_size:
+                break
+        return rows
+
+    def _seek(self, key: Tuple, greater: bool, inclusive: bool, null_part: bool) -> _Condition:
+        """
+        Builds the condition for the rows past a key, with NULLs lower than every value.
+
+        The key is compared column by column: past it means past it in the first column, or
+        equal there and past it in the rest. Where the sort column is not NULL and the key's
+        is not either, a range on the sort column alone comes first for SQLite to seek on.
+
+        Args:
+            key (Tuple): The key, in _key_indices order.
+            greater (bool): Whether past means greater, rather than lower.
+            inclusive (bool): Whether the row at the key itself is included.
+            null_part (bool): Whether only rows whose sort column is NULL are read.
+
+        Returns:
+            _Condition: The condition and its bind values.
+        """
+        key_columns = self._quoted_key_columns()
+        condition = _TRUE if inclusive else _FALSE
+        for position in reversed(range(len(key))):
+            column, value = key_columns[position], key[position]
+            if value is None:
+                past = (f"{column} IS NOT NULL", []) if greater else _FALSE
+                same = (f"{column} IS NULL", [])
+            else:
+                past = (f"{column} > ?", [value]) if greater else (f"({column} < ? OR {column} IS NULL)", [value])
+                same = (f"{column} = ?", [value])
+            if position == 0:
+                # Only the NULL or only the other rows of the sort column are read.
+                if null_part:
+                    past = _TRUE if value is not None and not greater else _FALSE
+                    same = _TRUE if value is None else _FALSE
+                elif value is None:
+                    past = _TRUE if greater else _FALSE
+                    same = _FALSE
+                else:
+                    past = (f"{column} {'>' if greater else '<'} ?", [value])
+            condition = _either(past, _both(same, condition))
+        if not null_part and key[0] is not None:
+            condition = _both((f"{key_columns[0]} {'>=' if greater else '<='} ?", [key[0]]), condition)
+        return condition
+
+    def _read_row(self, row_id: Any) -> Optional[List[Any]]:
+        """
+        Reads one row by id.
+
+        Args:
+            row_id (Any): The id of the row.
+
+        Returns:
+            Optional[List[Any]]: The row in column order, or None if it could not be read.
+        """
+        query = QSqlQuery(self._db)
+        query.setForwardOnly(True)
+        query.prepare(f'SELECT * FROM {self.table_name} WHERE "{ID_COLUMN}" = ?')
+        query.addBindValue(row_id)
+        if not timed_exec(query, self._db) or not query.next():
+            logger.error("Error re-reading row %s of %s: %s", row_id, self.table_name, query.lastError().text())
+            return None
+        return [None if query.isNull(i) else query.value(i) for i in range(len(self._columns))]
+
+    def _quoted_key_columns(self) -> List[str]:
+        return [f'"{self._columns[i]}"' for i in self._key_indices]
+
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    # PAGE CACHE
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    def _next_tick(self) -> int:
+        self._tick += 1
+        return self._tick
+
+    def _rebuild_offsets(self) -> None:
+        """
+        Recomputes the first row number of every page after pages change size.
+        """
+        self._offsets = []
+        total = 0
+        for page in self._pages:
+            self._offsets.append(total)
+            total += page.count
+        self._row_count = total
+
+    def _page_index(self, row: int) -> int:
+        return bisect_right(self._offsets, row) - 1
+
+    def _page_rows(self, page_index: int, exclude_id: Any = None) -> List[List[Any]]:
+        """
+        Returns the rows of a page, re-reading them if the page was evicted.
+
+        Args:
+            page_index (int): The page to return.
+            exclude_id (Any): The id of a row already written to the table but not yet added
+                to the model, which must not be counted as part of the page.
+
+        Returns:
+            List[List[Any]]: The rows of the page.
+        """
+        page = self._pages[page_index]
+        page.last_used = self._next_tick()
+        if page.rows is not None:
+            return page.rows
+
+        if page_index + 1 < len(self._pages):
+            rows = self._read_rows(None, self._pages[page_index + 1].start_key,
+                                   start=page.start_key, until_inclusive=False)
+        else:
+            rows = self._read_rows(None, self._cursor, start=page.start_key)
+        if rows is None:
+            logger.error("Error reloading rows from %s: %s", self.table_name, self._last_error.text())
+            rows = []
+        if exclude_id is not None:
+            id_index = self._columns.index(ID_COLUMN)
+            rows = [row for row in rows if row[id_index] != exclude_id]
+        if len(rows) != page.count:
+            # The table was changed behind the model's back; keep row numbers stable for now
+            # and re-read everything once control returns to the event loop.
+            logger.warning("%s changed outside the model; reloading", self.table_name)
+            rows = (rows + [[None] * len(self._columns) for _ in range(page.count)])[:page.count]
+            QTimer.singleShot(0, self.select)
+        page.rows = rows
+        self._evict()
+        return rows
+
+    def _evict(self) -> None:
+        """
+        Drops the rows of the least recently used pages beyond max_loaded_pages.
+        """
+        loaded = [page for page in self._pages if page.rows is not None]
+        excess = len(loaded) - self._max_loaded_pages
+        if excess <= 0:
+            return
+        candidates = sorted((page for page in loaded if not page.pinned), key=lambda p: p.last_used)
+        for page in candidates[:excess]:
+            page.rows = None
+
+    def _pin(self, *rows: int) -> List[_Page]:
+        """
+        Loads and pins the pages holding rows so they cannot be evicted or re-read mid-change.
+
+        Args:
+            *rows (int): The rows whose pages to pin.
+
+        Returns:
+            List[_Page]: The pinned pages, to be passed to _unpin.
+        """
+        pages: List[_Page] = []
+        for row in rows:
+            page_index = self._page_index(row)
+            self._page_rows(page_index)
+            page = self._pages[page_index]
+            page.pinned += 1
+            pages.append(page)
+        return pages
+
+    @staticmethod
+    def _unpin(pages: List[_Page]) -> None:
+        for page in pages:
+            page.pinned -= 1
+
+    def _row(self, row: int) -> List[Any]:
+        page_index = self._page_index(row)
+        return self._page_rows(page_index)[row - self._offsets[page_index]]
+
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    # KEYS
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    def _key_of(self, row: List[Any]) -> Tuple:
+        return tuple(row[i] for i in self._key_indices)
+
+    def _before(self, key: Tuple, other: Tuple) -> bool:
+        """
+        Returns whether key sorts strictly before other in the current order.
+        """
+        ordered = tuple(_value_key(value) for value in key)
+        ordered_other = tuple(_value_key(value) for value in other)
+        if self._sort_order == Qt.SortOrder.DescendingOrder:
+            return ordered > ordered_other
+        return ordered < ordered_other
+
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    # INCREMENTAL UPDATES
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    def insert_record(self, record: Mapping[str, Any]) -> None:
+        """
+        Inserts a row that was already written to the table at its sorted position.
+
+        Rows that sort past the last fetched row are left for fetchMore. Falls back to a full
+        select() if the record's columns differ from the loaded schema.
+
+        Args:
+            record (Mapping[str, Any]): The written row keyed by column name, including 'id'.
+        """
+        if set(record) != set(self._columns):
+            self.select()
+            return
+        self._insert_row([record[column] for column in self._columns])
+
+    def _insert_row(self, row: List[Any]) -> None:
+        """
+        Inserts a row at its sorted position, loading the page it belongs to.
+
+        Args:
+            row (List[Any]): The row in column order.
+        """
+        key = self._key_of(row)
+        if not self._pages:
+            if self._at_end:
+                self.beginInsertRows(QModelIndex(), 0, 0)
+                self._append_page([row])
+                self.endInsertRows()
+            return
+        if not self._before(key, self._cursor):
+            if not self._at_end:
+                return
+            self._cursor = key
+
+        page_index = 0
+        for index in range(len(self._pages) - 1, 0, -1):
+            if not self._before(key, self._pages[index].start_key):
+                page_index = index
+                break
+        page = self._pages[page_index]
+        rows = self._page_rows(page_index, exclude_id=row[self._columns.index(ID_COLUMN)])
+
+        low, high = 0, len(rows)
+        while low < high:
+            middle = (low + high) // 2
+            if self._before(self._key_of(rows[middle]), key):
+                low = middle + 1
+            else:
+                high = middle
+        position = self._offsets[page_index] + low
+        self.beginInsertRows(QModelIndex(), position, position)
+        rows.insert(low, row)
+        page.count += 1
+        if low == 0:
+            page.start_key = key
+        self._rebuild_offsets()
+        self.endInsertRows()
+
+    def delete_rows(self, rows: Iterable[int]) -> int:
+        """
+        Deletes any set of rows with set-based DELETEs in a single transaction.
+
+        The ids of the rows are bound in chunks of tkc.DELETE_CHUNK_SIZE per
+        `DELETE ... WHERE id IN (...)`, and the rows are then dropped from the model one
+        contiguous range at a time, without re-reading the table.
+
+        Args:
+            rows (Iterable[int]): The rows to delete, in any order; duplicates and rows outside
+                the model are ignored.
+
+        Returns:
+            int: The number of rows deleted.
+
+        Raises:
+            RuntimeError: If the delete fails; the transaction is rolled back and the model is
+            left unchanged.
+        """
+        ranges = _contiguous_ranges(sorted({row for row in rows if 0 <= row < self._row_count}))
+        if not ranges:
+            return 0
+        id_index = self._columns.index(ID_COLUMN)
+        ids = [self._row(row)[id_index] for first, last in ranges for row in range(first, last + 1)]
+
+        if not self._db.transaction():
+            self._last_error = self._db.lastError()
+            error_message = f"Error starting delete transaction: {self._last_error.text()}"
+            logger.error(error_message)
+            raise RuntimeError(error_message)
+        query = QSqlQuery(self._db)
+        prepared_size = 0
+        for start in range(0, len(ids), tkc.DELETE_CHUNK_SIZE):
+            chunk = ids[start:start + tkc.DELETE_CHUNK_SIZE]
+            if len(chunk) != prepared_size:
+                query.prepare(f'DELETE FROM {self.table_name} WHERE "{ID_COLUMN}" IN '
+                              f'({", ".join("?" * len(chunk))})')
+                prepared_size = len(chunk)
+            for row_id in chunk:
+                query.addBindValue(row_id)
+            if not timed_exec(query, self._db):
+                self._last_error = query.lastError()
+                self._db.rollback()
+                error_message = f"Error deleting from {self.table_name}: {self._last_error.text()}"
+                logger.error(error_message)
+                raise RuntimeError(error_message)
+        if not timed_commit(self._db):
+            self._last_error = self._db.lastError()
+            self._db.rollback()
+            error_message = f"Error committing delete from {self.table_name}: {self._last_error.text()}"
+            logger.error(error_message)
+            raise RuntimeError(error_message)
+
+        self._drop_pending(ids)
+        for first, last in reversed(ranges):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            self._remove_range(first, last)
+            self.endRemoveRows()
+        return len(ids)
+
+    def _remove_range(self, first: int, last: int) -> None:
+        """
+        Drops rows first..last, already deleted from the table, from the pages; the caller
+        brackets this with begin/endRemoveRows.
+
+        Evicted pages only have their row count reduced: their key range no longer matches the
+        deleted rows, so re-reading it later yields exactly the remaining ones.
+
+        Args:
+            first (int): The first row to drop.
+            last (int): The last row to drop, inclusive.
+        """
+        first_page, last_page = self._page_index(first), self._page_index(last)
+        for page_index in range(last_page, first_page - 1, -1):
+            page = self._pages[page_index]
+            start = self._offsets[page_index]
+            low = max(first, start) - start
+            high = min(last, start + page.count - 1) - start + 1
+            if low == 0 and high == page.count:
+                del self._pages[page_index]
+                continue
+            page.count -= high - low
+            if page.rows is not None:
+                del page.rows[low:high]
+                if low == 0:
+                    page.start_key = self._key_of(page.rows[0])
+        self._rebuild_offsets()
+
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    # QAbstractTableModel
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row = self._row(index.row())
+        pending = self._pending.get(row[self._columns.index(ID_COLUMN)]) if self._pending else None
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return self._score_tooltip(row, pending or {}) if index.column() == self._summary_index else None
+        if pending is not None and index.column() in pending:
+            if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+                return pending[index.column()]
+            # The table's style sheet paints item backgrounds, so pending cells are marked
+            # with the font and text colour instead.
+            if role == Qt.ItemDataRole.FontRole:
+                return self._pending_font
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return self._pending_color
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return row[index.column()]
+        return None
+
+    def _score_tooltip(self, row: List[Any], pending: Mapping[int, Any]) -> str:
+        """
+        Describes a row's severity band and subscales, scored with any pending edits applied.
+        """
+        items = []
+        for column in self._item_indices:
+            value = pending.get(column, row[column])
+            try:
+                items.append(int(value))
+            except (TypeError, ValueError):
+                items.append(ITEM_MASK + 1)  # scored as out of range
+        score = score_items(items)
+        if score.total < 0:
+            return "Unscored: an item is blank or outside 0-3"
+        return (f"{score.total} ({score.severity}): cognitive-affective {score.cognitive_affective}, "
+                f"somatic {score.somatic}")
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._columns[section] if 0 <= section < len(self._columns) else None
+        return section + 1
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        flags = super().flags(index)
+        if index.isValid() and self._columns[index.column()] != ID_COLUMN:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        """
+        Writes an edited cell to the database and updates the loaded row, or buffers the edit
+        when the model was created with a flush interval.
+
+        Editing a key column moves the row to its new sorted position once the edit is written.
+
+        Args:
+            index (QModelIndex): The edited cell.
+            value (Any): The new value.
+            role (int): The edit role.
+
+        Returns:
+            bool: True if the value was written or buffered, otherwise False.
+        """
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        if self._flush_timer is not None:
+            self._buffer_edit(index, value)
+            return True
+        pinned = self._pin(index.row())
+        try:
+            row = self._row(index.row())
+            column = self._columns[index.column()]
+            query = QSqlQuery(self._db)
+            query.prepare(f'UPDATE {self.table_name} SET "{column}" = ? WHERE "{ID_COLUMN}" = ?')
+            query.addBindValue(value)
+            query.addBindValue(row[self._columns.index(ID_COLUMN)])
+            if not timed_exec(query, self._db):
+                self._last_error = query.lastError()
+                logger.error("Error updating %s.%s: %s", self.table_name, column, self._last_error.text())
+                return False
+            written = list(row)
+            written[index.column()] = value
+        finally:
+            self._unpin(pinned)
+        self._refresh_row(index.row(), written)
+        return True
+
+    def _refresh_row(self, position: int, written: List[Any]) -> None:
+        """
+        Updates a row that was just written, moving it if its sort key changed.
+
+        Args:
+            position (int): The row's position in the model.
+            written (List[Any]): The row as written, used if it cannot be re-read.
+        """
+        pinned = self._pin(position)
+        try:
+            row = self._row(position)
+            # Re-read the row, since triggers derive other columns (beck_ts) from the edit.
+            edited = self._read_row(row[self._columns.index(ID_COLUMN)])
+            if edited is None:
+                edited = written
+            if self._key_of(edited) == self._key_of(row):
+                row[:] = edited
+                self.dataChanged.emit(self.index(position, 0),
+                                      self.index(position, len(self._columns) - 1), [])
+                return
+            self.beginRemoveRows(QModelIndex(), position, position)
+            self._remove_range(position, position)
+            self.endRemoveRows()
+        finally:
+            self._unpin(pinned)
+        self._insert_row(edited)
+
+    def removeRows(self, row: int, count: int, parent: QModelIndex = QModelIndex()) -> bool:
+        """
+        Deletes count rows starting at row from the database and the model.
+
+        Args:
+            row (int): The first row to remove.
+            count (int): The number of rows to remove.
+            parent (QModelIndex): Unused; the model is flat.
+
+        Returns:
+            bool: True if the rows were deleted, otherwise False.
+        """
+        if parent.isValid() or row < 0 or count < 1 or row + count > self._row_count:
+            return False
+        try:
+            self.delete_rows(range(row, row + count))
+        except RuntimeError:
+            return False
+        return True
+
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    # BUFFERED EDITS
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    def _buffer_edit(self, index: QModelIndex, value: Any) -> None:
+        """
+        Holds an edit in memory, keeping its page loaded, and restarts the idle flush timer.
+
+        Args:
+            index (QModelIndex): The edited cell.
+            value (Any): The new value.
+        """
+        pinned = self._pin(index.row())
+        row_id = self._row(index.row())[self._columns.index(ID_COLUMN)]
+        if row_id in self._pending_pages:
+            self._unpin(pinned)
+        else:
+            self._pending_pages[row_id] = pinned[0]
+        self._pending.setdefault(row_id, {})[index.column()] = value
+        self.dataChanged.emit(index, index, [])
+        self._flush_timer.start()
+
+    def has_pending_edits(self) -> bool:
+        """
+        Returns whether buffered edits are waiting to be flushed.
+        """
+        return bool(self._pending)
+
+    def flush(self) -> bool:
+        """
+        Writes every buffered edit in one transaction and updates the edited rows.
+
+        Returns:
+            bool: True if the edits were written or none were pending. False if the transaction
+            failed; the edits are then kept, to be flushed again or discarded.
+        """
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+        if not self._pending:
+            return True
+        if not self._db.transaction():
+            self._last_error = self._db.lastError()
+            logger.error("Error starting edit transaction: %s", self._last_error.text())
+            return False
+        query = QSqlQuery(self._db)
+        for row_id, cells in self._pending.items():
+            assignments = ', '.join(f'"{self._columns[column]}" = ?' for column in cells)
+            query.prepare(f'UPDATE {self.table_name} SET {assignments} WHERE "{ID_COLUMN}" = ?')
+            for value in cells.values():
+                query.addBindValue(value)
+            query.addBindValue(row_id)
+            if not timed_exec(query, self._db):
+                self._last_error = query.lastError()
+                self._db.rollback()
+                logger.error("Error flushing edits to %s: %s", self.table_name, self._last_error.text())
+                return False
+        if not timed_commit(self._db):
+            self._last_error = self._db.lastError()
+            self._db.rollback()
+            logger.error("Error committing edits to %s: %s", self.table_name, self._last_error.text())
+            return False
+
+        pending, pages = self._pending, self._pending_pages
+        self._pending, self._pending_pages = {}, {}
+        for row_id, cells in pending.items():
+            page = pages[row_id]
+            position = self._position_of(row_id, page)
+            page.pinned -= 1
+            if position is None:
+                continue
+            written = list(self._row(position))
+            for column, value in cells.items():
+                written[column] = value
+            self._refresh_row(position, written)
+        return True
+
+    def discard(self) -> None:
+        """
+        Drops every buffered edit, showing the stored values again.
+        """
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+        pending, pages = self._pending, self._pending_pages
+        self._pending, self._pending_pages = {}, {}
+        for row_id, cells in pending.items():
+            page = pages[row_id]
+            position = self._position_of(row_id, page)
+            page.pinned -= 1
+            if position is not None:
+                self.dataChanged.emit(self.index(position, min(cells)),
+                                      self.index(position, max(cells)), [])
+
+    def _drop_pending(self, row_ids: Iterable[Any]) -> None:
+        """
+        Forgets the buffered edits of rows that no longer exist.
+        """
+        for row_id in row_ids:
+            if row_id in self._pending:
+                del self._pending[row_id]
+                self._pending_pages.pop(row_id).pinned -= 1
+
+    def _position_of(self, row_id: Any, page: _Page) -> Optional[int]:
+        """
+        Finds the position of a row in a loaded page.
+
+        Args:
+            row_id (Any): The id of the row.
+            page (_Page): The page holding the row.
+
+        Returns:
+            Optional[int]: The row's position in the model, or None if the page or row is gone.
+        """
+        for page_index, candidate in enumerate(self._pages):
+            if candidate is page:
+                break
+        else:
+            return None
+        id_index = self._columns.index(ID_COLUMN)
+        for offset, row in enumerate(page.rows):
+            if row[id_index] == row_id:
+                return self._offsets[page_index] + offset
+        return None
@@ -1,5 +1,7 @@
 from PyQt6.QtWidgets import QTableView, QMainWindow
-from logger_setup import logger
+from logger_setup import get_logger
+
+logger = get_logger(__name__)
 
 
 def delete_selected_rows(main_window_instance: QMainWindow, table_view_widget_name: str,
@@ -25,17 +27,18 @@ def delete_selected_rows(main_window_instance: QMainWindow, table_view_widget_na
         model = getattr(main_window_instance, model_name)  # The model's specific type could vary
         
         if table_view is not None:
-            # Get indices of selected rows, sorted in reverse order for deletion
-            selected_rows = table_view.selectionModel().selectedRows()
-            rows_to_delete = sorted([index.row() for index in selected_rows], reverse=True)
-            
-            # Delete each selected row from the model
-            for row in rows_to_delete:
-                model.removeRow(row)
+            # Collect the selected rows from the selection's ranges; selectedRows() would
+            # query the flags of every selected cell
+            selection_model = table_view.selectionModel()
+            rows_to_delete = set()
+            for selection_range in selection_model.selection():
+                rows_to_delete.update(range(selection_range.top(), selection_range.bottom() + 1))
             
-            # Submit changes and refresh the model
-            model.submitAll()
-            model.select()
+            # Clear the selection first so removing each range doesn't have to update it, then
+            # let the model delete the rows with chunked DELETE ... WHERE id IN statements in
+            # one transaction and drop them in contiguous ranges
+            selection_model.clearSelection()
+            model.delete_rows(rows_to_delete)
     
     except Exception as e:
-        logger.error(f"An error occurred while deleting records: {str(e)}")
+        logger.error("An error occurred while deleting records: %s", str(e))
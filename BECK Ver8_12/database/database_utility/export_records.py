@@ -0,0 +1,59 @@
+import os
+from typing import Dict
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication, QFileDialog, QMainWindow, QMessageBox
+
+from database.exporter import export_assessments, file_format
+from database.storage import StorageBackend
+from logger_setup import get_logger
+
+logger = get_logger(__name__)
+
+# File dialog filter: the suffix added when the typed name has none.
+EXPORT_FILTERS: Dict[str, str] = {
+    "CSV (*.csv)": '.csv',
+    "CSV, gzip-compressed (*.csv.gz)": '.csv.gz',
+    "JSON Lines (*.jsonl)": '.jsonl',
+    "JSON Lines, gzip-compressed (*.jsonl.gz)": '.jsonl.gz',
+}
+
+
+def export_records(main_window_instance: QMainWindow, storage: StorageBackend, model_name: str) -> None:
+    """
+    Asks for a file and exports every assessment to it.
+
+    Table edits that are still buffered in the model are saved first so the file matches the
+    table. The export runs on the GUI thread; it streams rows, so it takes constant memory.
+
+    Args:
+        main_window_instance (QMainWindow): The instance of the main window.
+        storage (StorageBackend): The connection to export from.
+        model_name (str): The name of the table model whose buffered edits are saved first.
+
+    Returns:
+        None
+    """
+    path, selected_filter = QFileDialog.getSaveFileName(
+        main_window_instance, "Export Assessments",
+        os.path.join(os.path.expanduser('~'), 'beck_assessments.csv'),
+        ';;'.join(EXPORT_FILTERS))
+    if not path:
+        return
+    if file_format(path)[0] is None:
+        path += EXPORT_FILTERS.get(selected_filter, '.csv')
+
+    QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+    try:
+        getattr(main_window_instance, model_name).flush()
+        result = export_assessments(storage, path)
+    except Exception as e:
+        QApplication.restoreOverrideCursor()
+        logger.error("An error occurred while exporting records: %s", str(e))
+        QMessageBox.warning(main_window_instance, "Export Assessments", f"The export failed:\n{e}")
+        return
+    QApplication.restoreOverrideCursor()
+    QMessageBox.information(
+        main_window_instance, "Export Assessments",
+        f"Exported {result.rows} assessments to {result.path} in {result.seconds:.2f} s "
+        f"({result.rows_per_second:,.0f} rows/s).")
@@ -0,0 +1,52 @@
+import os
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication, QFileDialog, QMainWindow, QMessageBox
+
+from database.importer import import_assessments
+from database.storage import StorageBackend
+from logger_setup import get_logger
+
+logger = get_logger(__name__)
+
+IMPORT_FILTER = "Assessments (*.csv *.csv.gz *.jsonl *.jsonl.gz)"
+
+
+def import_records(main_window_instance: QMainWindow, storage: StorageBackend, model_name: str) -> None:
+    """
+    Asks for a CSV or JSON Lines file, imports its valid assessments and reloads the table.
+
+    Buffered table edits are saved first, since reloading the model would otherwise have to
+    flush them anyway. Rejected rows are listed in a report next to the file.
+
+    Args:
+        main_window_instance (QMainWindow): The instance of the main window.
+        storage (StorageBackend): The connection to import into.
+        model_name (str): The name of the table model to reload afterwards.
+
+    Returns:
+        None
+    """
+    path, _ = QFileDialog.getOpenFileName(
+        main_window_instance, "Import Assessments", os.path.expanduser('~'), IMPORT_FILTER)
+    if not path:
+        return
+
+    model = getattr(main_window_instance, model_name)
+    QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+    try:
+        model.flush()
+        result = import_assessments(storage, path)
+        model.select()
+    except Exception as e:
+        QApplication.restoreOverrideCursor()
+        logger.error("An error occurred while importing records: %s", str(e))
+        QMessageBox.warning(main_window_instance, "Import Assessments",
+                            f"Nothing was imported:\n{e}")
+        return
+    QApplication.restoreOverrideCursor()
+    message = (f"Imported {result.rows} assessments from {result.path} in {result.seconds:.2f} s "
+               f"({result.rows_per_second:,.0f} rows/s).")
+    if result.report is not None:
+        message += f"\n\n{result.rejected} rows were rejected; see {result.report}."
+    QMessageBox.information(main_window_instance, "Import Assessments", message)
@@ -1,25 +1,33 @@
-from PyQt6 import QtSql
+from typing import Optional
+
 from PyQt6.QtWidgets import QAbstractItemView
-from logger_setup import logger
+
+import tracker_config as tkc
+from database.database_utility.beck_table_model import BeckTableModel
+from logger_setup import get_logger
+
+logger = get_logger(__name__)
 
 
-def create_and_set_model(table_name: str, view_widget: QAbstractItemView) -> QtSql.QSqlTableModel:
+def create_and_set_model(table_name: str,
+                         view_widget: QAbstractItemView,
+                         flush_interval_ms: Optional[int] = tkc.EDIT_FLUSH_IDLE_MS) -> BeckTableModel:
     """
-    Creates and sets up a QSqlTableModel for the specified table name and view widget.
+    Creates and sets up a BeckTableModel for the specified table name and view widget.
 
     Args:
         table_name (str): The name of the table to create the model for.
         view_widget (QAbstractItemView): The view widget to set the model on.
+        flush_interval_ms (Optional[int]): How long edits are buffered after the last one
+            before they are written; None writes every edit immediately.
 
     Returns:
-        QSqlTableModel: The created QSqlTableModel.
+        BeckTableModel: The created BeckTableModel.
 
     Raises:
         RuntimeError: If there is an error selecting data from the table.
     """
-    model = QtSql.QSqlTableModel()
-    model.setTable(table_name)
-    model.setEditStrategy(QtSql.QSqlTableModel.EditStrategy.OnFieldChange)
+    model = BeckTableModel(table_name, flush_interval_ms=flush_interval_ms)
 
     if not model.select():
         error_message = f"Error selecting data from table: {table_name}, {model.lastError().text()}"
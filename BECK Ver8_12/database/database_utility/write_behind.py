@@ -0,0 +1,166 @@
+import queue
+from typing import Dict, List, Tuple, Union
+
+from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtSql import QSqlDatabase
+
+import tracker_config as tkc
+from database.beck_columns import BECK_INSERT_COLUMNS
+from database.database_manager import ChunkTiming, DataManager, close_database, target_db_path
+from logger_setup import get_logger
+
+logger = get_logger(__name__)
+
+WRITER_CONNECTION = 'beck_writer'
+
+_STOP = object()
+
+
+class BeckWriter(QThread):
+    """
+    A background thread that owns its own database connection and writes queued assessments.
+
+    The GUI thread hands records to `enqueue`, which returns immediately. The writer drains
+    everything that is pending into a single transaction, so a burst of commits costs one
+    disk sync, and reports the outcome through the `written` and `failed` signals.
+
+    Attributes:
+        opened (pyqtSignal): Emitted once the writer's connection has been opened and the
+            schema migrated, so other connections opened after it find the schema current.
+        written (pyqtSignal): Emitted with the records committed in one transaction, each a
+            mapping of column name to value that includes the assigned 'id'.
+        failed (pyqtSignal): Emitted with an error message and the records that were not
+            written, keyed by column name like those of written, when a transaction is rolled
+            back. Emitted with no records instead of opened when the connection cannot be
+            opened or migrated, in which case the thread ends.
+    """
+
+    opened = pyqtSignal()
+    written = pyqtSignal(list)
+    failed = pyqtSignal(str, list)
+
+    def __init__(self,
+                 db_name: str = target_db_path,
+                 max_pending: int = tkc.WRITE_QUEUE_SIZE,
+                 parent=None) -> None:
+        """
+        Initializes the writer and its bounded queue.
+
+        Args:
+            db_name (str): The path to the SQLite database file.
+            max_pending (int): The maximum number of records waiting to be written.
+            parent: The optional QObject parent.
+        """
+        super().__init__(parent)
+        self._db_name: str = db_name
+        self._max_pending: int = max_pending
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+
+    def enqueue(self, *values: Union[str, int]) -> None:
+        """
+        Queues one assessment for writing without blocking the caller.
+
+        The arguments are the same as DataManager.insert_into_beck_table_aug_8, so this method
+        can be passed anywhere an insert method is expected.
+
+        Args:
+            *values (Union[str, int]): The column values in BECK_INSERT_COLUMNS order.
+
+        Raises:
+            queue.Full: If the writer already has max_pending records waiting.
+        """
+        self._queue.put_nowait(tuple(values))
+
+    def stop(self) -> None:
+        """
+        Writes whatever is still pending, then stops the thread and waits for it to finish.
+        """
+        if self.isRunning():
+            self._queue.put(_STOP)
+            self.wait()
+
+    def run(self) -> None:
+        """
+        Opens the writer connection and commits queued records until stopped.
+        """
+        try:
+            manager = DataManager(self._db_name, connection_name=WRITER_CONNECTION)
+        except (ValueError, RuntimeError) as e:
+            manager = None
+            error_message = str(e)
+        # Handled out of the except block, so the traceback no longer holds the connection
+        # the failed DataManager added when it is removed.
+        if manager is None:
+            logger.error("Background writer could not open the database: %s", error_message)
+            QSqlDatabase.removeDatabase(WRITER_CONNECTION)
+            self.failed.emit(error_message, [])
+            return
+        self.opened.emit()
+        try:
+            stopping = False
+            while not stopping:
+                batch, stopping = self._next_batch()
+                if batch:
+                    self._write(manager, batch)
+        finally:
+            close_database(manager)
+            del manager
+            QSqlDatabase.removeDatabase(WRITER_CONNECTION)
+
+    def _next_batch(self) -> Tuple[List[Tuple[Union[str, int], ...]], bool]:
+        """
+        Blocks for the next record, then coalesces everything else already queued.
+
+        Returns:
+            Tuple[List[Tuple[Union[str, int], ...]], bool]: The records to write and whether
+            the stop sentinel was reached.
+        """
+        record = self._queue.get()
+        if record is _STOP:
+            return [], True
+        batch = [record]
+        while len(batch) < self._max_pending:
+            try:
+                record = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if record is _STOP:
+                return batch, True
+            batch.append(record)
+        return batch, False
+
+    def _write(self, manager: DataManager, batch: List[Tuple[Union[str, int], ...]]) -> None:
+        """
+        Commits one coalesced batch and reports the outcome. A failed batch is rolled back
+        and handed back whole through failed, so none of its records are lost.
+
+        Args:
+            manager (DataManager): The writer thread's data manager.
+            batch (List[Tuple[Union[str, int], ...]]): The records to write.
+        """
+        try:
+            timings = manager.insert_many(batch)
+        except (ValueError, RuntimeError) as e:
+            logger.error("Background write of %s records failed: %s", len(batch), e)
+            self.failed.emit(str(e), [dict(zip(BECK_INSERT_COLUMNS, record)) for record in batch])
+            return
+        self.written.emit(_with_ids(batch, timings))
+
+
+def _with_ids(batch: List[Tuple[Union[str, int], ...]],
+              timings: List[ChunkTiming]) -> List[Dict[str, Union[str, int]]]:
+    """
+    Pairs written records with the ids insert_many assigned to them.
+
+    Args:
+        batch (List[Tuple[Union[str, int], ...]]): The records in BECK_INSERT_COLUMNS order.
+        timings (List[ChunkTiming]): The chunk timings returned by insert_many.
+
+    Returns:
+        List[Dict[str, Union[str, int]]]: One mapping per record, keyed by column name and
+        including 'id'.
+    """
+    ids: List[int] = []
+    for timing in timings:
+        ids.extend(range(timing.last_id - timing.rows + 1, timing.last_id + 1))
+    return [dict(zip(BECK_INSERT_COLUMNS, record), id=row_id) for record, row_id in zip(batch, ids)]
@@ -0,0 +1,199 @@
+"""
+Streams assessments to CSV or JSON Lines, optionally gzip-compressed.
+
+Rows are read through StorageBackend.stream and written as they arrive, so memory use does not
+grow with the number of rows. The live table and the archive are each read in rowid order
+and merged by id here; ordering the beck_history view instead would make SQLite sort every
+row in a temporary b-tree first. Both are read inside one transaction, so they come from the
+same snapshot even while the GUI or its background writer commits. The file is written under a temporary name and renamed once
+complete, so an interrupted export never leaves a truncated file behind.
+
+Run headless from the BECK Ver8_12 directory, without Qt:
+
+    python -m database.exporter assessments.csv.gz
+"""
+import argparse
+import csv
+import gzip
+import heapq
+import json
+import os
+import sys
+import time
+from itertools import islice
+from operator import itemgetter
+from typing import Callable, List, NamedTuple, Optional, TextIO, Tuple
+
+import tracker_config as tkc
+from database.beck_columns import BECK_TABLE_COLUMNS
+from database.sqlite_storage import SqliteStorage
+from database.storage import StorageBackend
+from logger_setup import get_logger
+
+logger = get_logger(__name__)
+
+EXPORT_FORMATS: Tuple[str, ...] = ('csv', 'jsonl')
+
+# Called with the number of rows written so far, every EXPORT_BATCH_ROWS rows.
+ExportProgress = Callable[[int], None]
+
+
+class ExportResult(NamedTuple):
+    """
+    The outcome of one export.
+    """
+    path: str
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else float(self.rows)
+
+
+def file_format(path: str) -> Tuple[Optional[str], bool]:
+    """
+    Infers the file format and compression from a file name.
+
+    Args:
+        path (str): The output path, e.g. "assessments.jsonl.gz".
+
+    Returns:
+        Tuple[Optional[str], bool]: The format, or None if the extension is not one of
+        EXPORT_FORMATS, and whether the name ends in ".gz".
+    """
+    name = path.lower()
+    compress = name.endswith('.gz')
+    if compress:
+        name = name[:-len('.gz')]
+    extension = os.path.splitext(name)[1].lstrip('.')
+    return (extension if extension in EXPORT_FORMATS else None), compress
+
+
+def _write_csv(output: TextIO, columns: List[str], rows, batch_size: int,
+               progress: Optional[ExportProgress]) -> int:
+    writer = csv.writer(output)
+    writer.writerow(columns)
+    written = 0
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return written
+        writer.writerows(batch)
+        written += len(batch)
+        if progress is not None:
+            progress(written)
+
+
+def _write_jsonl(output: TextIO, columns: List[str], rows, batch_size: int,
+                 progress: Optional[ExportProgress]) -> int:
+    written = 0
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return written
+        output.writelines(json.dumps(dict(zip(columns, row)), ensure_ascii=False) + '\n'
+                          for row in batch)
+        written += len(batch)
+        if progress is not None:
+            progress(written)
+
+
+def export_assessments(storage: StorageBackend,
+                       path: str,
+                       fmt: Optional[str] = None,
+                       compress: Optional[bool] = None,
+                       live_only: bool = False,
+                       progress: Optional[ExportProgress] = None,
+                       batch_size: int = tkc.EXPORT_BATCH_ROWS) -> ExportResult:
+    """
+    Writes every assessment, oldest id first, to a CSV or JSON Lines file.
+
+    Args:
+        storage (StorageBackend): The open connection to read from, Qt or sqlite3.
+        path (str): The output file; it is replaced if it exists.
+        fmt (Optional[str]): 'csv' or 'jsonl'; inferred from the file name when None.
+        compress (Optional[bool]): Whether to gzip the file; inferred from a ".gz" suffix
+            when None.
+        live_only (bool): Export only beck_table_aug_8, leaving out the rows compact_archive
+            moved into the archive.
+        progress (Optional[ExportProgress]): Called as rows are written.
+        batch_size (int): The number of rows fetched and written at a time.
+
+    Returns:
+        ExportResult: The path written, the row count and the elapsed seconds.
+
+    Raises:
+        ValueError: If the format is unknown or cannot be inferred.
+        RuntimeError: If reading the rows or writing the file fails.
+    """
+    inferred_format, inferred_compress = file_format(path)
+    fmt = fmt or inferred_format
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Cannot export {path} as {fmt or 'an unknown format'}, "
+                         f"expected one of {', '.join(EXPORT_FORMATS)}")
+    if compress is None:
+        compress = inferred_compress
+    sources = ('beck_table_aug_8',) if live_only else ('beck_table_aug_8', 'beck_archive')
+    write = _write_csv if fmt == 'csv' else _write_jsonl
+
+    started = time.perf_counter()
+    partial = f"{path}.part"
+    streams = []
+    try:
+        storage.begin()
+    except RuntimeError as e:
+        raise RuntimeError(f"Error starting export transaction: {e}") from e
+    try:
+        for source in sources:
+            _, rows = storage.stream(f"SELECT {', '.join(BECK_TABLE_COLUMNS)} FROM {source} ORDER BY id",
+                                     batch_size=batch_size)
+            streams.append(rows)
+        if compress:
+            output = gzip.open(partial, 'wt', encoding='utf-8', newline='')
+        else:
+            output = open(partial, 'w', encoding='utf-8', newline='')
+        with output:
+            written = write(output, list(BECK_TABLE_COLUMNS), heapq.merge(*streams, key=itemgetter(0)),
+                            batch_size, progress)
+        os.replace(partial, path)
+    except (OSError, RuntimeError) as e:
+        if os.path.exists(partial):
+            os.remove(partial)
+        error_message = f"Error exporting assessments to {path}: {e}"
+        logger.error(error_message)
+        raise RuntimeError(error_message) from e
+    finally:
+        for rows in streams:
+            rows.close()
+        storage.rollback()  # nothing was written; this only ends the read transaction
+
+    result = ExportResult(path, written, time.perf_counter() - started)
+    logger.info("Exported %s rows to %s in %.2f s (%.0f rows/s)",
+                result.rows, path, result.seconds, result.rows_per_second)
+    return result
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('output', help='file to write; .csv or .jsonl, optionally followed by .gz')
+    parser.add_argument('--db', default=os.path.join(os.path.expanduser('~'), tkc.DB_NAME),
+                        help='database to export (default: %(default)s)')
+    parser.add_argument('--format', choices=EXPORT_FORMATS, help='override the format the file name implies')
+    parser.add_argument('--gzip', action='store_true', default=None, help='compress even without a .gz suffix')
+    parser.add_argument('--live-only', action='store_true', help='leave out archived assessments')
+    args = parser.parse_args(argv)
+
+    try:
+        with SqliteStorage(args.db, connection_name='exporter', profile='read-only analytics') as storage:
+            result = export_assessments(storage, args.output, args.format, args.gzip, args.live_only)
+    except (ValueError, RuntimeError) as e:
+        print(e, file=sys.stderr)
+        return 1
+    print(f"Exported {result.rows} rows to {result.path} in {result.seconds:.2f} s "
+          f"({result.rows_per_second:,.0f} rows/s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
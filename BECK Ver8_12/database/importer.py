@@ -0,0 +1,363 @@
+"""
+Imports assessments from CSV or JSON Lines files, optionally gzip-compressed.
+
+The file is read as a stream and validated IMPORT_BATCH_ROWS rows at a time with NumPy: every
+item must be a score from 0 to 3, the date and time must be a real "yyyy-MM-dd" and
+"hh:mm:ss" moment that is not in the future, and beck_summary (computed when left blank) must
+equal the item total. A beck_ts column, as written by the exporter, must agree with the date
+and time; an id column is ignored, since imported rows get new ids. Valid rows are inserted
+with StorageBackend.insert_many in one transaction, so a failed import writes nothing. Rejected
+rows are copied to a CSV report with the reasons and their line numbers.
+
+Run headless from the BECK Ver8_12 directory, without Qt:
+
+    python -m database.importer backlog.csv
+"""
+import argparse
+import calendar
+import csv
+import gzip
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Mapping, NamedTuple, Optional, TextIO, Tuple
+
+import tracker_config as tkc
+from database.beck_columns import BECK_FORM_COLUMNS, BECK_ITEM_COLUMNS
+from database.exporter import EXPORT_FORMATS, file_format
+from database.sqlite_storage import SqliteStorage
+from database.storage import StorageBackend
+from logger_setup import get_logger
+
+logger = get_logger(__name__)
+
+# Columns a file must provide; beck_summary and beck_ts may be missing or blank.
+REQUIRED_COLUMNS: Tuple[str, ...] = ('beck_date', 'beck_time') + BECK_ITEM_COLUMNS
+REPORT_COLUMNS: Tuple[str, ...] = ('line', 'errors') + BECK_FORM_COLUMNS + ('beck_ts',)
+SCORES: Tuple[str, ...] = ('0', '1', '2', '3')
+
+# Called with the number of rows read so far, after every batch.
+ImportProgress = Callable[[int], None]
+
+
+class ImportResult(NamedTuple):
+    """
+    The outcome of one import.
+
+    Attributes:
+        path (str): The file imported.
+        rows (int): The rows inserted, or that would have been in a dry run.
+        rejected (int): The rows that failed validation.
+        seconds (float): The time the import took.
+        report (Optional[str]): The report of rejected rows, or None if every row was valid.
+    """
+    path: str
+    rows: int
+    rejected: int
+    seconds: float
+    report: Optional[str]
+
+    @property
+    def rows_per_second(self) -> float:
+        total = self.rows + self.rejected
+        return total / self.seconds if self.seconds > 0 else float(total)
+
+
+class BatchValidation(NamedTuple):
+    """
+    The outcome of validating one batch.
+
+    Attributes:
+        rows (List[List[Any]]): The valid records in BECK_INSERT_COLUMNS order.
+        rejected (List[Tuple[int, str]]): The batch position of every invalid record and the
+            reasons it was rejected.
+    """
+    rows: List[List[Any]]
+    rejected: List[Tuple[int, str]]
+
+
+def _text(value: Any) -> str:
+    return '' if value is None else str(value).strip()
+
+
+def _parse_moments(stamps):
+    """
+    Parses "yyyy-MM-ddThh:mm:ss" strings, giving NaT for any that are not exactly that.
+    """
+    import numpy as np
+
+    try:
+        moments = stamps.astype('datetime64[s]')
+    except ValueError:
+        # One bad value fails the whole conversion; find it one value at a time.
+        moments = np.empty(stamps.shape, dtype='datetime64[s]')
+        for index, stamp in enumerate(stamps):
+            try:
+                moments[index] = np.datetime64(stamp, 's')
+            except ValueError:
+                moments[index] = np.datetime64('NaT')
+    # NumPy also accepts other ISO forms ("2024-01-01T10:00", "2024-01-01 10:00:00Z"); only
+    # the canonical text round-trips.
+    canonical = np.datetime_as_string(moments, unit='s') == stamps
+    return np.where(canonical, moments, np.datetime64('NaT'))
+
+
+def validate_batch(records: List[Mapping[str, Any]], now: Optional[int] = None) -> BatchValidation:
+    """
+    Validates a batch of records with vectorized checks.
+
+    Args:
+        records (List[Mapping[str, Any]]): The records, keyed by column name.
+        now (Optional[int]): The latest beck_ts accepted; defaults to the current local time.
+
+    Returns:
+        BatchValidation: The valid rows ready to insert and the reasons for every rejection.
+    """
+    import numpy as np
+
+    if now is None:
+        now = calendar.timegm(datetime.now().timetuple())
+    count = len(records)
+    errors: List[List[str]] = [[] for _ in range(count)]
+
+    items = np.array([[_text(record.get(column)) for column in BECK_ITEM_COLUMNS] for record in records],
+                     dtype=str).reshape(count, len(BECK_ITEM_COLUMNS))
+    valid_items = np.isin(items, SCORES)
+    scores = np.where(valid_items, items, '0').astype(np.int64)
+    for row, position in zip(*np.nonzero(~valid_items)):
+        value = str(items[row, position])
+        errors[row].append(f"{BECK_ITEM_COLUMNS[position]} {value!r} is not a score from 0 to 3"
+                           if value else f"{BECK_ITEM_COLUMNS[position]} is missing")
+
+    totals = scores.sum(axis=1)
+    summaries = np.array([_text(record.get('beck_summary')) for record in records], dtype=str)
+    given = summaries != ''
+    numeric = np.char.isdigit(summaries) & (np.char.str_len(summaries) <= 3)
+    parsed = np.where(numeric, summaries, '0').astype(np.int64)
+    wrong_summary = given & valid_items.all(axis=1) & (~numeric | (parsed != totals))
+    for row in np.nonzero(wrong_summary)[0]:
+        errors[row].append(f"beck_summary {str(summaries[row])!r} does not equal the item total {totals[row]}")
+
+    dates = np.array([_text(record.get('beck_date')) for record in records], dtype=str)
+    times = np.array([_text(record.get('beck_time')) for record in records], dtype=str)
+    moments = _parse_moments(np.char.add(np.char.add(dates, 'T'), times))
+    valid_moments = ~np.isnat(moments)
+    stamps = np.where(valid_moments, moments, np.datetime64(0, 's')).astype(np.int64)
+    for row in np.nonzero(~valid_moments)[0]:
+        errors[row].append(f"beck_date {str(dates[row])!r} and beck_time {str(times[row])!r} "
+                           f"are not a valid yyyy-MM-dd and hh:mm:ss")
+    for row in np.nonzero(valid_moments & (stamps > now))[0]:
+        errors[row].append(f"{dates[row]} {times[row]} is in the future")
+
+    given_ts = np.array([_text(record.get('beck_ts')) for record in records], dtype=str)
+    unsigned_ts = np.where(np.char.startswith(given_ts, '-'), np.char.replace(given_ts, '-', '', 1), given_ts)
+    ts_numeric = np.char.isdigit(unsigned_ts) & (np.char.str_len(given_ts) <= 18)
+    parsed_ts = np.where(ts_numeric, given_ts, '0').astype(np.int64)
+    wrong_ts = (given_ts != '') & valid_moments & (~ts_numeric | (parsed_ts != stamps))
+    for row in np.nonzero(wrong_ts)[0]:
+        errors[row].append(f"beck_ts {str(given_ts[row])!r} does not match {dates[row]} {times[row]}")
+
+    rows: List[List[Any]] = []
+    rejected: List[Tuple[int, str]] = []
+    score_lists, total_list, stamp_list = scores.tolist(), totals.tolist(), stamps.tolist()
+    for index in range(count):
+        if errors[index]:
+            rejected.append((index, '; '.join(errors[index])))
+        else:
+            rows.append([str(dates[index]), str(times[index]), *score_lists[index],
+                         total_list[index], stamp_list[index]])
+    return BatchValidation(rows, rejected)
+
+
+def _open(path: str, mode: str, compress: bool) -> TextIO:
+    if compress:
+        return gzip.open(path, f"{mode}t", encoding='utf-8', newline='')
+    return open(path, mode, encoding='utf-8', newline='')
+
+
+def _read_records(source: TextIO, fmt: str) -> Iterator[Tuple[int, Dict[str, Any], Optional[str]]]:
+    """
+    Returns an iterator over a file's records, each with its line number and, if the line
+    could not be read as a record at all, the reason.
+
+    Raises:
+        ValueError: If a CSV file's header lacks a required column.
+    """
+    if fmt == 'csv':
+        reader = csv.DictReader(source)
+        missing = [column for column in REQUIRED_COLUMNS if column not in (reader.fieldnames or ())]
+        if missing:
+            raise ValueError(f"The CSV header is missing the columns {', '.join(missing)}")
+        return ((reader.line_num, record, None) for record in reader)
+    return _read_json_lines(source)
+
+
+def _read_json_lines(source: TextIO) -> Iterator[Tuple[int, Dict[str, Any], Optional[str]]]:
+    for line_number, line in enumerate(source, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield line_number, {}, f"not valid JSON: {e}"
+            continue
+        if isinstance(record, dict):
+            yield line_number, record, None
+        else:
+            yield line_number, {}, "not a JSON object"
+
+
+class _RejectReport:
+    """
+    The CSV report of rejected rows, created when the first row is rejected.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.count = 0
+        self._output: Optional[TextIO] = None
+        self._writer = None
+
+    def add(self, line_number: int, record: Mapping[str, Any], reasons: str) -> None:
+        if self._output is None:
+            self._output = open(self.path, 'w', encoding='utf-8', newline='')
+            self._writer = csv.writer(self._output)
+            self._writer.writerow(REPORT_COLUMNS)
+        self._writer.writerow([line_number, reasons] + [record.get(column) for column in REPORT_COLUMNS[2:]])
+        self.count += 1
+
+    def close(self) -> None:
+        if self._output is not None:
+            self._output.close()
+
+
+def default_report_path(path: str) -> str:
+    """
+    Returns where the rejected rows of an import are reported: next to the file, with
+    ".rejected.csv" in place of its extensions.
+    """
+    directory, name = os.path.split(path)
+    return os.path.join(directory, f"{name.split('.')[0] or name}.rejected.csv")
+
+
+def import_assessments(storage: StorageBackend,
+                       path: str,
+                       fmt: Optional[str] = None,
+                       compress: Optional[bool] = None,
+                       report_path: Optional[str] = None,
+                       dry_run: bool = False,
+                       progress: Optional[ImportProgress] = None,
+                       batch_size: int = tkc.IMPORT_BATCH_ROWS) -> ImportResult:
+    """
+    Validates a CSV or JSON Lines file and inserts its valid assessments.
+
+    Args:
+        storage (StorageBackend): The open connection to write to, Qt or sqlite3.
+        path (str): The file to import.
+        fmt (Optional[str]): 'csv' or 'jsonl'; inferred from the file name when None.
+        compress (Optional[bool]): Whether the file is gzipped; inferred from a ".gz" suffix
+            when None.
+        report_path (Optional[str]): Where rejected rows are written; defaults to
+            default_report_path(path). The report is only written if a row is rejected.
+        dry_run (bool): Only validate and report, inserting nothing.
+        progress (Optional[ImportProgress]): Called after every batch.
+        batch_size (int): The number of rows validated and inserted at a time.
+
+    Returns:
+        ImportResult: The counts of imported and rejected rows, the elapsed seconds and the
+        report written, if any.
+
+    Raises:
+        ValueError: If the format is unknown or a CSV header lacks a required column.
+        RuntimeError: If the file cannot be read or the insert fails; nothing is inserted.
+    """
+    inferred_format, inferred_compress = file_format(path)
+    fmt = fmt or inferred_format
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Cannot import {path} as {fmt or 'an unknown format'}, "
+                         f"expected one of {', '.join(EXPORT_FORMATS)}")
+    if compress is None:
+        compress = inferred_compress
+    if report_path is None:
+        report_path = default_report_path(path)
+
+    started = time.perf_counter()
+    now = calendar.timegm(datetime.now().timetuple())
+    report = _RejectReport(report_path)
+    valid = 0
+
+    def valid_rows(records: Iterator[Tuple[int, Dict[str, Any], Optional[str]]]) -> Iterator[List[Any]]:
+        nonlocal valid
+        read = 0
+        while True:
+            batch = list(islice(records, batch_size))
+            if not batch:
+                return
+            readable = []
+            for line_number, record, problem in batch:
+                if problem is None:
+                    readable.append((line_number, record))
+                else:
+                    report.add(line_number, record, problem)
+            validation = validate_batch([record for _, record in readable], now)
+            for index, reasons in validation.rejected:
+                report.add(*readable[index], reasons)
+            read += len(batch)
+            valid += len(validation.rows)
+            if progress is not None:
+                progress(read)
+            yield from validation.rows
+
+    try:
+        with _open(path, 'r', compress) as source:
+            rows = valid_rows(_read_records(source, fmt))
+            if dry_run:
+                for _ in rows:
+                    pass
+            else:
+                storage.insert_many(rows, chunk_size=batch_size)
+    except (OSError, EOFError, csv.Error) as e:
+        error_message = f"Error reading {path}: {e}"
+        logger.error(error_message)
+        raise RuntimeError(error_message) from e
+    finally:
+        report.close()
+
+    result = ImportResult(path, valid, report.count, time.perf_counter() - started,
+                          report.path if report.count else None)
+    logger.info("%s %s rows from %s in %.2f s (%.0f rows/s), %s rejected",
+                'Validated' if dry_run else 'Imported', result.rows, path, result.seconds,
+                result.rows_per_second, result.rejected)
+    return result
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('input', help='file to import; .csv or .jsonl, optionally followed by .gz')
+    parser.add_argument('--db', default=os.path.join(os.path.expanduser('~'), tkc.DB_NAME),
+                        help='database to import into (default: %(default)s)')
+    parser.add_argument('--format', choices=EXPORT_FORMATS, help='override the format the file name implies')
+    parser.add_argument('--gzip', action='store_true', default=None, help='read as gzip even without a .gz suffix')
+    parser.add_argument('--report', help='where to write rejected rows (default: <input>.rejected.csv)')
+    parser.add_argument('--dry-run', action='store_true', help='validate and report without inserting')
+    args = parser.parse_args(argv)
+
+    try:
+        with SqliteStorage(args.db, connection_name='importer', profile='bulk-import') as storage:
+            result = import_assessments(storage, args.input, args.format, args.gzip, args.report,
+                                        args.dry_run)
+    except (ValueError, RuntimeError) as e:
+        print(e, file=sys.stderr)
+        return 1
+    print(f"{'Validated' if args.dry_run else 'Imported'} {result.rows} rows from {result.path} "
+          f"in {result.seconds:.2f} s ({result.rows_per_second:,.0f} rows/s)")
+    if result.report is not None:
+        print(f"Rejected {result.rejected} rows, see {result.report}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,292 @@
+from typing import TYPE_CHECKING, Callable, List, NamedTuple, Optional, Tuple, Union
+
+import tracker_config as tkc
+from database.beck_columns import BECK_ITEM_COLUMNS, BECK_TABLE_COLUMNS
+from database.packed_items import unpack_item_sql
+from database.rollups import ROLLUP_GRANULARITIES, backfill_sql, create_table_sql, trigger_sql
+from logger_setup import get_logger
+
+logger = get_logger(__name__)
+
+if TYPE_CHECKING:
+    from database.storage import StorageBackend
+
+# Called with (version, description, done, total) while a backfill runs.
+MigrationProgress = Callable[[int, str, int, int], None]
+
+
+class AddColumn(NamedTuple):
+    """Adds a column unless the table already has it, since ALTER TABLE has no IF NOT EXISTS."""
+    table: str
+    column: str
+    declaration: str
+
+
+class Backfill(NamedTuple):
+    """
+    A data rewrite run in chunked transactions over the table's id range.
+
+    The sql must be an UPDATE/INSERT whose two placeholders bound the id range as
+    `id > ? AND id <= ?`. It must be idempotent, or the migration must reset its target in an
+    earlier plain step, so an interrupted backfill can simply be run again.
+    """
+    table: str
+    sql: str
+
+
+MigrationStep = Union[str, AddColumn, Backfill]
+
+
+class Migration(NamedTuple):
+    """
+    One schema version. Plain SQL steps must be idempotent (IF NOT EXISTS / IF EXISTS) so a
+    migration interrupted before user_version is bumped can be re-run from the start.
+    """
+    version: int
+    description: str
+    steps: Tuple[MigrationStep, ...]
+
+
+MIGRATIONS: Tuple[Migration, ...] = (
+    Migration(1, "create beck_table_aug_8", (
+        """CREATE TABLE IF NOT EXISTS beck_table_aug_8 (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        beck_date TEXT,
+        beck_time TEXT,
+        b_slider INTEGER,
+        b_slider_2 INTEGER,
+        b_slider_3 INTEGER,
+        b_slider_4 INTEGER,
+        b_slider_5 INTEGER,
+        b_slider_6 INTEGER,
+        b_slider_7 INTEGER,
+        b_slider_8 INTEGER,
+        b_slider_9 INTEGER,
+        b_slider_10 INTEGER,
+        b_slider_11 INTEGER,
+        b_slider_12 INTEGER,
+        b_slider_13 INTEGER,
+        b_slider_14 INTEGER,
+        b_slider_15 INTEGER,
+        b_slider_16 INTEGER,
+        b_slider_17 INTEGER,
+        b_slider_18 INTEGER,
+        b_slider_19 INTEGER,
+        b_slider_20 INTEGER,
+        b_slider_21 INTEGER,
+        beck_summary INTEGER
+        )""",
+        # Keyset pagination in BeckTableModel seeks on (beck_date, beck_time, id).
+        """CREATE INDEX IF NOT EXISTS idx_beck_date_time
+        ON beck_table_aug_8 (beck_date, beck_time, id)""",
+    )),
+    # beck_ts holds the assessment's wall-clock date and time as seconds since 1970-01-01,
+    # computed the way SQLite's strftime('%s') does (no time zone conversion), so date-range
+    # queries are integer seeks. The text columns stay the source the form and table edit.
+    Migration(2, "add indexed beck_ts epoch column", (
+        AddColumn('beck_table_aug_8', 'beck_ts', 'INTEGER'),
+        Backfill('beck_table_aug_8', """UPDATE beck_table_aug_8
+        SET beck_ts = CAST(strftime('%s', beck_date || ' ' || beck_time) AS INTEGER)
+        WHERE beck_ts IS NULL AND id > ? AND id <= ?"""),
+        """CREATE INDEX IF NOT EXISTS idx_beck_ts ON beck_table_aug_8 (beck_ts)""",
+        # Rows written without beck_ts and edits of the text columns keep it in step.
+        """CREATE TRIGGER IF NOT EXISTS trg_beck_ts_insert
+        AFTER INSERT ON beck_table_aug_8 WHEN NEW.beck_ts IS NULL
+        BEGIN
+            UPDATE beck_table_aug_8
+            SET beck_ts = CAST(strftime('%s', NEW.beck_date || ' ' || NEW.beck_time) AS INTEGER)
+            WHERE id = NEW.id;
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS trg_beck_ts_update
+        AFTER UPDATE OF beck_date, beck_time ON beck_table_aug_8
+        BEGIN
+            UPDATE beck_table_aug_8
+            SET beck_ts = CAST(strftime('%s', NEW.beck_date || ' ' || NEW.beck_time) AS INTEGER)
+            WHERE id = NEW.id;
+        END""",
+    )),
+    # Optional compact archive: DataManager.compact_archive moves old rows into
+    # beck_archive_packed, where the 21 items are one bit-packed integer and the date, time and
+    # summary are derived. beck_archive presents it with the original columns and beck_history
+    # is the union of live and archived rows that read-only queries use.
+    Migration(3, "add bit-packed assessment archive", (
+        """CREATE TABLE IF NOT EXISTS beck_archive_packed (
+        id INTEGER PRIMARY KEY,
+        beck_ts INTEGER NOT NULL,
+        beck_items INTEGER NOT NULL
+        )""",
+        """CREATE INDEX IF NOT EXISTS idx_beck_archive_ts ON beck_archive_packed (beck_ts)""",
+        f"""CREATE VIEW IF NOT EXISTS beck_archive AS SELECT
+        id,
+        strftime('%Y-%m-%d', beck_ts, 'unixepoch') AS beck_date,
+        strftime('%H:%M:%S', beck_ts, 'unixepoch') AS beck_time,
+        {', '.join(f"{unpack_item_sql(position)} AS {column}"
+                   for position, column in enumerate(BECK_ITEM_COLUMNS))},
+        {' + '.join(unpack_item_sql(position) for position in range(len(BECK_ITEM_COLUMNS)))} AS beck_summary,
+        beck_ts
+        FROM beck_archive_packed""",
+        f"""CREATE VIEW IF NOT EXISTS beck_history AS
+        SELECT {', '.join(BECK_TABLE_COLUMNS)} FROM beck_table_aug_8
+        UNION ALL
+        SELECT {', '.join(BECK_TABLE_COLUMNS)} FROM beck_archive""",
+    )),
+    # Trend rollups per day, ISO week and month (see database/rollups.py). The tables are
+    # emptied before the backfill so an interrupted run starts over instead of double counting,
+    # and the triggers are created last so the backfill is the only writer until it finishes.
+    Migration(4, "add daily, weekly and monthly rollups", (
+        *(create_table_sql(granularity) for granularity in ROLLUP_GRANULARITIES),
+        *(f"DELETE FROM {table}" for table, _, _ in ROLLUP_GRANULARITIES.values()),
+        *(Backfill('beck_history', backfill_sql(granularity)) for granularity in ROLLUP_GRANULARITIES),
+        *trigger_sql(),
+    )),
+)
+
+LATEST_VERSION: int = MIGRATIONS[-1].version
+
+
+def schema_version(storage: 'StorageBackend') -> int:
+    """
+    Reads the schema version recorded in PRAGMA user_version.
+
+    Args:
+        storage (StorageBackend): An open connection.
+
+    Returns:
+        int: The recorded version, 0 for a database that has never been migrated.
+
+    Raises:
+        RuntimeError: If the pragma cannot be read.
+    """
+    try:
+        return int(storage.fetch_value("PRAGMA user_version"))
+    except RuntimeError as e:
+        raise RuntimeError(f"Error reading schema version: {e}") from e
+
+
+def migrate(storage: 'StorageBackend',
+            progress: Optional[MigrationProgress] = None,
+            chunk_size: int = tkc.MIGRATION_CHUNK_SIZE) -> int:
+    """
+    Brings the database up to LATEST_VERSION by running every pending migration in order.
+
+    When the database is current this costs a single PRAGMA read. Each migration bumps
+    user_version only after all of its steps succeeded, so an interrupted upgrade resumes
+    with the same migration on the next start.
+
+    Args:
+        storage (StorageBackend): An open connection, Qt or sqlite3.
+        progress (Optional[MigrationProgress]): Called as backfills advance.
+        chunk_size (int): The number of ids covered by each backfill transaction.
+
+    Returns:
+        int: The schema version after migrating.
+
+    Raises:
+        RuntimeError: If a migration step fails; the failing transaction is rolled back.
+    """
+    version = schema_version(storage)
+    if version >= LATEST_VERSION:
+        return version
+
+    for migration in MIGRATIONS:
+        if migration.version <= version:
+            continue
+        logger.info("Migrating database to version %s: %s", migration.version, migration.description)
+        pending: List[Union[str, AddColumn]] = []
+        for step in migration.steps:
+            if isinstance(step, Backfill):
+                _run_in_transaction(storage, pending)
+                pending = []
+                _run_backfill(storage, migration, step, chunk_size, progress)
+            else:
+                pending.append(step)
+        pending.append(f"PRAGMA user_version = {int(migration.version)}")
+        _run_in_transaction(storage, pending)
+        version = migration.version
+    return version
+
+
+def _run_in_transaction(storage: 'StorageBackend', steps: List[Union[str, AddColumn]]) -> None:
+    """
+    Runs schema steps in one transaction.
+
+    Args:
+        storage (StorageBackend): An open connection.
+        steps (List[Union[str, AddColumn]]): The SQL statements and column additions to run.
+
+    Raises:
+        RuntimeError: If a step fails; the transaction is rolled back.
+    """
+    if not steps:
+        return
+    try:
+        storage.begin()
+    except RuntimeError as e:
+        raise RuntimeError(f"Error starting migration transaction: {e}") from e
+    for step in steps:
+        if isinstance(step, AddColumn):
+            if storage.has_column(step.table, step.column):
+                continue
+            sql = f'ALTER TABLE {step.table} ADD COLUMN "{step.column}" {step.declaration}'
+        else:
+            sql = step
+        try:
+            storage.execute(sql)
+        except RuntimeError as e:
+            error_message = f"Migration step failed: {e}"
+            storage.rollback()
+            logger.error(error_message)
+            raise RuntimeError(error_message) from e
+    try:
+        storage.commit()
+    except RuntimeError as e:
+        raise RuntimeError(f"Error committing migration: {e}") from e
+
+
+def _run_backfill(storage: 'StorageBackend',
+                  migration: Migration,
+                  step: Backfill,
+                  chunk_size: int,
+                  progress: Optional[MigrationProgress]) -> None:
+    """
+    Runs a backfill over the table's id range, one transaction per chunk of ids.
+
+    Args:
+        storage (StorageBackend): An open connection.
+        migration (Migration): The migration the backfill belongs to, for progress reports.
+        step (Backfill): The backfill to run.
+        chunk_size (int): The number of ids covered by each transaction.
+        progress (Optional[MigrationProgress]): Called after every chunk.
+
+    Raises:
+        RuntimeError: If a chunk fails; that chunk is rolled back.
+    """
+    try:
+        bounds = storage.fetch_all(f"SELECT MIN(id) AS low, MAX(id) AS high FROM {step.table}")[0]
+    except RuntimeError as e:
+        raise RuntimeError(f"Error reading id range of {step.table}: {e}") from e
+    if bounds['low'] is None:
+        return
+    low, high = int(bounds['low']) - 1, int(bounds['high'])
+    total = high - low
+
+    for start in range(low, high, chunk_size):
+        end = min(start + chunk_size, high)
+        try:
+            storage.begin()
+        except RuntimeError as e:
+            raise RuntimeError(f"Error starting backfill transaction: {e}") from e
+        try:
+            storage.execute(step.sql, (start, end))
+        except RuntimeError as e:
+            error_message = f"Backfill failed for ids {start + 1}-{end}: {e}"
+            storage.rollback()
+            logger.error(error_message)
+            raise RuntimeError(error_message) from e
+        try:
+            storage.commit()
+        except RuntimeError as e:
+            raise RuntimeError(f"Error committing backfill: {e}") from e
+        logger.info("Migration %s: backfilled %s of %s ids", migration.version, end - low, total)
+        if progress is not None:
+            progress(migration.version, migration.description, end - low, total)
@@ -0,0 +1,139 @@
+# Compact storage of the 21 item scores as one integer.
+#
+# Every item is a 0-3 score, so it fits in two bits: item n (0-based, in BECK_ITEM_COLUMNS order)
+# occupies bits 2n and 2n + 1, and a whole assessment packs into a 42-bit integer that SQLite
+# stores in 6 bytes. The scalar functions and SQL builders need only the standard library; the
+# vectorized functions import NumPy when called.
+from typing import List, Sequence
+
+from database.beck_columns import BECK_ITEM_COLUMNS
+
+ITEM_BITS = 2
+ITEM_MASK = (1 << ITEM_BITS) - 1
+ITEM_COUNT = len(BECK_ITEM_COLUMNS)
+PACKED_BITS = ITEM_BITS * ITEM_COUNT
+
+
+def pack_items(items: Sequence[int]) -> int:
+    """
+    Packs one assessment's item scores into an integer.
+
+    Args:
+        items (Sequence[int]): The 21 scores in BECK_ITEM_COLUMNS order.
+
+    Returns:
+        int: The packed scores.
+
+    Raises:
+        ValueError: If there are not 21 scores or a score is outside 0-3.
+    """
+    if len(items) != ITEM_COUNT:
+        raise ValueError(f"Expected {ITEM_COUNT} item scores, got {len(items)}")
+    packed = 0
+    for position, score in enumerate(items):
+        if not 0 <= score <= ITEM_MASK:
+            raise ValueError(f"Item score {score} of {BECK_ITEM_COLUMNS[position]} is outside 0-{ITEM_MASK}")
+        packed |= int(score) << (ITEM_BITS * position)
+    return packed
+
+
+def unpack_items(packed: int) -> List[int]:
+    """
+    Unpacks an integer written by pack_items.
+
+    Args:
+        packed (int): The packed scores.
+
+    Returns:
+        List[int]: The 21 scores in BECK_ITEM_COLUMNS order.
+    """
+    return [(packed >> (ITEM_BITS * position)) & ITEM_MASK for position in range(ITEM_COUNT)]
+
+
+def pack_matrix(items):
+    """
+    Packs many assessments at once.
+
+    Args:
+        items (numpy.ndarray): An (N, 21) integer array of scores in BECK_ITEM_COLUMNS order.
+
+    Returns:
+        numpy.ndarray: An int64 array of N packed values.
+
+    Raises:
+        ValueError: If the array has the wrong shape or a score is outside 0-3.
+    """
+    import numpy as np
+
+    items = np.asarray(items)
+    if items.ndim != 2 or items.shape[1] != ITEM_COUNT:
+        raise ValueError(f"Expected an (N, {ITEM_COUNT}) array, got shape {items.shape}")
+    if items.size and (items.min() < 0 or items.max() > ITEM_MASK):
+        raise ValueError(f"Item scores must be within 0-{ITEM_MASK}")
+    shifts = np.arange(ITEM_COUNT, dtype=np.int64) * ITEM_BITS
+    return np.bitwise_or.reduce(items.astype(np.int64) << shifts, axis=1)
+
+
+def unpack_array(packed):
+    """
+    Unpacks many values written by pack_items or pack_matrix.
+
+    Args:
+        packed (numpy.ndarray): A one-dimensional integer array of packed values.
+
+    Returns:
+        numpy.ndarray: An (N, 21) uint8 array of scores in BECK_ITEM_COLUMNS order.
+    """
+    import numpy as np
+
+    packed = np.asarray(packed, dtype=np.int64).reshape(-1, 1)
+    shifts = np.arange(ITEM_COUNT, dtype=np.int64) * ITEM_BITS
+    return ((packed >> shifts) & ITEM_MASK).astype(np.uint8)
+
+
+def pack_items_sql(prefix: str = '') -> str:
+    """
+    Builds the SQL expression that packs the item columns of a row.
+
+    Args:
+        prefix (str): An optional table alias or NEW./OLD. qualifier for the columns.
+
+    Returns:
+        str: The expression.
+    """
+    return ' | '.join(f"({prefix}{column} << {ITEM_BITS * position})"
+                      for position, column in enumerate(BECK_ITEM_COLUMNS))
+
+
+def unpack_item_sql(position: int, packed_column: str = 'beck_items') -> str:
+    """
+    Builds the SQL expression that extracts one item score from a packed column.
+
+    Args:
+        position (int): The 0-based item position in BECK_ITEM_COLUMNS order.
+        packed_column (str): The column holding the packed scores.
+
+    Returns:
+        str: The expression.
+    """
+    return f"(({packed_column} >> {ITEM_BITS * position}) & {ITEM_MASK})"
+
+
+def packable_row_sql(prefix: str = '') -> str:
+    """
+    Builds the SQL condition a row must meet to be packed without losing information:
+    date and time text that beck_ts reproduces exactly, every item within 0-3, and a
+    beck_summary equal to the item total.
+
+    Args:
+        prefix (str): An optional table alias for the columns.
+
+    Returns:
+        str: The condition.
+    """
+    scores = ', '.join(str(score) for score in range(ITEM_MASK + 1))
+    in_range = ' AND '.join(f"{prefix}{column} IN ({scores})" for column in BECK_ITEM_COLUMNS)
+    total = ' + '.join(f"{prefix}{column}" for column in BECK_ITEM_COLUMNS)
+    return (f"{prefix}beck_date = strftime('%Y-%m-%d', {prefix}beck_ts, 'unixepoch') "
+            f"AND {prefix}beck_time = strftime('%H:%M:%S', {prefix}beck_ts, 'unixepoch') "
+            f"AND {in_range} AND {prefix}beck_summary = {total}")
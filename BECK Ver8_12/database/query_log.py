@@ -0,0 +1,264 @@
+"""
+Times every query the QtSql storage runs and logs the slow ones with their query plans.
+
+DataManager and BeckTableModel execute their queries through timed_exec and commit through
+timed_commit, which record the SQL text, the number of bind values, the rows affected and the
+time taken in query_log. It keeps the last tkc.QUERY_LOG_SIZE executions and running totals
+per SQL text for the life of the process. An execution that takes tkc.SLOW_QUERY_MS or longer
+is logged at WARNING on the 'beck.database.query_log.slow' logger, together with the output of
+EXPLAIN QUERY PLAN run on the same connection with the same bind values.
+
+Example:
+    from database.query_log import query_log
+    print(query_log.report())
+"""
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, NamedTuple, Sequence
+
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+
+import tracker_config as tkc
+from logger_setup import get_logger
+
+slow_logger = get_logger(f"{__name__}.slow")
+
+# Statements EXPLAIN QUERY PLAN has a plan for.
+PLANNED_STATEMENTS = ('SELECT', 'INSERT', 'UPDATE', 'DELETE', 'REPLACE', 'WITH')
+
+
+class QueryRecord(NamedTuple):
+    """
+    One execution of a query.
+
+    Attributes:
+        sql (str): The SQL text as executed, with '?' placeholders.
+        bind_count (int): The number of bind values.
+        rows (int): The rows affected, the number of executions for a batch, or -1 for a
+            SELECT, whose rows are only counted as they are read.
+        seconds (float): The time exec() took.
+        ok (bool): Whether it succeeded.
+        connection (str): The name of the connection it ran on.
+    """
+    sql: str
+    bind_count: int
+    rows: int
+    seconds: float
+    ok: bool
+    connection: str
+
+
+def _one_line(sql: str) -> str:
+    return ' '.join(sql.split())
+
+
+def explain_query_plan(db: QSqlDatabase, sql: str, bind_values: Sequence[Any] = ()) -> List[str]:
+    """
+    Asks SQLite how it runs a statement.
+
+    Args:
+        db (QSqlDatabase): The connection to ask on, which should be the one the statement ran on.
+        sql (str): The statement.
+        bind_values (Sequence[Any]): Its bind values; for a batch, the first of each list is used.
+
+    Returns:
+        List[str]: The 'detail' column of every step of the plan, or the error that prevented it.
+    """
+    query = QSqlQuery(db)
+    query.setForwardOnly(True)
+    if not query.prepare(f"EXPLAIN QUERY PLAN {sql}"):
+        return [f"no plan: {query.lastError().text()}"]
+    for index, value in enumerate(bind_values):
+        query.bindValue(index, value[0] if isinstance(value, list) and value else value)
+    if not query.exec():
+        return [f"no plan: {query.lastError().text()}"]
+    details: List[str] = []
+    while query.next():
+        details.append(str(query.value(3)))
+    query.finish()
+    return details
+
+
+class QueryLog:
+    """
+    The most recent query executions and running totals per SQL text.
+
+    It is shared by every connection, including the background writer's, so its state is
+    guarded by a lock.
+
+    Attributes:
+        slow_seconds (float): Executions taking at least this long are logged with their plan.
+        slow_count (int): The number of slow executions logged.
+    """
+
+    def __init__(self, size: int = tkc.QUERY_LOG_SIZE, slow_ms: float = tkc.SLOW_QUERY_MS) -> None:
+        """
+        Initializes an empty log.
+
+        Args:
+            size (int): The number of recent executions kept.
+            slow_ms (float): The time in milliseconds from which an execution is slow.
+
+        Raises:
+            ValueError: If size is not positive.
+        """
+        if size < 1:
+            raise ValueError(f"size must be positive, got {size}")
+        self.slow_seconds = slow_ms / 1000
+        self.slow_count = 0
+        self._lock = threading.Lock()
+        self._recent: Deque[QueryRecord] = deque(maxlen=size)
+        # SQL text -> [executions, failures, total seconds, longest seconds, rows]
+        self._totals: Dict[str, List[Any]] = {}
+
+    def record(self, entry: QueryRecord) -> None:
+        """
+        Adds an execution to the recent ones and the totals of its SQL text.
+
+        Args:
+            entry (QueryRecord): The execution.
+        """
+        with self._lock:
+            self._recent.append(entry)
+            totals = self._totals.get(entry.sql)
+            if totals is None:
+                totals = self._totals[entry.sql] = [0, 0, 0.0, 0.0, 0]
+            totals[0] += 1
+            totals[1] += not entry.ok
+            totals[2] += entry.seconds
+            totals[3] = max(totals[3], entry.seconds)
+            totals[4] += max(entry.rows, 0)
+
+    def recent(self) -> List[QueryRecord]:
+        """
+        Returns the executions still in the ring buffer.
+
+        Returns:
+            List[QueryRecord]: The executions, oldest first.
+        """
+        with self._lock:
+            return list(self._recent)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """
+        Returns the totals of every SQL text run since the log was created or cleared.
+
+        Returns:
+            List[Dict[str, Any]]: Per SQL text, collapsed to one line, its 'sql', 'count',
+                'errors', 'total_ms', 'mean_ms', 'max_ms' and 'rows', the most total time first.
+        """
+        with self._lock:
+            totals = [(sql, list(values)) for sql, values in self._totals.items()]
+        stats = [{'sql': _one_line(sql), 'count': count, 'errors': errors,
+                  'total_ms': seconds * 1000, 'mean_ms': seconds * 1000 / count,
+                  'max_ms': longest * 1000, 'rows': rows}
+                 for sql, (count, errors, seconds, longest, rows) in totals]
+        stats.sort(key=lambda entry: entry['total_ms'], reverse=True)
+        return stats
+
+    def report(self, limit: int = 20) -> str:
+        """
+        Formats the totals as a table, for logs and the console.
+
+        Args:
+            limit (int): The number of SQL texts shown, those with the most total time.
+
+        Returns:
+            str: One line per SQL text, the text cut to fit.
+        """
+        lines = [f"{'count':>7} {'errors':>6} {'total ms':>10} {'mean ms':>9} {'max ms':>9} {'rows':>8}  sql"]
+        for entry in self.stats()[:limit]:
+            lines.append(f"{entry['count']:>7} {entry['errors']:>6} {entry['total_ms']:>10.1f} "
+                         f"{entry['mean_ms']:>9.2f} {entry['max_ms']:>9.2f} {entry['rows']:>8}  "
+                         f"{entry['sql'][:120]}")
+        return '\n'.join(lines)
+
+    def clear(self) -> None:
+        """
+        Drops the recent executions and the totals.
+        """
+        with self._lock:
+            self._recent.clear()
+            self._totals.clear()
+            self.slow_count = 0
+
+    def log_if_slow(self, db: QSqlDatabase, entry: QueryRecord, bind_values: Sequence[Any]) -> None:
+        """
+        Logs an execution with its query plan if it took slow_seconds or longer.
+
+        Args:
+            db (QSqlDatabase): The connection it ran on.
+            entry (QueryRecord): The execution.
+            bind_values (Sequence[Any]): Its bind values, for the plan.
+        """
+        if entry.seconds < self.slow_seconds or not slow_logger.isEnabledFor(logging.WARNING):
+            return
+        with self._lock:
+            self.slow_count += 1
+        sql = entry.sql.lstrip()
+        if sql[:7].upper().startswith(PLANNED_STATEMENTS):
+            plan = explain_query_plan(db, sql, bind_values)
+        else:
+            plan = []
+        slow_logger.warning("Slow query, %.1f ms, %d bind values, %d rows, on %s: %s%s",
+                            entry.seconds * 1000, entry.bind_count, entry.rows, entry.connection,
+                            _one_line(sql), ''.join(f"\n    plan: {step}" for step in plan))
+
+
+query_log = QueryLog()
+
+
+def timed_exec(query: QSqlQuery, db: QSqlDatabase, sql: str = '', batch: bool = False) -> bool:
+    """
+    Executes a query and records the execution in query_log.
+
+    Args:
+        query (QSqlQuery): The query, prepared and bound unless sql is given.
+        db (QSqlDatabase): The connection the query belongs to.
+        sql (str): Unprepared SQL to execute with query.exec(sql).
+        batch (bool): Execute with execBatch; every bound value is then a list.
+
+    Returns:
+        bool: Whether the query succeeded, as exec() returned it.
+    """
+    start = time.perf_counter()
+    if batch:
+        executed = query.execBatch()
+    elif sql:
+        executed = query.exec(sql)
+    else:
+        executed = query.exec()
+    seconds = time.perf_counter() - start
+
+    bind_values = query.boundValues()
+    if batch:
+        rows = len(bind_values[0]) if bind_values and isinstance(bind_values[0], list) else 0
+    elif query.isSelect():
+        rows = -1
+    else:
+        rows = query.numRowsAffected() if executed else 0
+    entry = QueryRecord(query.lastQuery(), len(bind_values), rows, seconds, executed, db.connectionName())
+    query_log.record(entry)
+    query_log.log_if_slow(db, entry, bind_values)
+    return executed
+
+
+def timed_commit(db: QSqlDatabase) -> bool:
+    """
+    Commits a connection's transaction and records it in query_log as 'COMMIT', since the
+    commit is where SQLite waits for the disk.
+
+    Args:
+        db (QSqlDatabase): The connection.
+
+    Returns:
+        bool: Whether the commit succeeded, as QSqlDatabase.commit() returned it.
+    """
+    start = time.perf_counter()
+    committed = db.commit()
+    entry = QueryRecord('COMMIT', 0, 0, time.perf_counter() - start, committed, db.connectionName())
+    query_log.record(entry)
+    query_log.log_if_slow(db, entry, ())
+    return committed
@@ -0,0 +1,178 @@
+# Daily, ISO-weekly and monthly rollups of the assessment history.
+#
+# Each rollup table has one row per bucket, keyed by the bucket's first day ("yyyy-MM-dd"; weeks
+# start on Monday), holding the row count and the sum, minimum, maximum and sum of squares of
+# beck_summary and of every item. Triggers on beck_table_aug_8 keep them current in O(1) per
+# row: an INSERT folds the new row into its buckets, while a DELETE subtracts the old row from
+# the count and sums and marks the bucket stale, because a minimum or maximum cannot be taken
+# back out of an aggregate; an UPDATE does both. read_sql re-aggregates stale buckets from
+# beck_history while reading, and refresh_sql stores them again. Rows DataManager.compact_archive
+# moves into the archive are skipped, since their buckets don't change.
+from typing import Dict, List, Tuple
+
+from database.beck_columns import BECK_ITEM_COLUMNS
+
+ROLLUP_METRICS: Tuple[str, ...] = ('beck_summary',) + BECK_ITEM_COLUMNS
+ROLLUP_STATISTICS: Tuple[str, ...] = ('sum', 'min', 'max', 'sumsq')
+
+# granularity: (table, SQLite date modifiers giving the bucket start, modifier to the next bucket)
+ROLLUP_GRANULARITIES: Dict[str, Tuple[str, str, str]] = {
+    'day': ('beck_rollup_day', "", "'+1 day'"),
+    'week': ('beck_rollup_week', ", '-6 days', 'weekday 1'", "'+7 days'"),
+    'month': ('beck_rollup_month', ", 'start of month'", "'+1 month'"),
+}
+
+ROLLUP_COLUMNS: Tuple[str, ...] = ('bucket', 'n') + tuple(
+    f"{metric}_{statistic}" for metric in ROLLUP_METRICS for statistic in ROLLUP_STATISTICS)
+
+
+def bucket_sql(granularity: str, timestamp: str) -> str:
+    """
+    Builds the SQL expression giving the bucket a beck_ts value falls in.
+
+    Args:
+        granularity (str): 'day', 'week' or 'month'.
+        timestamp (str): The SQL expression of the beck_ts value.
+
+    Returns:
+        str: The expression, yielding the bucket's first day as "yyyy-MM-dd".
+    """
+    _, modifiers, _ = ROLLUP_GRANULARITIES[granularity]
+    return f"date({timestamp}, 'unixepoch'{modifiers})"
+
+
+def _aggregates(bucket: str) -> str:
+    columns = [bucket, 'count(*)']
+    for metric in ROLLUP_METRICS:
+        columns += [f"sum({metric})", f"min({metric})", f"max({metric})", f"sum({metric} * {metric})"]
+    return ', '.join(columns)
+
+
+def _aggregate_select(granularity: str, where: str) -> str:
+    bucket = bucket_sql(granularity, 'beck_ts')
+    return f"SELECT {_aggregates(bucket)} FROM beck_history WHERE {where} GROUP BY {bucket}"
+
+
+def _merge_clause() -> str:
+    """
+    Builds the ON CONFLICT clause that folds a new partial aggregate into an existing bucket.
+    """
+    assignments = ["n = n + excluded.n"]
+    for metric in ROLLUP_METRICS:
+        for statistic in ROLLUP_STATISTICS:
+            column = f"{metric}_{statistic}"
+            if statistic in ('min', 'max'):
+                merged = (f"{statistic}(coalesce({column}, excluded.{column}), "
+                          f"coalesce(excluded.{column}, {column}))")
+            else:
+                merged = f"coalesce({column} + excluded.{column}, {column}, excluded.{column})"
+            assignments.append(f"{column} = {merged}")
+    return f"ON CONFLICT(bucket) DO UPDATE SET {', '.join(assignments)}"
+
+
+def _subtract_statements(granularity: str) -> List[str]:
+    table, _, _ = ROLLUP_GRANULARITIES[granularity]
+    assignments = ["n = n - 1", "stale = 1"]
+    for metric in ROLLUP_METRICS:
+        old = f"coalesce(OLD.{metric}, 0)"
+        assignments += [f"{metric}_sum = {metric}_sum - {old}",
+                        f"{metric}_sumsq = {metric}_sumsq - {old} * {old}"]
+    bucket = bucket_sql(granularity, 'OLD.beck_ts')
+    return [f"UPDATE {table} SET {', '.join(assignments)} WHERE bucket = {bucket};",
+            f"DELETE FROM {table} WHERE bucket = {bucket} AND n <= 0;"]
+
+
+def create_table_sql(granularity: str) -> str:
+    """
+    Builds the CREATE TABLE statement of one rollup table.
+    """
+    table, _, _ = ROLLUP_GRANULARITIES[granularity]
+    statistics = ',\n        '.join(f"{column} INTEGER" for column in ROLLUP_COLUMNS[2:])
+    return f"""CREATE TABLE IF NOT EXISTS {table} (
+        bucket TEXT PRIMARY KEY,
+        n INTEGER NOT NULL,
+        {statistics},
+        stale INTEGER NOT NULL DEFAULT 0
+        )"""
+
+
+def backfill_sql(granularity: str) -> str:
+    """
+    Builds the chunked backfill that folds an id range of beck_history into a rollup table.
+    """
+    table, _, _ = ROLLUP_GRANULARITIES[granularity]
+    select = _aggregate_select(granularity, "beck_ts IS NOT NULL AND id > ? AND id <= ?")
+    return f"INSERT INTO {table} ({', '.join(ROLLUP_COLUMNS)}) {select} {_merge_clause()}"
+
+
+def stale_select_sql(granularity: str) -> str:
+    """
+    Builds the query that re-aggregates every stale bucket of a rollup table from
+    beck_history, one index range seek per bucket.
+    """
+    table, _, step = ROLLUP_GRANULARITIES[granularity]
+    return f"""SELECT {_aggregates('stale_bucket.bucket')}
+        FROM {table} AS stale_bucket JOIN beck_history
+        ON beck_ts >= CAST(strftime('%s', stale_bucket.bucket) AS INTEGER)
+        AND beck_ts < CAST(strftime('%s', stale_bucket.bucket, {step}) AS INTEGER)
+        WHERE stale_bucket.stale = 1
+        GROUP BY stale_bucket.bucket"""
+
+
+def refresh_sql(granularity: str) -> str:
+    """
+    Builds the statement that stores the re-aggregated stale buckets of a rollup table.
+    """
+    table, _, _ = ROLLUP_GRANULARITIES[granularity]
+    return f"INSERT OR REPLACE INTO {table} ({', '.join(ROLLUP_COLUMNS)}) {stale_select_sql(granularity)}"
+
+
+def read_sql(granularity: str) -> str:
+    """
+    Builds the query that reads a rollup table, re-aggregating stale buckets on the fly so
+    reads never write; the caller appends the WHERE and ORDER BY clauses on 'bucket'.
+    """
+    table, _, _ = ROLLUP_GRANULARITIES[granularity]
+    return f"""SELECT * FROM (
+        SELECT {', '.join(ROLLUP_COLUMNS)} FROM {table} WHERE stale = 0
+        UNION ALL
+        {stale_select_sql(granularity)})"""
+
+
+def _add_statement(granularity: str) -> str:
+    table, _, _ = ROLLUP_GRANULARITIES[granularity]
+    values = [bucket_sql(granularity, 'NEW.beck_ts'), '1']
+    for metric in ROLLUP_METRICS:
+        new = f"NEW.{metric}"
+        values += [new, new, new, f"{new} * {new}"]
+    return (f"INSERT INTO {table} ({', '.join(ROLLUP_COLUMNS)}) SELECT {', '.join(values)} "
+            f"WHERE NEW.beck_ts IS NOT NULL {_merge_clause()};")
+
+
+def trigger_sql() -> List[str]:
+    """
+    Builds the INSERT, DELETE and UPDATE triggers that keep every rollup table current.
+    """
+    adds = [_add_statement(granularity) for granularity in ROLLUP_GRANULARITIES]
+    subtracts = [statement for granularity in ROLLUP_GRANULARITIES
+                 for statement in _subtract_statements(granularity)]
+    watched = ', '.join(('beck_ts',) + ROLLUP_METRICS)
+    newline = '\n            '
+    return [
+        f"""CREATE TRIGGER IF NOT EXISTS trg_beck_rollup_insert
+        AFTER INSERT ON beck_table_aug_8
+        BEGIN
+            {newline.join(adds)}
+        END""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_beck_rollup_delete
+        AFTER DELETE ON beck_table_aug_8
+        WHEN NOT EXISTS (SELECT 1 FROM beck_archive_packed WHERE id = OLD.id)
+        BEGIN
+            {newline.join(subtracts)}
+        END""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_beck_rollup_update
+        AFTER UPDATE OF {watched} ON beck_table_aug_8
+        BEGIN
+            {newline.join(subtracts + adds)}
+        END""",
+    ]
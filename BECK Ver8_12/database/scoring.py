@@ -0,0 +1,218 @@
+# BDI-II scoring: totals, severity bands and subscales for one assessment or a whole history.
+#
+# Every function takes item scores in BECK_ITEM_COLUMNS order. score_matrix scores an (N, 21)
+# matrix in one NumPy pass, so the table and analytics over a snapshot use the same rules;
+# NumPy is imported when it is first called. RunningScore applies the same rules to a form
+# whose items change one at a time.
+from bisect import bisect_right
+from typing import List, NamedTuple, Sequence, Tuple
+
+from database.packed_items import ITEM_COUNT, ITEM_MASK
+
+# (label, lowest total, highest total) of the standard BDI-II severity bands.
+SEVERITY_BANDS: Tuple[Tuple[str, int, int], ...] = (
+    ('minimal', 0, 13),
+    ('mild', 14, 19),
+    ('moderate', 20, 28),
+    ('severe', 29, ITEM_COUNT * ITEM_MASK),
+)
+# 0-based item positions of each subscale.
+COGNITIVE_AFFECTIVE_ITEMS: Tuple[int, ...] = tuple(range(0, 13))
+SOMATIC_ITEMS: Tuple[int, ...] = tuple(range(13, ITEM_COUNT))
+# Given for every score of a row with an item outside 0-3, such as the snapshot's MISSING_SCORE.
+UNSCORED = -1
+
+# The lowest total of every band after the first; a total's band is the count it reaches.
+_BAND_BOUNDARIES: Tuple[int, ...] = tuple(low for _, low, _ in SEVERITY_BANDS[1:])
+# 0 for a cognitive-affective item and 1 for a somatic one, by item position.
+_SUBSCALE_OF: Tuple[int, ...] = tuple(0 if position in COGNITIVE_AFFECTIVE_ITEMS else 1
+                                      for position in range(ITEM_COUNT))
+
+
+class Score(NamedTuple):
+    """
+    The scores of one assessment.
+
+    Attributes:
+        total (int): The sum of the 21 items, or UNSCORED.
+        band (int): The index into SEVERITY_BANDS, or UNSCORED.
+        cognitive_affective (int): The sum of items 1-13, or UNSCORED.
+        somatic (int): The sum of items 14-21, or UNSCORED.
+    """
+    total: int
+    band: int
+    cognitive_affective: int
+    somatic: int
+
+    @property
+    def severity(self) -> str:
+        return severity_label(self.band)
+
+
+class Scores(NamedTuple):
+    """
+    The scores of many assessments, one array element per row.
+
+    Attributes:
+        totals (numpy.ndarray): int16 item totals.
+        bands (numpy.ndarray): int8 indices into SEVERITY_BANDS.
+        cognitive_affective (numpy.ndarray): int16 sums of items 1-13.
+        somatic (numpy.ndarray): int16 sums of items 14-21.
+
+    Rows with an item outside 0-3 are UNSCORED in every array.
+    """
+    totals: object
+    bands: object
+    cognitive_affective: object
+    somatic: object
+
+
+def severity_label(band: int) -> str:
+    """
+    Names a severity band.
+
+    Args:
+        band (int): An index into SEVERITY_BANDS, or UNSCORED.
+
+    Returns:
+        str: The band's label, or 'unscored'.
+    """
+    return SEVERITY_BANDS[band][0] if 0 <= band < len(SEVERITY_BANDS) else 'unscored'
+
+
+def score_matrix(items) -> Scores:
+    """
+    Scores many assessments at once.
+
+    Both subscales come from one matrix product and the total is their sum; bands are found
+    by binary search over the band boundaries.
+
+    Args:
+        items (numpy.ndarray): An (N, 21) integer array of scores in BECK_ITEM_COLUMNS order,
+            such as Snapshot.items.
+
+    Returns:
+        Scores: The totals, bands and subscales.
+
+    Raises:
+        ValueError: If the array does not have 21 columns.
+    """
+    import numpy as np
+
+    items = np.asarray(items)
+    if items.ndim != 2 or items.shape[1] != ITEM_COUNT:
+        raise ValueError(f"Expected an (N, {ITEM_COUNT}) array, got shape {items.shape}")
+    # A float32 product runs on BLAS and is exact for sums this small; integer matrix
+    # products have no BLAS path and are several times slower.
+    weights = np.zeros((ITEM_COUNT, 2), dtype=np.float32)
+    weights[list(COGNITIVE_AFFECTIVE_ITEMS), 0] = 1
+    weights[list(SOMATIC_ITEMS), 1] = 1
+    unscored = ((items < 0) | (items > ITEM_MASK)).any(axis=1)
+    subscales = (items.astype(np.float32) @ weights).astype(np.int16)
+    totals = subscales.sum(axis=1, dtype=np.int16)
+    boundaries = np.array(_BAND_BOUNDARIES, dtype=np.int16)
+    bands = np.searchsorted(boundaries, totals, side='right').astype(np.int8)
+
+    if unscored.any():
+        subscales[unscored] = UNSCORED
+        totals[unscored] = UNSCORED
+        bands[unscored] = UNSCORED
+    return Scores(totals, bands, subscales[:, 0], subscales[:, 1])
+
+
+def score_items(items: Sequence[int]) -> Score:
+    """
+    Scores one assessment with score_matrix.
+
+    Args:
+        items (Sequence[int]): The 21 scores in BECK_ITEM_COLUMNS order.
+
+    Returns:
+        Score: The total, band and subscales.
+
+    Raises:
+        ValueError: If there are not 21 scores.
+    """
+    if len(items) != ITEM_COUNT:
+        raise ValueError(f"Expected {ITEM_COUNT} item scores, got {len(items)}")
+    scores = score_matrix([items])
+    return Score(int(scores.totals[0]), int(scores.bands[0]),
+                 int(scores.cognitive_affective[0]), int(scores.somatic[0]))
+
+
+class RunningScore:
+    """
+    Keeps the scores of one assessment current while its items change one at a time.
+
+    It holds each item's last value and both subscale sums, so a change is applied as a
+    difference in constant time instead of re-reading all 21 items. The results match
+    score_matrix for the same items.
+
+    Example:
+        running = RunningScore()
+        slider.valueChanged.connect(lambda value: show(running.update(position, value)))
+    """
+
+    def __init__(self, items: Sequence[int] = (0,) * ITEM_COUNT) -> None:
+        """
+        Args:
+            items (Sequence[int]): The starting 21 scores in BECK_ITEM_COLUMNS order.
+
+        Raises:
+            ValueError: If there are not 21 scores.
+        """
+        self._items: List[int] = []
+        self._subscales: List[int] = [0, 0]
+        self._out_of_range: int = 0
+        self.reset(items)
+
+    def reset(self, items: Sequence[int]) -> Score:
+        """
+        Replaces every item at once.
+
+        Args:
+            items (Sequence[int]): The 21 scores in BECK_ITEM_COLUMNS order.
+
+        Returns:
+            Score: The scores of the new items.
+
+        Raises:
+            ValueError: If there are not 21 scores.
+        """
+        if len(items) != ITEM_COUNT:
+            raise ValueError(f"Expected {ITEM_COUNT} item scores, got {len(items)}")
+        self._items = [int(value) for value in items]
+        self._subscales = [0, 0]
+        for position, value in enumerate(self._items):
+            self._subscales[_SUBSCALE_OF[position]] += value
+        self._out_of_range = sum(not 0 <= value <= ITEM_MASK for value in self._items)
+        return self.score
+
+    def update(self, position: int, value: int) -> Score:
+        """
+        Changes one item.
+
+        Args:
+            position (int): The 0-based item position in BECK_ITEM_COLUMNS order.
+            value (int): The item's new score.
+
+        Returns:
+            Score: The scores after the change.
+        """
+        previous = self._items[position]
+        self._items[position] = value
+        self._subscales[_SUBSCALE_OF[position]] += value - previous
+        self._out_of_range += (not 0 <= value <= ITEM_MASK) - (not 0 <= previous <= ITEM_MASK)
+        return self.score
+
+    @property
+    def items(self) -> Tuple[int, ...]:
+        return tuple(self._items)
+
+    @property
+    def score(self) -> Score:
+        if self._out_of_range:
+            return Score(UNSCORED, UNSCORED, UNSCORED, UNSCORED)
+        cognitive_affective, somatic = self._subscales
+        total = cognitive_affective + somatic
+        return Score(total, bisect_right(_BAND_BOUNDARIES, total), cognitive_affective, somatic)
@@ -0,0 +1,374 @@
+"""
+Keeps a columnar NumPy copy of the assessment history for analytics.
+
+The snapshot is a directory of three .npy files, in id order, plus a small meta.json:
+
+    ids.npy       int64 (N,)      the assessment ids
+    beck_ts.npy   int64 (N,)      the wall-clock moments, see database.storage.to_beck_ts
+    items.npy     uint8 (N, 21)   the item scores in BECK_ITEM_COLUMNS order
+
+open_snapshot maps the files read-only, so analytics code gets arrays without copying or
+querying SQLite. update_snapshot brings them up to date: it appends the rows whose id is past
+the last one exported, read from the live table and the packed archive in id windows and
+written in place after the existing data. A checksum of the rows already exported is compared
+first, and if an edit, delete or restore changed any of them the snapshot is rebuilt instead.
+The meta file is replaced last, so readers never see more rows than were completely written.
+
+Run headless from the BECK Ver8_12 directory, without Qt:
+
+    python -m database.snapshot
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import tracker_config as tkc
+from database.beck_columns import BECK_ITEM_COLUMNS
+from database.packed_items import ITEM_BITS, ITEM_COUNT, ITEM_MASK, unpack_array
+from database.sqlite_storage import SqliteStorage
+from database.storage import StorageBackend
+from logger_setup import get_logger
+
+logger = get_logger(__name__)
+
+SNAPSHOT_VERSION = 2
+META_FILE = 'meta.json'
+# Array file name: (NumPy dtype, shape of one row).
+SNAPSHOT_ARRAYS: Dict[str, Tuple[str, Tuple[int, ...]]] = {
+    'ids': ('<i8', ()),
+    'beck_ts': ('<i8', ()),
+    'items': ('|u1', (ITEM_COUNT,)),
+}
+# Stored for a NULL or out-of-range item score and for a missing beck_ts.
+MISSING_SCORE = 255
+MISSING_TS = -2 ** 63
+# The row hash of _CHECKSUM_SQL; every intermediate value stays within SQLite's 64-bit integers.
+CHECKSUM_MODULUS = 2147483647
+CHECKSUM_MULTIPLIER = 48271
+CHECKSUM_OFFSET = 12345
+
+# SQLite reads the literal 9223372036854775808 as a float, so -2**63 is written as a difference.
+_MISSING_TS_SQL = f"({MISSING_TS + 1} - 1)"
+
+_SCORES = ', '.join(str(score) for score in range(ITEM_MASK + 1))
+_LIVE_ITEMS = [f"CASE WHEN {column} IN ({_SCORES}) THEN {column} ELSE {MISSING_SCORE} END"
+               for column in BECK_ITEM_COLUMNS]
+_LIVE_PACKED = ' + '.join(f"({item} << {ITEM_BITS * position})" for position, item in enumerate(_LIVE_ITEMS))
+# Each row is hashed on its own, from its id, beck_ts and packed items, and the hashes are
+# summed. The hash folds the values in with a multiplier and then squares the result modulo a
+# prime, so its change is not linear in the values: edits that cancel out in a plain sum, such
+# as swapping two rows' values or moving one point between items or between rows, still change
+# the total. The same row hashes the same whether it is live or archived.
+_CHECKSUM_SQL = f"""SELECT count(*) AS n, ifnull(sum(x * (x + {CHECKSUM_OFFSET}) % {CHECKSUM_MODULUS}), 0) AS checksum FROM (
+    SELECT ((id % {CHECKSUM_MODULUS} * {CHECKSUM_MULTIPLIER}
+             + (beck_ts % {CHECKSUM_MODULUS} + {CHECKSUM_MODULUS}) % {CHECKSUM_MODULUS}) % {CHECKSUM_MODULUS}
+            * {CHECKSUM_MULTIPLIER} + beck_items % {CHECKSUM_MODULUS}) % {CHECKSUM_MODULUS} AS x
+    FROM (
+        SELECT id, ifnull(beck_ts, {_MISSING_TS_SQL}) AS beck_ts, {_LIVE_PACKED} AS beck_items
+        FROM beck_table_aug_8 WHERE id > ? AND id <= ?
+        UNION ALL
+        SELECT id, beck_ts, beck_items
+        FROM beck_archive_packed WHERE id > ? AND id <= ?))"""
+
+
+class Snapshot(NamedTuple):
+    """
+    A snapshot opened by open_snapshot. The arrays are read-only memory maps.
+
+    Attributes:
+        ids (numpy.ndarray): The assessment ids, ascending.
+        beck_ts (numpy.ndarray): The moment of each assessment, MISSING_TS if it had none.
+        items (numpy.ndarray): The (N, 21) item scores, MISSING_SCORE where a score was
+            NULL or outside 0-3.
+        last_id (int): The highest id exported, which may be deleted since.
+    """
+    ids: Any
+    beck_ts: Any
+    items: Any
+    last_id: int
+
+    @property
+    def summaries(self):
+        """The item totals, computed from items."""
+        return self.items.sum(axis=1, dtype='int64')
+
+
+class SnapshotUpdate(NamedTuple):
+    """
+    The outcome of one update_snapshot call.
+
+    Attributes:
+        directory (str): The snapshot directory.
+        rows (int): The rows the snapshot holds now.
+        appended (int): The rows written by this update.
+        rebuilt (bool): Whether the snapshot was written from scratch.
+        seconds (float): The time the update took.
+    """
+    directory: str
+    rows: int
+    appended: int
+    rebuilt: bool
+    seconds: float
+
+
+def default_snapshot_directory() -> str:
+    return str(Path.home() / tkc.SNAPSHOT_DIR)
+
+
+def _read_meta(directory: str) -> Optional[Dict[str, int]]:
+    try:
+        with open(os.path.join(directory, META_FILE), encoding='utf-8') as meta_file:
+            meta = json.load(meta_file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(meta, dict) or meta.get('version') != SNAPSHOT_VERSION:
+        return None
+    if not all(isinstance(meta.get(key), int) for key in ('rows', 'last_id', 'checksum')):
+        return None
+    return meta
+
+
+def _write_meta(directory: str, meta: Dict[str, int]) -> None:
+    partial = os.path.join(directory, f"{META_FILE}.part")
+    with open(partial, 'w', encoding='utf-8') as meta_file:
+        json.dump(meta, meta_file)
+    os.replace(partial, os.path.join(directory, META_FILE))
+
+
+def _header(dtype: str, shape: Tuple[int, ...]) -> bytes:
+    import numpy as np
+
+    header = io.BytesIO()
+    np.lib.format.write_array_header_1_0(header, {'descr': dtype, 'fortran_order': False, 'shape': shape})
+    return header.getvalue()
+
+
+def _append_array(path: str, dtype: str, row_shape: Tuple[int, ...], rows_before: int, values) -> None:
+    """
+    Appends rows to an .npy file that holds at least rows_before rows.
+
+    The data goes after the first rows_before rows, dropping anything an interrupted update
+    left beyond them, and then the header is rewritten in place with the new row count. NumPy
+    pads headers so the count can grow without moving the data; if it ever cannot, the file is
+    rewritten instead.
+    """
+    import numpy as np
+
+    values = np.ascontiguousarray(values, dtype=dtype)
+    if rows_before == 0:
+        # A new file, not a truncated one, so arrays mapped from the old file stay readable.
+        if os.path.exists(path):
+            os.remove(path)
+        with open(path, 'wb') as array_file:
+            array_file.write(_header(dtype, values.shape))
+            array_file.write(values.tobytes())
+        return
+
+    row_bytes = np.dtype(dtype).itemsize * int(np.prod(row_shape, dtype=np.int64))
+    rows = rows_before + len(values)
+    with open(path, 'r+b') as array_file:
+        version = np.lib.format.read_magic(array_file)
+        if version != (1, 0):
+            raise ValueError(f"{path} has .npy format version {version}, expected (1, 0)")
+        shape, _, stored_dtype = np.lib.format.read_array_header_1_0(array_file)
+        data_start = array_file.tell()
+        if stored_dtype != np.dtype(dtype) or shape[1:] != row_shape or shape[0] < rows_before:
+            raise ValueError(f"{path} holds {stored_dtype} {shape}, not {rows_before} rows of {dtype}")
+        header = _header(dtype, (rows,) + row_shape)
+        if len(header) == data_start:
+            array_file.truncate(data_start + rows_before * row_bytes)
+            array_file.seek(0, os.SEEK_END)
+            array_file.write(values.tobytes())
+            array_file.seek(0)
+            array_file.write(header)
+            return
+        array_file.seek(data_start)
+        existing = array_file.read(rows_before * row_bytes)
+    partial = f"{path}.part"
+    with open(partial, 'wb') as array_file:
+        array_file.write(header)
+        array_file.write(existing)
+        array_file.write(values.tobytes())
+    os.replace(partial, path)
+
+
+def _empty(dtype: str, row_shape: Tuple[int, ...]):
+    import numpy as np
+
+    return np.empty((0,) + row_shape, dtype=dtype)
+
+
+def _read_window(storage: StorageBackend, after: int, through: int):
+    """
+    Reads the live and archived rows with ids in (after, through] as id-ordered arrays.
+    """
+    import numpy as np
+
+    _, live = storage.stream(f"""SELECT id, ifnull(beck_ts, {_MISSING_TS_SQL}), {', '.join(_LIVE_ITEMS)}
+    FROM beck_table_aug_8 WHERE id > ? AND id <= ? ORDER BY id""", (after, through))
+    live_rows = np.array(list(live), dtype=np.int64).reshape(-1, 2 + ITEM_COUNT)
+    _, archived = storage.stream("""SELECT id, beck_ts, beck_items
+    FROM beck_archive_packed WHERE id > ? AND id <= ? ORDER BY id""", (after, through))
+    archived_rows = np.array(list(archived), dtype=np.int64).reshape(-1, 3)
+
+    ids = np.concatenate((live_rows[:, 0], archived_rows[:, 0]))
+    beck_ts = np.concatenate((live_rows[:, 1], archived_rows[:, 1]))
+    items = np.concatenate((live_rows[:, 2:].astype(np.uint8), unpack_array(archived_rows[:, 2])))
+    order = np.argsort(ids, kind='stable')
+    return ids[order], beck_ts[order], items[order]
+
+
+def _checksum(storage: StorageBackend, after: int, through: int) -> Tuple[int, int]:
+    row = storage.fetch_all(_CHECKSUM_SQL, (after, through, after, through))[0]
+    return row['n'], row['checksum']
+
+
+def update_snapshot(storage: StorageBackend,
+                    directory: Optional[str] = None,
+                    verify: bool = True,
+                    window: int = tkc.SNAPSHOT_WINDOW_IDS) -> SnapshotUpdate:
+    """
+    Appends the assessments added since the last update to the snapshot, creating it if needed.
+
+    Args:
+        storage (StorageBackend): The open connection to read from, Qt or sqlite3.
+        directory (Optional[str]): The snapshot directory, created if missing. Defaults to
+            SNAPSHOT_DIR in the home directory.
+        verify (bool): Whether to checksum the rows already exported and rebuild the snapshot
+            if they changed. This reads every exported row once, inside SQLite; skip it only
+            when rows are never edited or deleted.
+        window (int): The span of ids read and appended at a time, which bounds memory use.
+
+    Returns:
+        SnapshotUpdate: The row counts, whether it was rebuilt and the elapsed seconds.
+
+    Raises:
+        RuntimeError: If reading the rows or writing the files fails.
+    """
+    directory = directory or default_snapshot_directory()
+    started = time.perf_counter()
+    try:
+        storage.begin()
+    except RuntimeError as e:
+        raise RuntimeError(f"Error starting snapshot transaction: {e}") from e
+    try:
+        os.makedirs(directory, exist_ok=True)
+        meta = _read_meta(directory)
+        if meta is not None and verify:
+            if _checksum(storage, 0, meta['last_id']) != (meta['rows'], meta['checksum']):
+                logger.info("Rows exported to the snapshot in %s changed, rebuilding it", directory)
+                meta = None
+        rebuilt = meta is None
+        if meta is None:
+            # Readers must not pair an old meta file with arrays that are being rewritten.
+            if os.path.exists(os.path.join(directory, META_FILE)):
+                os.remove(os.path.join(directory, META_FILE))
+            meta = {'version': SNAPSHOT_VERSION, 'rows': 0, 'last_id': 0, 'checksum': 0}
+
+        rows, last_id, checksum = meta['rows'], meta['last_id'], meta['checksum']
+        after = last_id
+        while True:
+            next_id = storage.fetch_value("""SELECT min(id) FROM (
+            SELECT min(id) AS id FROM beck_table_aug_8 WHERE id > ?
+            UNION ALL
+            SELECT min(id) FROM beck_archive_packed WHERE id > ?)""", (after, after))
+            if next_id is None:
+                break
+            through = next_id - 1 + window
+            ids, beck_ts, items = _read_window(storage, after, through)
+            for name, values in (('ids', ids), ('beck_ts', beck_ts), ('items', items)):
+                dtype, row_shape = SNAPSHOT_ARRAYS[name]
+                _append_array(os.path.join(directory, f"{name}.npy"), dtype, row_shape, rows, values)
+            n, window_checksum = _checksum(storage, after, through)
+            rows += n
+            checksum += window_checksum
+            last_id = int(ids[-1])
+            after = through
+        if rebuilt and rows == 0:
+            for name, (dtype, row_shape) in SNAPSHOT_ARRAYS.items():
+                _append_array(os.path.join(directory, f"{name}.npy"), dtype, row_shape, 0,
+                              _empty(dtype, row_shape))
+        _write_meta(directory, {'version': SNAPSHOT_VERSION, 'rows': rows, 'last_id': last_id,
+                                'checksum': checksum})
+    except (OSError, ValueError, RuntimeError) as e:
+        error_message = f"Error updating the snapshot in {directory}: {e}"
+        logger.error(error_message)
+        raise RuntimeError(error_message) from e
+    finally:
+        storage.rollback()  # nothing was written; this only ends the read transaction
+
+    result = SnapshotUpdate(directory, rows, rows - meta['rows'], rebuilt, time.perf_counter() - started)
+    logger.info("Snapshot in %s updated: %s rows appended, %s in total, %s%.2f s",
+                directory, result.appended, result.rows, 'rebuilt, ' if rebuilt else '', result.seconds)
+    return result
+
+
+def open_snapshot(directory: Optional[str] = None) -> Snapshot:
+    """
+    Maps a snapshot written by update_snapshot, without copying it into memory.
+
+    Args:
+        directory (Optional[str]): The snapshot directory. Defaults to SNAPSHOT_DIR in the
+            home directory.
+
+    Returns:
+        Snapshot: Read-only arrays of the rows the last completed update wrote.
+
+    Raises:
+        RuntimeError: If there is no snapshot or its files do not match its meta file.
+    """
+    import numpy as np
+
+    directory = directory or default_snapshot_directory()
+    meta = _read_meta(directory)
+    if meta is None:
+        error_message = f"No snapshot in {directory}; run update_snapshot first"
+        logger.error(error_message)
+        raise RuntimeError(error_message)
+    arrays = {}
+    for name, (dtype, row_shape) in SNAPSHOT_ARRAYS.items():
+        path = os.path.join(directory, f"{name}.npy")
+        try:
+            # An empty array cannot be memory-mapped; there is nothing to copy either way.
+            array = np.load(path, mmap_mode='r' if meta['rows'] else None)
+        except (OSError, ValueError) as e:
+            error_message = f"Error opening snapshot file {path}: {e}"
+            logger.error(error_message)
+            raise RuntimeError(error_message) from e
+        if array.dtype != np.dtype(dtype) or array.shape[1:] != row_shape or len(array) < meta['rows']:
+            error_message = f"Snapshot file {path} holds {array.dtype} {array.shape}, expected {meta['rows']} rows"
+            logger.error(error_message)
+            raise RuntimeError(error_message)
+        # Rows past meta['rows'] belong to an update that has not finished.
+        arrays[name] = array[:meta['rows']]
+    return Snapshot(arrays['ids'], arrays['beck_ts'], arrays['items'], meta['last_id'])
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--db', default=os.path.join(os.path.expanduser('~'), tkc.DB_NAME),
+                        help='database to read (default: %(default)s)')
+    parser.add_argument('--dir', default=default_snapshot_directory(),
+                        help='snapshot directory (default: %(default)s)')
+    parser.add_argument('--no-verify', action='store_true',
+                        help='append without checking that exported rows are unchanged')
+    args = parser.parse_args(argv)
+
+    try:
+        with SqliteStorage(args.db, connection_name='snapshot', profile='read-only analytics') as storage:
+            result = update_snapshot(storage, args.dir, verify=not args.no_verify)
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return 1
+    print(f"{result.directory}: {result.appended} rows appended, {result.rows} in total"
+          f"{' (rebuilt)' if result.rebuilt else ''}, {result.seconds:.2f} s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
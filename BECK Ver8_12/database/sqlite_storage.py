@@ -0,0 +1,155 @@
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import tracker_config as tkc
+from database.connection_profiles import apply_profile, get_profile
+from database.migrations import MigrationProgress
+from database.storage import StorageBackend
+from logger_setup import get_logger
+
+logger = get_logger(__name__)
+
+
+class SqliteStorage(StorageBackend):
+    """
+    The storage backend on the standard library sqlite3 module.
+
+    It reads and writes the same database file as DataManager, with the same migrations,
+    profiles and queries, but imports no Qt, so batch jobs, analytics scripts and tests need
+    neither a QCoreApplication nor the QtSql plugin. Like a QSqlDatabase, a connection may
+    only be used from the thread that opened it.
+
+    Example:
+        storage = SqliteStorage(profile='read-only analytics')
+        try:
+            points = storage.trend('month', date(2024, 1, 1), date(2025, 1, 1))
+        finally:
+            storage.close()
+    """
+
+    def __init__(self,
+                 db_name: Optional[str] = None,
+                 connection_name: str = 'sqlite3',
+                 migration_progress: Optional[MigrationProgress] = None,
+                 profile: str = tkc.DB_CONNECTION_PROFILE) -> None:
+        """
+        Opens the database, applies the connection profile and migrates the schema.
+
+        Args:
+            db_name (Optional[str]): The path to the SQLite database file. Defaults to the
+                GUI's database in the home directory.
+            connection_name (str): The name the connection is logged under.
+            migration_progress (Optional[MigrationProgress]): Called while long migrations
+                rewrite data.
+            profile (str): The connection profile to apply, one of
+                database.connection_profiles.PROFILES. A read-only profile needs a database
+                that is already migrated.
+
+        Raises:
+            ValueError: If the profile is unknown.
+            RuntimeError: If the database cannot be opened, configured or migrated.
+        """
+        if db_name is None:
+            db_name = str(Path.home() / tkc.DB_NAME)
+        self.connection_name = connection_name
+        self.migration_progress = migration_progress
+        self.profile = get_profile(profile)
+        try:
+            # Autocommit mode: transactions are only the explicit begin/commit calls, as with
+            # QSqlDatabase, instead of sqlite3 opening one implicitly before every write.
+            if self.profile.read_only:
+                self._connection = sqlite3.connect(
+                    f"{Path(db_name).resolve().as_uri()}?mode=ro", uri=True,
+                    timeout=tkc.DB_BUSY_TIMEOUT_MS / 1000, isolation_level=None,
+                    cached_statements=tkc.STATEMENT_CACHE_SIZE)
+            else:
+                self._connection = sqlite3.connect(
+                    db_name, timeout=tkc.DB_BUSY_TIMEOUT_MS / 1000, isolation_level=None,
+                    cached_statements=tkc.STATEMENT_CACHE_SIZE)
+        except sqlite3.Error as e:
+            error_message = f"Error: Unable to open database {db_name}: {e}"
+            logger.error(error_message)
+            raise RuntimeError(error_message) from e
+        try:
+            self.settings: Dict[str, str] = apply_profile(self, self.profile)
+            self.setup_tables()
+        except RuntimeError:
+            self._connection.close()
+            raise
+
+    def __enter__(self) -> 'SqliteStorage':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def execute(self, sql: str, bind_values: Sequence[Any] = ()) -> int:
+        try:
+            cursor = self._connection.execute(sql, bind_values)
+        except sqlite3.ProgrammingError as e:
+            raise ValueError(str(e)) from e
+        except sqlite3.Error as e:
+            raise RuntimeError(str(e)) from e
+        affected = cursor.rowcount
+        cursor.close()
+        return affected
+
+    def execute_batch(self, sql: str, rows: Sequence[Sequence[Any]]) -> int:
+        try:
+            self._connection.executemany(sql, rows).close()
+            return self._connection.execute("SELECT last_insert_rowid()").fetchone()[0]
+        except sqlite3.Error as e:
+            raise RuntimeError(str(e)) from e
+
+    def fetch_all(self, sql: str, bind_values: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        try:
+            cursor = self._connection.execute(sql, bind_values)
+            rows = cursor.fetchall()
+        except sqlite3.ProgrammingError as e:
+            raise ValueError(str(e)) from e
+        except sqlite3.Error as e:
+            raise RuntimeError(str(e)) from e
+        columns = [description[0] for description in cursor.description or ()]
+        return [dict(zip(columns, row)) for row in rows]
+
+    def stream(self,
+               sql: str,
+               bind_values: Sequence[Any] = (),
+               batch_size: int = tkc.EXPORT_BATCH_ROWS) -> Tuple[List[str], Iterator[Tuple[Any, ...]]]:
+        try:
+            cursor = self._connection.execute(sql, bind_values)
+        except sqlite3.Error as e:
+            raise RuntimeError(str(e)) from e
+        columns = [description[0] for description in cursor.description or ()]
+
+        def rows() -> Iterator[Tuple[Any, ...]]:
+            try:
+                while True:
+                    batch = cursor.fetchmany(batch_size)
+                    if not batch:
+                        return
+                    yield from batch
+            except sqlite3.Error as e:
+                raise RuntimeError(str(e)) from e
+            finally:
+                cursor.close()
+
+        return columns, rows()
+
+    def begin(self) -> None:
+        self.execute("BEGIN")
+
+    def commit(self) -> None:
+        self.execute("COMMIT")
+
+    def rollback(self) -> None:
+        if self._connection.in_transaction:
+            self._connection.execute("ROLLBACK")
+
+    def has_column(self, table: str, column: str) -> bool:
+        return any(row['name'] == column for row in self.fetch_all(f"PRAGMA table_info({table})"))
+
+    def close(self) -> None:
+        self._connection.close()
+        logger.info("Connection %s closed", self.connection_name)
@@ -0,0 +1,117 @@
+from collections import OrderedDict
+from typing import Dict, Iterable, Tuple
+
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+
+import tracker_config as tkc
+from logger_setup import get_logger
+
+logger = get_logger(__name__)
+
+
+class StatementCache:
+    """
+    A least-recently-used cache of prepared queries on one connection, keyed by SQL text.
+
+    Preparing a statement makes SQLite parse and plan it; a cached query skips that and is
+    only re-bound and executed. Queries belong to the connection they were prepared on, so
+    every connection needs its own cache, and it must be cleared before the connection is
+    closed. Cached queries are forward-only: results are read once, in order.
+
+    Attributes:
+        hits (int): The number of prepare calls served from the cache.
+        misses (int): The number of prepare calls that had to prepare a new query.
+        evictions (int): The number of queries dropped to stay within capacity.
+    """
+
+    def __init__(self, db: QSqlDatabase, capacity: int = tkc.STATEMENT_CACHE_SIZE) -> None:
+        """
+        Initializes an empty cache.
+
+        Args:
+            db (QSqlDatabase): The connection queries are prepared on.
+            capacity (int): The maximum number of prepared queries kept.
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self._db = db
+        self.capacity = capacity
+        self._queries: 'OrderedDict[str, Tuple[QSqlQuery, int]]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+    def __contains__(self, sql: str) -> bool:
+        return sql in self._queries
+
+    def prepare(self, sql: str, bind_values: Iterable[object] = ()) -> QSqlQuery:
+        """
+        Returns a prepared query for the SQL text with fresh bind values.
+
+        A cached query is finished first, so a result set left unread from its last use
+        doesn't hold a read transaction open.
+
+        Args:
+            sql (str): The statement, with '?' placeholders.
+            bind_values (Iterable[object]): One value per placeholder, or one list per
+                placeholder for QSqlQuery.execBatch. When empty, the caller binds them.
+
+        Returns:
+            QSqlQuery: The prepared query, ready to execute.
+
+        Raises:
+            ValueError: If the number of bind values doesn't match the placeholders.
+            RuntimeError: If the statement cannot be prepared.
+        """
+        entry = self._queries.get(sql)
+        if entry is None:
+            self.misses += 1
+            query = QSqlQuery(self._db)
+            query.setForwardOnly(True)
+            if not query.prepare(sql):
+                error_message = f"Error preparing statement: {query.lastError().text()}"
+                logger.error(error_message)
+                raise RuntimeError(error_message)
+            entry = (query, sql.count('?'))
+            self._queries[sql] = entry
+            if len(self._queries) > self.capacity:
+                _, (evicted, _) = self._queries.popitem(last=False)
+                evicted.finish()
+                self.evictions += 1
+        else:
+            self.hits += 1
+            self._queries.move_to_end(sql)
+            entry[0].finish()
+
+        query, placeholders = entry
+        values = list(bind_values)
+        if values:
+            if len(values) != placeholders:
+                raise ValueError(f"Expected {placeholders} bind values, got {len(values)}")
+            for index, value in enumerate(values):
+                query.bindValue(index, value)
+        return query
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the cache's counters.
+
+        Returns:
+            Dict[str, int]: The 'size', 'capacity', 'hits', 'misses' and 'evictions'.
+        """
+        return {'size': len(self._queries), 'capacity': self.capacity, 'hits': self.hits,
+                'misses': self.misses, 'evictions': self.evictions}
+
+    def clear(self) -> None:
+        """
+        Finishes and drops every cached query, keeping the counters.
+        """
+        for query, _ in self._queries.values():
+            query.finish()
+        self._queries.clear()
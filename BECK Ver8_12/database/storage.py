@@ -0,0 +1,561 @@
+# The storage interface shared by DataManager (QtSql) and SqliteStorage (the standard library
+# sqlite3 module). A backend supplies the connection primitives - execute, execute_batch,
+# fetch_all, stream and the transaction calls - and inherits every assessment query, the
+# migrations and the connection profiles on top of them, so both read and write the same
+# database file the same way. Nothing here imports Qt.
+import calendar
+import math
+import time
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+
+import tracker_config as tkc
+from database.beck_columns import BECK_FORM_COLUMNS, BECK_INSERT_COLUMNS
+from database.connection_profiles import ConnectionProfile
+from database.migrations import MigrationProgress, migrate
+from database.packed_items import pack_items_sql, packable_row_sql
+from database.rollups import ROLLUP_GRANULARITIES, ROLLUP_METRICS, bucket_sql, read_sql, refresh_sql
+from logger_setup import get_logger
+
+logger = get_logger(__name__)
+
+BeckRecord = Union[Sequence[Union[str, int]], Mapping[str, Union[str, int]]]
+Moment = Union[int, datetime, date]
+
+INSERT_SQL: str = f"""INSERT INTO beck_table_aug_8({', '.join(BECK_INSERT_COLUMNS)})
+        VALUES ({', '.join('?' * len(BECK_INSERT_COLUMNS))})"""
+
+
+def beck_timestamp(beck_date: str, beck_time: str) -> Optional[int]:
+    """
+    Converts the stored date and time text into the value of the beck_ts column.
+
+    beck_ts counts seconds since 1970-01-01 of the wall-clock date and time, without time zone
+    conversion, exactly as SQLite's strftime('%s', beck_date || ' ' || beck_time) does.
+
+    Args:
+        beck_date (str): The date as "yyyy-MM-dd".
+        beck_time (str): The time as "hh:mm:ss".
+
+    Returns:
+        Optional[int]: The timestamp, or None if the text is not a valid date and time.
+    """
+    try:
+        moment = datetime.strptime(f"{beck_date} {beck_time}", "%Y-%m-%d %H:%M:%S")
+    except (TypeError, ValueError):
+        return None
+    return calendar.timegm(moment.timetuple())
+
+
+def to_beck_ts(moment: Moment) -> int:
+    """
+    Converts a range bound into the beck_ts scale.
+
+    Args:
+        moment (Moment): A beck_ts value, a naive datetime, or a date (meaning its midnight).
+
+    Returns:
+        int: The equivalent beck_ts value.
+    """
+    if isinstance(moment, date):  # datetime is a date subclass; a plain date means midnight
+        return calendar.timegm(moment.timetuple())
+    return int(moment)
+
+
+class ChunkTiming(NamedTuple):
+    """
+    Timing of one batch chunk written by StorageBackend.insert_many.
+
+    The rows of a chunk receive the consecutive ids last_id - rows + 1 through last_id, since
+    the AUTOINCREMENT table is written by a single connection inside one transaction.
+    """
+    rows: int
+    seconds: float
+    last_id: int
+
+
+def _chunked(records: Iterable[BeckRecord], chunk_size: int) -> Iterator[List[BeckRecord]]:
+    """
+    Yields successive lists of at most chunk_size records without materialising the whole iterable.
+
+    Args:
+        records (Iterable[BeckRecord]): The records to split.
+        chunk_size (int): The maximum number of records per chunk.
+
+    Yields:
+        List[BeckRecord]: The next chunk of records.
+    """
+    iterator = iter(records)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _record_values(record: BeckRecord) -> Sequence[Union[str, int]]:
+    """
+    Normalises an assessment record into the column order of BECK_INSERT_COLUMNS.
+
+    Records that leave out beck_ts get it computed from their date and time text.
+
+    Args:
+        record (BeckRecord): Either a mapping keyed by column name or a sequence in
+            BECK_INSERT_COLUMNS or BECK_FORM_COLUMNS order.
+
+    Returns:
+        Sequence[Union[str, int]]: The values in insert column order.
+
+    Raises:
+        ValueError: If the record does not provide exactly one value per column.
+    """
+    if isinstance(record, Mapping):
+        missing = [column for column in BECK_FORM_COLUMNS if column not in record]
+        if missing:
+            raise ValueError(f"Record is missing columns: {', '.join(missing)}")
+        values = [record[column] for column in BECK_FORM_COLUMNS]
+        values.append(record.get('beck_ts'))
+    elif len(record) == len(BECK_INSERT_COLUMNS):
+        return record
+    elif len(record) == len(BECK_FORM_COLUMNS):
+        values = list(record) + [None]
+    else:
+        raise ValueError(f"Expected {len(BECK_INSERT_COLUMNS)} values per record, got {len(record)}")
+    if values[-1] is None:
+        values[-1] = beck_timestamp(values[0], values[1])
+    return values
+
+
+class StorageBackend(ABC):
+    """
+    An open connection to the tracker database and the queries run on it.
+
+    Subclasses open the connection, apply their profile with apply_profile and call
+    setup_tables. Their primitives raise RuntimeError carrying the driver's error text and
+    leave logging to the queries built on them.
+
+    Attributes:
+        connection_name (str): The name the connection is logged under.
+        profile (ConnectionProfile): The connection profile in effect.
+        settings (Dict[str, str]): The effective value of every PRAGMA in the profile.
+        migration_progress (Optional[MigrationProgress]): Called while long migrations
+            rewrite data.
+    """
+    connection_name: str
+    profile: ConnectionProfile
+    settings: Dict[str, str]
+    migration_progress: Optional[MigrationProgress] = None
+
+    @abstractmethod
+    def execute(self, sql: str, bind_values: Sequence[Any] = ()) -> int:
+        """
+        Runs a statement whose result rows, if any, are not needed.
+
+        Args:
+            sql (str): The statement, with '?' placeholders.
+            bind_values (Sequence[Any]): One value per placeholder.
+
+        Returns:
+            int: The number of rows the statement changed.
+
+        Raises:
+            ValueError: If the number of bind values doesn't match the placeholders.
+            RuntimeError: If the statement fails.
+        """
+
+    @abstractmethod
+    def execute_batch(self, sql: str, rows: Sequence[Sequence[Any]]) -> int:
+        """
+        Runs a prepared statement once per row of bind values.
+
+        Args:
+            sql (str): The statement, with '?' placeholders.
+            rows (Sequence[Sequence[Any]]): One sequence of bind values per execution.
+
+        Returns:
+            int: The last inserted row id.
+
+        Raises:
+            RuntimeError: If an execution fails.
+        """
+
+    @abstractmethod
+    def fetch_all(self, sql: str, bind_values: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        """
+        Runs a query and reads every result row.
+
+        Args:
+            sql (str): The query, with '?' placeholders.
+            bind_values (Sequence[Any]): One value per placeholder.
+
+        Returns:
+            List[Dict[str, Any]]: One mapping of column name to value per row; NULL is None.
+
+        Raises:
+            ValueError: If the number of bind values doesn't match the placeholders.
+            RuntimeError: If the query fails.
+        """
+
+    @abstractmethod
+    def stream(self,
+               sql: str,
+               bind_values: Sequence[Any] = (),
+               batch_size: int = tkc.EXPORT_BATCH_ROWS) -> Tuple[List[str], Iterator[Tuple[Any, ...]]]:
+        """
+        Runs a query and returns its rows lazily, so reading any number of them takes
+        constant memory. The query is a single statement, so the rows are one consistent
+        snapshot even while other connections write.
+
+        Args:
+            sql (str): The query, with '?' placeholders.
+            bind_values (Sequence[Any]): One value per placeholder.
+            batch_size (int): The number of rows the driver is asked for at a time.
+
+        Returns:
+            Tuple[List[str], Iterator[Tuple[Any, ...]]]: The column names and an iterator
+            over the rows; NULL is None. The statement is released once the iterator is
+            exhausted or closed.
+
+        Raises:
+            RuntimeError: If the query fails.
+        """
+
+    @abstractmethod
+    def begin(self) -> None:
+        """
+        Starts a transaction.
+
+        Raises:
+            RuntimeError: If the transaction cannot be started.
+        """
+
+    @abstractmethod
+    def commit(self) -> None:
+        """
+        Commits the open transaction.
+
+        Raises:
+            RuntimeError: If the commit fails.
+        """
+
+    @abstractmethod
+    def rollback(self) -> None:
+        """
+        Rolls back the open transaction.
+        """
+
+    @abstractmethod
+    def has_column(self, table: str, column: str) -> bool:
+        """
+        Returns whether a table or view has a column.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Closes the connection if it is open.
+        """
+
+    def fetch_value(self, sql: str, bind_values: Sequence[Any] = ()) -> Any:
+        """
+        Runs a query and returns the first column of its first row.
+
+        Args:
+            sql (str): The query, with '?' placeholders.
+            bind_values (Sequence[Any]): One value per placeholder.
+
+        Returns:
+            Any: The value, or None if the query returned no rows.
+
+        Raises:
+            RuntimeError: If the query fails.
+        """
+        rows = self.fetch_all(sql, bind_values)
+        return next(iter(rows[0].values())) if rows else None
+
+    def setup_tables(self) -> None:
+        """
+        Sets up the necessary tables in the database.
+
+        This method runs every pending schema migration; on a current database it only reads
+        PRAGMA user_version.
+
+        Raises:
+            RuntimeError: If a migration fails.
+        """
+        migrate(self, self.migration_progress)
+
+    def insert_into_beck_table_aug_8(self,
+                               beck_date: str,
+                               beck_time: str,
+                               b_slider: int,
+                               b_slider_2: int,
+                               b_slider_3: int,
+                               b_slider_4: int,
+                               b_slider_5: int,
+                               b_slider_6: int,
+                               b_slider_7: int,
+                               b_slider_8: int,
+                               b_slider_9: int,
+                               b_slider_10: int,
+                               b_slider_11: int,
+                               b_slider_12: int,
+                               b_slider_13: int,
+                               b_slider_14: int,
+                               b_slider_15: int,
+                               b_slider_16: int,
+                               b_slider_17: int,
+                               b_slider_18: int,
+                               b_slider_19: int,
+                               b_slider_20: int,
+                               b_slider_21: int,
+                               beck_summary: int,
+                               beck_ts: Optional[int] = None
+                               ) -> None:
+        if beck_ts is None:
+            beck_ts = beck_timestamp(beck_date, beck_time)
+        bind_values: List[Union[str, int]] = [
+            beck_date, beck_time, b_slider, b_slider_2, b_slider_3, b_slider_4, b_slider_5, b_slider_6,
+            b_slider_7, b_slider_8, b_slider_9, b_slider_10, b_slider_11, b_slider_12,
+            b_slider_13, b_slider_14, b_slider_15, b_slider_16, b_slider_17, b_slider_18,
+            b_slider_19, b_slider_20, b_slider_21, beck_summary, beck_ts
+        ]
+        try:
+            self.execute(INSERT_SQL, bind_values)
+        except ValueError as e:
+            logger.error("ValueError beck_table_aug_8: %s", e)
+        except RuntimeError as e:
+            logger.error("Error inserting data: beck_table_aug_8 - %s", e)
+        except Exception as e:
+            logger.error("Error during data insertion: beck_table_aug_8 %s", e, exc_info=True)
+
+    def insert_many(self,
+                    records: Iterable[BeckRecord],
+                    chunk_size: int = tkc.BULK_INSERT_CHUNK_SIZE) -> List[ChunkTiming]:
+        """
+        Inserts many assessment records into 'beck_table_aug_8' inside a single transaction.
+
+        The INSERT is prepared once and written with execute_batch, chunk_size records at a
+        time, so the whole import costs one commit instead of one per row. Either every record
+        is written or none are.
+
+        Args:
+            records (Iterable[BeckRecord]): Mappings keyed by column name or sequences in
+                BECK_INSERT_COLUMNS order; beck_ts may be left out and is then computed.
+                The iterable is consumed lazily.
+            chunk_size (int): The maximum number of records written per execute_batch call.
+
+        Returns:
+            List[ChunkTiming]: The row count, elapsed seconds and last inserted id of every
+            chunk written.
+
+        Raises:
+            ValueError: If chunk_size is not positive or a record is malformed.
+            RuntimeError: If the transaction or a batch execution fails.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        try:
+            self.begin()
+        except RuntimeError as e:
+            error_message = f"Error starting bulk insert transaction: {e}"
+            logger.error(error_message)
+            raise RuntimeError(error_message) from e
+
+        timings: List[ChunkTiming] = []
+        try:
+            for chunk in _chunked(records, chunk_size):
+                started = time.perf_counter()
+                rows = [_record_values(record) for record in chunk]
+                try:
+                    last_id = self.execute_batch(INSERT_SQL, rows)
+                except RuntimeError as e:
+                    raise RuntimeError(f"Error inserting batch: beck_table_aug_8 - {e}") from e
+                timings.append(ChunkTiming(len(chunk), time.perf_counter() - started, last_id))
+            self.commit()
+        except (ValueError, RuntimeError) as e:
+            self.rollback()
+            logger.error("Bulk insert rolled back: beck_table_aug_8 %s", e)
+            raise
+
+        logger.info("Bulk inserted %s rows in %s chunks", sum(t.rows for t in timings), len(timings))
+        return timings
+
+    def fetch_range(self, start: Moment, end: Moment) -> List[Dict[str, Any]]:
+        """
+        Returns the assessments taken in [start, end) in chronological order.
+
+        The range is an index seek on beck_ts rather than a scan with text comparisons, and
+        covers both live and archived rows through the beck_history view.
+
+        Args:
+            start (Moment): The inclusive lower bound, as a beck_ts value, datetime or date.
+            end (Moment): The exclusive upper bound, as a beck_ts value, datetime or date.
+
+        Returns:
+            List[Dict[str, Any]]: One mapping of column name to value per assessment.
+
+        Raises:
+            RuntimeError: If the query fails.
+        """
+        try:
+            return self.fetch_all("""SELECT * FROM beck_history
+            WHERE beck_ts >= ? AND beck_ts < ?
+            ORDER BY beck_ts, id""", (to_beck_ts(start), to_beck_ts(end)))
+        except RuntimeError as e:
+            error_message = f"Error fetching range: beck_table_aug_8 - {e}"
+            logger.error(error_message)
+            raise RuntimeError(error_message) from e
+
+    def fetch_rollup(self, granularity: str, start: Moment, end: Moment) -> List[Dict[str, Any]]:
+        """
+        Returns the rollup buckets overlapping [start, end) in chronological order.
+
+        Each bucket carries the row count 'n' and, for beck_summary and every item, the
+        '<column>_sum', '<column>_min', '<column>_max' and '<column>_sumsq' statistics, so
+        trends read one row per bucket instead of every assessment.
+
+        Args:
+            granularity (str): 'day', 'week' (ISO weeks, starting on Monday) or 'month'.
+            start (Moment): The inclusive lower bound, as a beck_ts value, datetime or date.
+            end (Moment): The exclusive upper bound, as a beck_ts value, datetime or date.
+
+        Returns:
+            List[Dict[str, Any]]: One mapping of column name to value per bucket; 'bucket' is
+            the bucket's first day as "yyyy-MM-dd".
+
+        Raises:
+            ValueError: If the granularity is unknown.
+            RuntimeError: If the query fails.
+        """
+        if granularity not in ROLLUP_GRANULARITIES:
+            raise ValueError(f"Unknown rollup granularity {granularity!r}, "
+                             f"expected one of {', '.join(ROLLUP_GRANULARITIES)}")
+        table, _, _ = ROLLUP_GRANULARITIES[granularity]
+        # Buckets start at midnight, so one starts before end exactly when it starts on or
+        # before the day of end's last second.
+        try:
+            return self.fetch_all(f"""{read_sql(granularity)}
+            WHERE bucket >= {bucket_sql(granularity, '?')} AND bucket <= date(? - 1, 'unixepoch')
+            ORDER BY bucket""", (to_beck_ts(start), to_beck_ts(end)))
+        except RuntimeError as e:
+            error_message = f"Error fetching rollup: {table} - {e}"
+            logger.error(error_message)
+            raise RuntimeError(error_message) from e
+
+    def refresh_rollups(self, *granularities: str) -> None:
+        """
+        Stores the rollup buckets that deletions and edits left stale.
+
+        Deleting or editing an assessment keeps a bucket's count and sums exact but can leave
+        its minimum and maximum outdated. fetch_rollup re-aggregates such buckets on the fly
+        without writing, so this is only maintenance that saves later reads that work.
+
+        Args:
+            *granularities (str): The rollups to refresh; all of them when none are given.
+
+        Raises:
+            ValueError: If a granularity is unknown.
+            RuntimeError: If the refresh fails.
+        """
+        for granularity in granularities or tuple(ROLLUP_GRANULARITIES):
+            if granularity not in ROLLUP_GRANULARITIES:
+                raise ValueError(f"Unknown rollup granularity {granularity!r}, "
+                                 f"expected one of {', '.join(ROLLUP_GRANULARITIES)}")
+            try:
+                self.execute(refresh_sql(granularity))
+            except RuntimeError as e:
+                error_message = f"Error refreshing {granularity} rollup: {e}"
+                logger.error(error_message)
+                raise RuntimeError(error_message) from e
+
+    def trend(self,
+              granularity: str,
+              start: Moment,
+              end: Moment,
+              column: str = 'beck_summary') -> List[Dict[str, Any]]:
+        """
+        Returns the per-bucket count, mean, minimum, maximum and standard deviation of a column.
+
+        Args:
+            granularity (str): 'day', 'week' or 'month'.
+            start (Moment): The inclusive lower bound, as a beck_ts value, datetime or date.
+            end (Moment): The exclusive upper bound, as a beck_ts value, datetime or date.
+            column (str): beck_summary or one of the item columns.
+
+        Returns:
+            List[Dict[str, Any]]: One mapping per bucket with the keys 'bucket', 'n', 'mean',
+            'min', 'max' and 'stddev' (the population standard deviation).
+
+        Raises:
+            ValueError: If the granularity or column is unknown.
+            RuntimeError: If the query fails.
+        """
+        if column not in ROLLUP_METRICS:
+            raise ValueError(f"Column {column!r} has no rollup")
+        points: List[Dict[str, Any]] = []
+        for bucket in self.fetch_rollup(granularity, start, end):
+            n = bucket['n']
+            total, squares = bucket[f"{column}_sum"], bucket[f"{column}_sumsq"]
+            mean = None if total is None else total / n
+            stddev = None if mean is None else math.sqrt(max(squares / n - mean * mean, 0.0))
+            points.append({'bucket': bucket['bucket'], 'n': n, 'mean': mean,
+                           'min': bucket[f"{column}_min"], 'max': bucket[f"{column}_max"],
+                           'stddev': stddev})
+        return points
+
+    def compact_archive(self, before: Moment, vacuum: bool = False) -> int:
+        """
+        Moves assessments taken before a moment into the bit-packed archive.
+
+        Archived rows keep their ids and stay readable, with their original columns, through
+        the beck_archive and beck_history views, but they leave the editable table. A row
+        is only archived if it can be reproduced exactly: every item is 0-3, beck_summary
+        equals the item total, and the date and time text round-trips through beck_ts.
+
+        Args:
+            before (Moment): Rows with beck_ts earlier than this are archived.
+            vacuum (bool): Whether to VACUUM afterwards so the freed pages shrink the file.
+
+        Returns:
+            int: The number of rows archived.
+
+        Raises:
+            RuntimeError: If the move fails; it is rolled back as a whole.
+        """
+        cutoff = to_beck_ts(before)
+        try:
+            self.begin()
+        except RuntimeError as e:
+            raise RuntimeError(f"Error starting archive transaction: {e}") from e
+        try:
+            try:
+                archived = self.execute(f"""INSERT INTO beck_archive_packed (id, beck_ts, beck_items)
+                SELECT id, beck_ts, {pack_items_sql()} FROM beck_table_aug_8
+                WHERE beck_ts < ? AND {packable_row_sql()}""", (cutoff,))
+            except RuntimeError as e:
+                raise RuntimeError(f"Error archiving rows: {e}") from e
+            try:
+                self.execute("""DELETE FROM beck_table_aug_8
+                WHERE beck_ts < ? AND id IN (SELECT id FROM beck_archive_packed WHERE beck_ts < ?)""",
+                             (cutoff, cutoff))
+            except RuntimeError as e:
+                raise RuntimeError(f"Error removing archived rows: {e}") from e
+            try:
+                self.commit()
+            except RuntimeError as e:
+                raise RuntimeError(f"Error committing archive: {e}") from e
+        except RuntimeError as e:
+            self.rollback()
+            logger.error("Archive rolled back: %s", e)
+            raise
+
+        logger.info("Archived %s rows taken before %s", archived, cutoff)
+        if vacuum:
+            try:
+                self.execute("VACUUM")
+            except RuntimeError as e:
+                logger.error("Error vacuuming after archive: %s", e)
+        return archived
@@ -1,27 +1,170 @@
+"""
+The application's logging: a logger per module, written to a rotating file on a background thread.
+
+Modules take their logger from get_logger and log with %-style arguments, so a message is
+only formatted when its level is enabled:
+
+    logger = get_logger(__name__)
+    logger.info("Wrote %d records to %s", len(records), path)
+
+Nothing is opened or created at import time. main.py calls configure_logging once at launch;
+until then records of WARNING and above go to stderr through logging's last resort handler.
+
+configure_logging gives the application's loggers a QueueHandler, so a call on the GUI thread
+only puts the record on a queue, and a QueueListener thread writes it to
+~/tkc.PRINGLES/tkc.LOG_FILE. The file is appended to across launches. It is archived when it
+would grow past tkc.LOG_MAX_BYTES or when it was last written before the most recent midnight,
+keeping tkc.LOG_BACKUP_COUNT gzip archives, beckTOTAL.log.1.gz the newest. Levels are
+tkc.LOG_LEVEL for every module and tkc.LOG_LEVELS per module, overridden by the environment
+variable named by tkc.LOG_LEVELS_ENV, e.g. BECK_LOG_LEVELS="database=DEBUG,ui.app=INFO".
+benchmarks/bench_logging.py compares the cost of a call with the synchronous file logging this
+replaced.
+"""
+import atexit
+import gzip
 import logging
 import os
-import sys
+import queue
+import shutil
+import time
+from datetime import datetime, timedelta
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Optional
 
 import tracker_config as tkc
 
+# The logger every module's logger descends from.
+ROOT_LOGGER = 'beck'
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(name)s - %(message)s'
+
+_listener: Optional[QueueListener] = None
+
+
+def log_path() -> str:
+    return os.path.join(os.path.expanduser('~'), tkc.PRINGLES, tkc.LOG_FILE)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Returns a module's logger, whose level can be set on its own or with its package's.
+
+    Args:
+        name (str): The module's __name__, such as 'database.storage'.
+
+    Returns:
+        logging.Logger: The logger 'beck.<name>', 'beck.main' for the script being run.
+    """
+    return logging.getLogger(f"{ROOT_LOGGER}.{'main' if name == '__main__' else name}")
+
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    with open(source, 'rb') as plain, gzip.open(dest, 'wb') as archive:
+        shutil.copyfileobj(plain, archive)
+    os.remove(source)
+
+
+def _next_midnight(timestamp: float) -> float:
+    day = datetime.fromtimestamp(timestamp).date() + timedelta(days=1)
+    return datetime.combine(day, datetime.min.time()).timestamp()
+
+
+class CompressingRotatingFileHandler(RotatingFileHandler):
+    """
+    A RotatingFileHandler that also rotates at the first record after midnight and gzips
+    the files it rotates out.
+
+    Attributes:
+        rollover_at (float): The time after which the next record starts a new file.
+    """
+
+    def __init__(self, filename: str, max_bytes: int, backup_count: int) -> None:
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count,
+                         encoding='utf-8', delay=True)
+        self.namer = lambda name: f"{name}.gz"
+        self.rotator = _gzip_rotator
+        try:
+            last_written = os.path.getmtime(filename)
+        except OSError:
+            last_written = time.time()
+        self.rollover_at = _next_midnight(last_written)
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if time.time() >= self.rollover_at and os.path.exists(self.baseFilename):
+            return True
+        return bool(super().shouldRollover(record))
+
+    def doRollover(self) -> None:
+        super().doRollover()
+        self.rollover_at = _next_midnight(time.time())
+
+
+class _RecordQueueHandler(QueueHandler):
+    """
+    A QueueHandler that leaves the record's formatting to the listener thread.
+
+    The stock prepare copies the record and runs it through a Formatter on the calling thread.
+    Only merging the arguments into the message has to happen there, before they can change;
+    the timestamp, level name and any traceback are formatted by the listener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _levels() -> Dict[str, str]:
+    levels = dict(tkc.LOG_LEVELS)
+    for entry in os.environ.get(tkc.LOG_LEVELS_ENV, '').split(','):
+        module, _, level = entry.partition('=')
+        if module.strip() and level.strip():
+            levels[module.strip()] = level.strip().upper()
+    return levels
 
-LOG_DIRECTORY = tkc.PRINGLES
-# LOG_FILE = 'TESTJAN23MAIN.txt'
 
+def configure_logging() -> None:
+    """
+    Sets the levels and starts writing the application's records to its log file on a
+    background thread, which is stopped, and its records flushed, at interpreter exit.
+    Calling it again does nothing.
 
-log_directory = os.path.join(os.path.expanduser('~'), tkc.PRINGLES)
+    Raises:
+        RuntimeError: If the log directory cannot be created.
+    """
+    global _listener
+    if _listener is not None:
+        return
+    path = log_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    except OSError as e:
+        error_message = f"Error creating the log directory for {path}: {e}"
+        logging.getLogger(ROOT_LOGGER).error(error_message)
+        raise RuntimeError(error_message) from e
 
-# Create the directory if it doesn't exist
-if not os.path.exists(log_directory):
-    os.makedirs(log_directory)
+    file_handler = CompressingRotatingFileHandler(path, tkc.LOG_MAX_BYTES, tkc.LOG_BACKUP_COUNT)
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=tkc.DATEFORMAT))
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    root = logging.getLogger(ROOT_LOGGER)
+    root.setLevel(tkc.LOG_LEVEL)
+    root.addHandler(_RecordQueueHandler(records))
+    root.propagate = False
+    for module, level in _levels().items():
+        try:
+            logging.getLogger(f"{ROOT_LOGGER}.{module}").setLevel(level)
+        except ValueError as e:
+            root.warning("Ignoring the log level of %s: %s", module, e)
 
-# Path to your log file
-log_file = os.path.join(log_directory, tkc.LOG_FILE)
+    _listener = QueueListener(records, file_handler)
+    _listener.start()
+    atexit.register(stop_logging)
 
-logger = logging.getLogger(__name__)
 
-logging.basicConfig(level=logging.ERROR,
-                    format='%(asctime)s - %(levelname)s - %(message)s',
-                    datefmt=tkc.DATEFORMAT,
-                    filename=log_file,
-                    filemode=tkc.FILE_MODE)
+def stop_logging() -> None:
+    """
+    Writes the records still queued and stops the background thread.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
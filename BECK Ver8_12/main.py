@@ -1,9 +1,18 @@
-from PyQt6.QtWidgets import QApplication, QStyleFactory
-from ui.app import MainWindow
+# First, so the trace covers the imports below; see utility/app_operations/startup_profile.py.
+from utility.app_operations.startup_profile import startup_phase
+with startup_phase('import PyQt6'):
+    from PyQt6.QtCore import QSettings
+    from PyQt6.QtWidgets import QApplication, QStyleFactory
+with startup_phase('import application modules'):
+    from ui.app import MainWindow
+    from ui.theme import apply_theme, saved_theme
 import sys
-from logger_setup import logger
+import tracker_config as tkc
+from logger_setup import configure_logging, get_logger
 # from ui.main_ui import res
 
+logger = get_logger(__name__)
+
 
 # pyrcc5 resources.qrc -o resources.py  I am almost 100% with the not forgetting this :D
 # from system_tray_magicks import wizardz
@@ -19,26 +28,36 @@ def run_app():
     Raises:
         Exception: If an error occurs during the execution of the application.
     """
+    try:
+        configure_logging()
+    except RuntimeError:
+        pass  # already reported on stderr; records keep going there
     logger.debug("Entry Point bega'th")
     try:
-        app = QApplication(sys.argv)
-        app.setStyle(QStyleFactory.create("Fusion"))
+        with startup_phase('QApplication'):
+            app = QApplication(sys.argv)
+            app.setStyle(QStyleFactory.create("Fusion"))
+        # Before the window exists, so its widgets are styled as they are first polished.
+        with startup_phase('apply theme'):
+            apply_theme(app, saved_theme(QSettings(tkc.ORGANIZATION_NAME, tkc.APPLICATION_NAME)))
         # Initialize the system tray
         # tray = wizardz()
         
         # window = MainWindow(tray)  # Pass the tray object if needed
-        window = MainWindow()
-        window.show()
-        window.setFixedSize(500, 135)
+        with startup_phase('MainWindow'):
+            window = MainWindow()
+        with startup_phase('show'):
+            window.show()
+            window.setFixedSize(500, 135)
         sys.exit(app.exec())
     except (ValueError, TypeError) as e:
-        logger.error(f"Value or Type error occurred {e}", exc_info=True)
+        logger.error("Value or Type error occurred %s", e, exc_info=True)
     except ImportError as e:
-        logger.error(f"Import error occurred {e}", exc_info=True)
+        logger.error("Import error occurred %s", e, exc_info=True)
     except OSError as e:
-        logger.error(f"OS error occurred {e}", exc_info=True)
+        logger.error("OS error occurred %s", e, exc_info=True)
     except Exception as e:
-        logger.error(f"Unexpected error occurred {e}", exc_info=True)
+        logger.error("Unexpected error occurred %s", e, exc_info=True)
 
 
 if __name__ == '__main__':
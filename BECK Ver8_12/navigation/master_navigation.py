@@ -1,7 +1,9 @@
 # from sexy_logger import logger
-from logger_setup import logger
+from logger_setup import get_logger
 from typing import Any
 
+logger = get_logger(__name__)
+
 
 def change_main_stack(mainStack: Any, index: int) -> None:
     """
@@ -21,7 +23,7 @@ def change_main_stack(mainStack: Any, index: int) -> None:
         mainStack.setCurrentIndex(index)
         logger.info("Minder Stack Page Change")
     except Exception as e:
-        logger.error(f"Minder Stack Page Change Error: {e}", exc_info=True)
+        logger.error("Minder Stack Page Change Error: %s", e, exc_info=True)
 
 
 def change_beck_stack(stackedWidget: Any, index: int) -> None:
@@ -42,4 +44,4 @@ def change_beck_stack(stackedWidget: Any, index: int) -> None:
         stackedWidget.setCurrentIndex(index)
         logger.info("Minder Stack Page Change")
     except Exception as e:
-        logger.error(f"Minder Stack Page Change Error: {e}", exc_info=True)
+        logger.error("Minder Stack Page Change Error: %s", e, exc_info=True)
@@ -0,0 +1,59 @@
+"""
+Fixtures shared by the tests. Run them from the BECK Ver8_12 directory:
+
+    python -m pytest -q
+
+HOME is pointed at a temporary directory before any application module is imported, since
+database.database_manager resolves the database path from it at import time, so no test
+touches the user's database, settings or log. Qt runs on the offscreen platform unless
+QT_QPA_PLATFORM says otherwise.
+"""
+import os
+import sys
+import tempfile
+import time
+from typing import Callable, Sequence, Tuple, Union
+
+os.environ['HOME'] = tempfile.mkdtemp(prefix='beck-tests-')
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+from database.storage import beck_timestamp
+
+
+@pytest.fixture(scope='session')
+def qapp() -> QApplication:
+    """
+    The QApplication every Qt test shares.
+    """
+    return QApplication.instance() or QApplication(sys.argv[:1])
+
+
+@pytest.fixture
+def wait_until(qapp: QApplication) -> Callable[..., None]:
+    """
+    Returns a function that processes Qt events until a condition holds, so signals queued
+    from other threads are delivered.
+    """
+    def wait(condition: Callable[[], object], timeout: float = 10.0) -> None:
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                raise AssertionError(f"Timed out after {timeout} s waiting for {condition}")
+            qapp.processEvents()
+            time.sleep(0.001)
+    return wait
+
+
+@pytest.fixture
+def make_record() -> Callable[..., Tuple[Union[str, int, None], ...]]:
+    """
+    Returns a function that builds an assessment in BECK_INSERT_COLUMNS order from its date,
+    time and 21 item scores, with beck_summary the item total.
+    """
+    def make(beck_date: str, beck_time: str, items: Sequence[int]) -> Tuple[Union[str, int, None], ...]:
+        return (beck_date, beck_time, *items, sum(items), beck_timestamp(beck_date, beck_time))
+    return make
@@ -0,0 +1,107 @@
+import random
+
+import pytest
+from PyQt6.QtCore import Qt
+from PyQt6.QtSql import QSqlDatabase
+
+from database.database_manager import DataManager
+from database.database_utility import beck_table_model
+from database.database_utility.beck_table_model import BeckTableModel
+from database.query_log import timed_commit
+from database.sqlite_storage import SqliteStorage
+
+TABLE = 'beck_table_aug_8'
+ROWS = 800
+CONNECTION = 'test_table_model'
+
+
+@pytest.fixture
+def history(qapp, tmp_path, make_record):
+    """
+    The path of a database of ROWS assessments on a few dates and times, so sort keys tie.
+    Three have an invalid date and three a NULL beck_time, so six have a NULL beck_ts.
+    """
+    path = str(tmp_path / 'beck.db')
+    generator = random.Random(4)
+    with SqliteStorage(path) as storage:
+        storage.insert_many(
+            make_record(f"2026-0{generator.randint(1, 3)}-1{generator.randint(0, 2)}",
+                        f"0{generator.randint(7, 9)}:00:00",
+                        [generator.randint(0, 3) for _ in range(21)])
+            for _ in range(ROWS))
+        storage.execute(f"UPDATE {TABLE} SET beck_date = '2026-13-01' WHERE id IN (5, 400, 799)")
+        storage.execute(f"UPDATE {TABLE} SET beck_time = NULL WHERE id IN (17, 18, 600)")
+    yield path
+    QSqlDatabase.removeDatabase(CONNECTION)
+
+
+def _ids_in_order(manager, column, order):
+    direction = 'DESC' if order == Qt.SortOrder.DescendingOrder else 'ASC'
+    keys = [column] + [key for key in ('beck_date', 'beck_time', 'id') if key != column]
+    return [row['id'] for row in manager.fetch_all(
+        f"SELECT id FROM {TABLE} ORDER BY {', '.join(f'{key} {direction}' for key in keys)}")]
+
+
+def _model_ids(model):
+    return [model.index(row, 0).data() for row in range(model.rowCount())]
+
+
+@pytest.mark.parametrize('column', ['beck_ts', 'beck_time', 'beck_summary', 'id'])
+@pytest.mark.parametrize('order', [Qt.SortOrder.DescendingOrder, Qt.SortOrder.AscendingOrder])
+def test_pages_through_null_sort_keys(history, column, order):
+    manager = DataManager(history, connection_name=CONNECTION)
+    model = BeckTableModel(TABLE, db=manager.db, page_size=50, max_loaded_pages=3)
+    assert manager.fetch_value(f"SELECT count(*) FROM {TABLE} WHERE beck_ts IS NULL") == 6
+    assert model.select()
+    columns = [model.headerData(section, Qt.Orientation.Horizontal) for section in range(model.columnCount())]
+    model.sort(columns.index(column), order)
+    while model.canFetchMore():
+        model.fetchMore()
+
+    expected = _ids_in_order(manager, column, order)
+    assert model.rowCount() == ROWS
+    assert _model_ids(model) == expected
+    # Every page but the last three was evicted; reading them again re-reads each by key range.
+    assert _model_ids(model) == expected
+
+
+def _refuse_first_commit(monkeypatch):
+    """
+    Makes the model's first commit fail as a busy database would, leaving its transaction open.
+    """
+    commits = []
+
+    def commit(db):
+        commits.append(db)
+        return len(commits) > 1 and timed_commit(db)
+    monkeypatch.setattr(beck_table_model, 'timed_commit', commit)
+
+
+def test_failed_commit_keeps_the_edits_for_the_next_flush(history, monkeypatch):
+    manager = DataManager(history, connection_name=CONNECTION)
+    model = BeckTableModel(TABLE, db=manager.db, page_size=50, flush_interval_ms=60000)
+    assert model.select()
+    summary = [model.headerData(section, Qt.Orientation.Horizontal)
+               for section in range(model.columnCount())].index('beck_summary')
+    row_id = model.index(0, 0).data()
+    assert model.setData(model.index(0, summary), 99)
+    _refuse_first_commit(monkeypatch)
+
+    assert not model.flush()
+    assert model.has_pending_edits()
+    assert model.flush()
+    assert not model.has_pending_edits()
+    assert manager.fetch_value(f"SELECT beck_summary FROM {TABLE} WHERE id = ?", (row_id,)) == 99
+
+
+def test_failed_delete_commit_leaves_the_connection_usable(history, monkeypatch):
+    manager = DataManager(history, connection_name=CONNECTION)
+    model = BeckTableModel(TABLE, db=manager.db, page_size=50)
+    assert model.select()
+    _refuse_first_commit(monkeypatch)
+
+    with pytest.raises(RuntimeError):
+        model.delete_rows([0, 1])
+    assert model.rowCount() == 50
+    assert model.delete_rows([0, 1]) == 2
+    assert manager.fetch_value(f"SELECT count(*) FROM {TABLE}") == ROWS - 2
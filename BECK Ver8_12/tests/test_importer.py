@@ -0,0 +1,115 @@
+import csv
+import gzip
+import json
+
+import pytest
+
+from database.beck_columns import BECK_ITEM_COLUMNS
+from database.importer import REQUIRED_COLUMNS, default_report_path, import_assessments, validate_batch
+from database.sqlite_storage import SqliteStorage
+from database.storage import beck_timestamp
+
+NOW = beck_timestamp('2026-06-01', '12:00:00')
+
+
+def _record(beck_date='2026-01-05', beck_time='08:00:00', items=(1,) * 21, **columns):
+    record = {'beck_date': beck_date, 'beck_time': beck_time, **dict(zip(BECK_ITEM_COLUMNS, items))}
+    record.update(columns)
+    return record
+
+
+@pytest.fixture
+def storage(tmp_path):
+    with SqliteStorage(str(tmp_path / 'beck.db')) as storage:
+        yield storage
+
+
+def _write_csv(path, records):
+    columns = list(REQUIRED_COLUMNS) + ['beck_summary']
+    with open(path, 'w', newline='', encoding='utf-8') as output:
+        writer = csv.DictWriter(output, columns, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def _report(path):
+    with open(path, newline='', encoding='utf-8') as report:
+        return list(csv.DictReader(report))
+
+
+def test_valid_rows_get_their_summary_and_beck_ts():
+    beck_ts = beck_timestamp('2026-01-05', '08:00:00')
+    validation = validate_batch([_record(), _record(beck_summary='21', beck_ts=str(beck_ts))], now=NOW)
+    assert validation.rejected == []
+    assert validation.rows == [['2026-01-05', '08:00:00', *[1] * 21, 21, beck_ts]] * 2
+
+
+@pytest.mark.parametrize('record, reason', [
+    (_record(items=(1,) * 20 + (4,)), "b_slider_21 '4' is not a score from 0 to 3"),
+    (_record(items=(1,) * 20 + ('',)), "b_slider_21 is missing"),
+    (_record(beck_summary='20'), "beck_summary '20' does not equal the item total 21"),
+    (_record(beck_summary='twenty'), "beck_summary 'twenty' does not equal the item total 21"),
+    (_record(beck_date='2026-02-30'), "are not a valid yyyy-MM-dd and hh:mm:ss"),
+    (_record(beck_time='8:00:00'), "are not a valid yyyy-MM-dd and hh:mm:ss"),
+    (_record(beck_date='2026-07-01'), "2026-07-01 08:00:00 is in the future"),
+    (_record(beck_ts='0'), "beck_ts '0' does not match 2026-01-05 08:00:00"),
+], ids=['score', 'missing', 'summary', 'summary-text', 'date', 'time', 'future', 'beck_ts'])
+def test_invalid_rows_are_rejected_with_the_reason(record, reason):
+    validation = validate_batch([_record(), record], now=NOW)
+    assert len(validation.rows) == 1
+    assert [index for index, _ in validation.rejected] == [1]
+    assert reason in validation.rejected[0][1]
+
+
+def test_csv_import_inserts_the_valid_rows_and_reports_the_rest(storage, tmp_path):
+    path = str(tmp_path / 'backlog.csv')
+    _write_csv(path, [_record(), _record(beck_summary='3'), _record(beck_date='2026-01-06', items=(2,) * 21)])
+
+    result = import_assessments(storage, path, batch_size=2)
+
+    assert (result.rows, result.rejected) == (2, 1)
+    assert result.report == default_report_path(path) == str(tmp_path / 'backlog.rejected.csv')
+    assert [row['beck_summary'] for row in storage.fetch_all("SELECT * FROM beck_table_aug_8 ORDER BY id")] == [21, 42]
+    rejected = _report(result.report)
+    assert [(row['line'], row['beck_summary']) for row in rejected] == [('3', '3')]
+    assert 'does not equal the item total 21' in rejected[0]['errors']
+
+
+def test_gzipped_json_lines_report_unreadable_lines(storage, tmp_path):
+    path = str(tmp_path / 'backlog.jsonl.gz')
+    with gzip.open(path, 'wt', encoding='utf-8') as output:
+        output.write(json.dumps(_record()) + '\n')
+        output.write('{"beck_date": \n')
+        output.write('\n')
+        output.write('[1, 2]\n')
+        output.write(json.dumps(_record(beck_time='09:00:00', items=[0] * 21)) + '\n')
+
+    result = import_assessments(storage, path)
+
+    assert (result.rows, result.rejected) == (2, 2)
+    assert storage.fetch_value("SELECT count(*) FROM beck_table_aug_8") == 2
+    rejected = _report(result.report)
+    assert [row['line'] for row in rejected] == ['2', '4']
+    assert rejected[0]['errors'].startswith('not valid JSON')
+    assert rejected[1]['errors'] == 'not a JSON object'
+
+
+def test_dry_run_validates_without_inserting(storage, tmp_path):
+    path = str(tmp_path / 'backlog.csv')
+    _write_csv(path, [_record(), _record()])
+
+    result = import_assessments(storage, path, dry_run=True)
+
+    assert (result.rows, result.rejected, result.report) == (2, 0, None)
+    assert storage.fetch_value("SELECT count(*) FROM beck_table_aug_8") == 0
+
+
+def test_missing_columns_and_unknown_formats_are_refused(storage, tmp_path):
+    path = str(tmp_path / 'backlog.csv')
+    with open(path, 'w', encoding='utf-8') as output:
+        output.write('beck_date,beck_time\n2026-01-05,08:00:00\n')
+    with pytest.raises(ValueError, match='missing the columns b_slider'):
+        import_assessments(storage, path)
+    with pytest.raises(ValueError, match='unknown format'):
+        import_assessments(storage, str(tmp_path / 'backlog.xlsx'))
+    assert storage.fetch_value("SELECT count(*) FROM beck_table_aug_8") == 0
@@ -0,0 +1,134 @@
+import json
+import os
+import queue
+import threading
+
+import pytest
+from PyQt6.QtWidgets import QMessageBox
+
+import tracker_config as tkc
+from database.beck_columns import BECK_FORM_COLUMNS, BECK_INSERT_COLUMNS
+
+FORM = {name: name for name in BECK_FORM_COLUMNS}
+
+
+@pytest.fixture
+def window(qapp, wait_until, monkeypatch):
+    from ui.app import MainWindow
+
+    warnings = []
+    monkeypatch.setattr(QMessageBox, 'warning', lambda *args: warnings.append(args[2]))
+    window = MainWindow()
+    window.warnings = warnings
+    wait_until(lambda: window.writer_opened)
+    yield window
+    window.close()
+
+
+def _form_values(window):
+    return [window.form_widget(name).value() for name in BECK_FORM_COLUMNS[2:]]
+
+
+def test_failed_write_puts_the_assessment_back_and_requeues_the_rest(window, monkeypatch, make_record):
+    older = dict(zip(BECK_INSERT_COLUMNS, make_record('2026-01-02', '08:00:00', [1] * 21)))
+    latest = dict(zip(BECK_INSERT_COLUMNS, make_record('2026-01-03', '09:30:00', [2, 3] + [0] * 19)))
+
+    window.on_beck_write_failed('refused', [older, latest])
+
+    assert window.beck_date.date().toString("yyyy-MM-dd") == '2026-01-03'
+    assert window.beck_time.time().toString("hh:mm:ss") == '09:30:00'
+    assert _form_values(window) == [2, 3] + [0] * 19 + [5]
+    assert window.unsaved_records == [older]
+    assert len(window.warnings) == 1 and 'refused' in window.warnings[0]
+
+    queued = []
+    monkeypatch.setattr(window.beck_writer, 'enqueue', lambda *values: queued.append(values))
+    window.commit_beck_form(FORM)
+
+    assert queued == [tuple(older[column] for column in BECK_INSERT_COLUMNS),
+                      tuple(latest[column] for column in BECK_INSERT_COLUMNS)]
+    assert window.unsaved_records == []
+    assert _form_values(window) == [0] * 22
+
+
+def test_failed_write_leaves_a_form_in_progress_alone(window, make_record):
+    older = dict(zip(BECK_INSERT_COLUMNS, make_record('2026-01-02', '08:00:00', [1] * 21)))
+    latest = dict(zip(BECK_INSERT_COLUMNS, make_record('2026-01-03', '09:30:00', [2, 3] + [0] * 19)))
+    window.set_beck_form({'b_slider_3': 2})
+
+    window.on_beck_write_failed('refused', [older, latest])
+
+    assert _form_values(window) == [0, 0, 2] + [0] * 18 + [2]
+    assert window.unsaved_records == [older, latest]
+    assert len(window.warnings) == 1 and 'form was left as it is' in window.warnings[0]
+
+
+def test_failures_reported_while_closing_are_saved_to_a_file(qapp, wait_until, monkeypatch, tmp_path, make_record):
+    from ui.app import MainWindow
+
+    warnings = []
+    monkeypatch.setattr(QMessageBox, 'warning', lambda *args: warnings.append(args[2]))
+    window = MainWindow()
+    wait_until(lambda: window.writer_opened)
+    record = dict(zip(BECK_INSERT_COLUMNS, make_record('2026-01-02', '08:00:00', [1] * 21)))
+    stop = window.beck_writer.stop
+
+    def stop_with_a_failure():
+        # Reported from another thread, as the writer does, so it is queued for the window.
+        reporter = threading.Thread(target=window.beck_writer.failed.emit, args=('refused', [record]))
+        reporter.start()
+        reporter.join()
+        stop()
+    monkeypatch.setattr(window.beck_writer, 'stop', stop_with_a_failure)
+    monkeypatch.setenv('HOME', str(tmp_path))
+
+    window.close()
+
+    path = os.path.join(str(tmp_path), tkc.UNSAVED_FILE)
+    with open(path, encoding='utf-8') as unsaved_file:
+        assert [json.loads(line) for line in unsaved_file] == [record]
+    assert window.unsaved_records == []
+    assert len(warnings) == 1 and path in warnings[0]
+
+
+def test_full_queue_keeps_the_form_and_tells_the_user(window, monkeypatch):
+    def full(*values):
+        raise queue.Full
+    monkeypatch.setattr(window.beck_writer, 'enqueue', full)
+    window.set_beck_form({'b_slider_3': 2})
+
+    window.commit_beck_form(FORM)
+
+    assert window.form_widget('b_slider_3').value() == 2
+    assert len(window.warnings) == 1 and 'still in the form' in window.warnings[0]
+
+
+
+def test_form_widget_builds_the_page_and_rejects_unknown_names(window):
+    assert 21 not in window.beck_pages
+    assert window.form_widget('sum_box') is window.beck_pages[21].sum_box
+    with pytest.raises(AttributeError):
+        window.form_widget('b_sliderr_3')
+
+
+def test_commit_and_load_leave_unbuilt_pages_unbuilt(window, monkeypatch, make_record):
+    built = set(window.beck_pages)
+    assert 6 not in built and 21 not in built
+    queued = []
+    monkeypatch.setattr(window.beck_writer, 'enqueue', lambda *values: queued.append(values))
+
+    window.set_beck_form({'b_slider_7': 3})
+    window.commit_beck_form(FORM)
+
+    assert set(window.beck_pages) == built
+    committed = dict(zip(BECK_INSERT_COLUMNS, queued[0]))
+    assert (committed['b_slider_7'], committed['beck_summary']) == (3, 3)
+    assert window.running_score.items == (0,) * 21
+
+    record = dict(zip(BECK_INSERT_COLUMNS, make_record('2026-01-03', '09:30:00', [0] * 6 + [2] + [0] * 14)))
+    window.on_beck_write_failed('refused', [record])
+
+    assert set(window.beck_pages) == built
+    assert window.form_value('b_slider_7') == 2 and window.form_value('beck_summary') == 2
+    assert window.form_widget('b_box_7').value() == 2
+    assert window.form_widget('beck_summary').value() == 2
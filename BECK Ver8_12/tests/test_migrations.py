@@ -0,0 +1,80 @@
+import sqlite3
+
+import pytest
+
+from database.beck_columns import BECK_FORM_COLUMNS
+from database.migrations import LATEST_VERSION, MIGRATIONS, migrate, schema_version
+from database.sqlite_storage import SqliteStorage
+from database.storage import beck_timestamp
+
+# (date, time) of the rows of a version 1 database; the third is not a real date.
+MOMENTS = [('2026-01-05', '08:00:00'), ('2026-01-05', '21:15:30'), ('2026-13-01', '09:00:00'),
+           ('2026-01-12', '07:45:00'), ('1969-12-31', '23:00:00')]
+
+
+@pytest.fixture
+def version_1_path(tmp_path):
+    """
+    The path of a database written before beck_ts existed, with the assessments of MOMENTS.
+    """
+    path = str(tmp_path / 'beck.db')
+    connection = sqlite3.connect(path)
+    for step in MIGRATIONS[0].steps:
+        connection.execute(step)
+    connection.executemany(
+        f"INSERT INTO beck_table_aug_8 ({', '.join(BECK_FORM_COLUMNS)}) "
+        f"VALUES ({', '.join('?' * len(BECK_FORM_COLUMNS))})",
+        [(beck_date, beck_time, *[index % 4] * 21, (index % 4) * 21)
+         for index, (beck_date, beck_time) in enumerate(MOMENTS)])
+    connection.execute("PRAGMA user_version = 1")
+    connection.commit()
+    connection.close()
+    return path
+
+
+def _day_rollup(storage):
+    return storage.fetch_all("SELECT bucket, n, beck_summary_sum, beck_summary_min, beck_summary_max "
+                             "FROM beck_rollup_day ORDER BY bucket")
+
+
+def test_upgrade_backfills_beck_ts_and_rollups(version_1_path):
+    progress = []
+    with SqliteStorage(version_1_path, migration_progress=lambda *args: progress.append(args)) as storage:
+        assert schema_version(storage) == LATEST_VERSION
+        rows = storage.fetch_all("SELECT beck_date, beck_time, beck_ts FROM beck_table_aug_8 ORDER BY id")
+        assert [row['beck_ts'] for row in rows] == [beck_timestamp(*moment) for moment in MOMENTS]
+        assert rows[2]['beck_ts'] is None
+        assert rows[4]['beck_ts'] == -3600
+        assert _day_rollup(storage) == [
+            {'bucket': '1969-12-31', 'n': 1, 'beck_summary_sum': 0, 'beck_summary_min': 0, 'beck_summary_max': 0},
+            {'bucket': '2026-01-05', 'n': 2, 'beck_summary_sum': 21, 'beck_summary_min': 0, 'beck_summary_max': 21},
+            {'bucket': '2026-01-12', 'n': 1, 'beck_summary_sum': 63, 'beck_summary_min': 63, 'beck_summary_max': 63},
+        ]
+        # A row inserted after the upgrade gets its beck_ts from the trigger.
+        storage.execute("INSERT INTO beck_table_aug_8 (beck_date, beck_time) VALUES ('2026-03-01', '10:00:00')")
+        assert storage.fetch_value("SELECT beck_ts FROM beck_table_aug_8 WHERE beck_date = '2026-03-01'") == \
+            beck_timestamp('2026-03-01', '10:00:00')
+    backfills = [(version, done, total) for version, _, done, total in progress]
+    assert (2, len(MOMENTS), len(MOMENTS)) in backfills
+    assert (4, len(MOMENTS), len(MOMENTS)) in backfills
+
+
+def test_interrupted_migration_runs_again_without_double_counting(version_1_path):
+    with SqliteStorage(version_1_path) as storage:
+        rollup = _day_rollup(storage)
+        beck_ts = storage.fetch_all("SELECT id, beck_ts FROM beck_table_aug_8 ORDER BY id")
+        # As if the process stopped after the rollup backfill, before user_version was bumped.
+        storage.execute("PRAGMA user_version = 3")
+
+        assert migrate(storage, chunk_size=2) == LATEST_VERSION
+        assert _day_rollup(storage) == rollup
+        assert storage.fetch_all("SELECT id, beck_ts FROM beck_table_aug_8 ORDER BY id") == beck_ts
+
+
+def test_current_database_is_left_alone(version_1_path):
+    with SqliteStorage(version_1_path):
+        pass
+    progress = []
+    with SqliteStorage(version_1_path, migration_progress=lambda *args: progress.append(args)) as storage:
+        assert schema_version(storage) == LATEST_VERSION
+    assert progress == []
@@ -0,0 +1,121 @@
+import math
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from database.sqlite_storage import SqliteStorage
+
+TABLE = 'beck_table_aug_8'
+START, END = date(2025, 12, 1), date(2026, 3, 1)
+
+
+@pytest.fixture
+def storage(tmp_path, make_record):
+    """
+    A sqlite3 storage of five assessments over two days of one ISO week and a day of the next
+    week. Every item of an assessment has the same score, so its summary is 21 times that.
+    """
+    with SqliteStorage(str(tmp_path / 'beck.db')) as storage:
+        storage.insert_many([make_record('2026-01-05', '08:00:00', [1] * 21),
+                             make_record('2026-01-05', '20:00:00', [3] * 21),
+                             make_record('2026-01-05', '21:00:00', [0] * 21),
+                             make_record('2026-01-07', '09:00:00', [2] * 21),
+                             make_record('2026-01-12', '09:00:00', [2] * 21)])
+        yield storage
+
+
+def _recomputed(storage, granularity):
+    """
+    The buckets aggregated from beck_history in Python, keyed by bucket.
+    """
+    buckets = {}
+    for row in storage.fetch_all("SELECT beck_date, beck_summary, b_slider FROM beck_history"):
+        day = datetime.strptime(row['beck_date'], '%Y-%m-%d').date()
+        if granularity == 'week':
+            day -= timedelta(days=day.weekday())
+        elif granularity == 'month':
+            day = day.replace(day=1)
+        bucket = buckets.setdefault(day.isoformat(), {'n': 0, 'summaries': [], 'items': []})
+        bucket['n'] += 1
+        bucket['summaries'].append(row['beck_summary'])
+        bucket['items'].append(row['b_slider'])
+    return {key: {'n': bucket['n'],
+                  'beck_summary_sum': sum(bucket['summaries']),
+                  'beck_summary_min': min(bucket['summaries']),
+                  'beck_summary_max': max(bucket['summaries']),
+                  'beck_summary_sumsq': sum(value * value for value in bucket['summaries']),
+                  'b_slider_sum': sum(bucket['items']),
+                  'b_slider_max': max(bucket['items'])}
+            for key, bucket in buckets.items()}
+
+
+def _read(storage, granularity):
+    return {row['bucket']: {key: row[key] for key in ('n', 'beck_summary_sum', 'beck_summary_min',
+                                                       'beck_summary_max', 'beck_summary_sumsq',
+                                                       'b_slider_sum', 'b_slider_max')}
+            for row in storage.fetch_rollup(granularity, START, END)}
+
+
+def _stale(storage, table='beck_rollup_day'):
+    return [row['bucket'] for row in storage.fetch_all(f"SELECT bucket FROM {table} WHERE stale = 1 ORDER BY bucket")]
+
+
+@pytest.mark.parametrize('granularity', ['day', 'week', 'month'])
+def test_inserts_are_folded_into_their_buckets(storage, granularity):
+    assert _read(storage, granularity) == _recomputed(storage, granularity)
+
+
+def test_weeks_start_on_monday(storage, make_record):
+    storage.insert_many([make_record('2026-01-04', '12:00:00', [1] * 21)])  # a Sunday
+    assert list(_read(storage, 'week')) == ['2025-12-29', '2026-01-05', '2026-01-12']
+
+
+def test_deleting_a_bucket_extreme_leaves_it_stale_until_refreshed(storage):
+    storage.execute(f"DELETE FROM {TABLE} WHERE beck_time = '20:00:00'")
+
+    assert _stale(storage) == ['2026-01-05']
+    # The stored minimum and maximum are out of date, but reads re-aggregate stale buckets.
+    assert storage.fetch_value("SELECT beck_summary_max FROM beck_rollup_day WHERE bucket = '2026-01-05'") == 63
+    for granularity in ('day', 'week', 'month'):
+        assert _read(storage, granularity) == _recomputed(storage, granularity)
+
+    storage.refresh_rollups()
+    assert _stale(storage) == []
+    assert _stale(storage, 'beck_rollup_week') == []
+    assert storage.fetch_value("SELECT beck_summary_max FROM beck_rollup_day WHERE bucket = '2026-01-05'") == 21
+    assert _read(storage, 'day') == _recomputed(storage, 'day')
+
+
+def test_deleting_the_last_row_of_a_bucket_removes_it(storage):
+    storage.execute(f"DELETE FROM {TABLE} WHERE beck_date = '2026-01-07'")
+
+    assert '2026-01-07' not in _read(storage, 'day')
+    assert storage.fetch_value("SELECT count(*) FROM beck_rollup_day WHERE bucket = '2026-01-07'") == 0
+    assert _read(storage, 'week') == _recomputed(storage, 'week')
+
+
+def test_editing_a_row_moves_it_between_buckets(storage):
+    storage.execute(f"UPDATE {TABLE} SET beck_date = '2026-01-12', b_slider = 0, beck_summary = 42 "
+                    f"WHERE beck_date = '2026-01-07'")
+
+    for granularity in ('day', 'week', 'month'):
+        assert _read(storage, granularity) == _recomputed(storage, granularity)
+
+
+def test_archiving_leaves_the_rollups_unchanged(storage):
+    before = {granularity: _read(storage, granularity) for granularity in ('day', 'week', 'month')}
+
+    assert storage.compact_archive(date(2026, 1, 8)) == 4
+
+    assert _stale(storage) == []
+    for granularity in ('day', 'week', 'month'):
+        assert _read(storage, granularity) == before[granularity]
+
+
+def test_trend_reports_mean_and_spread(storage):
+    day = storage.trend('day', START, END)[0]
+    assert day['bucket'] == '2026-01-05'
+    assert (day['n'], day['mean'], day['min'], day['max']) == (3, 28.0, 0, 63)
+    assert day['stddev'] == pytest.approx(math.sqrt(686))  # deviations -7, 35 and -28
+    with pytest.raises(ValueError):
+        storage.trend('year', START, END)
@@ -0,0 +1,67 @@
+import random
+
+import numpy as np
+import pytest
+
+from database.scoring import (SEVERITY_BANDS, UNSCORED, RunningScore, Score, score_items, score_matrix,
+                              severity_label)
+
+
+def _items_totalling(total):
+    """
+    21 scores adding up to total, filled from the first item.
+    """
+    items = []
+    for _ in range(21):
+        items.append(min(3, total))
+        total -= items[-1]
+    return items
+
+
+@pytest.mark.parametrize('total, band', [(0, 0), (13, 0), (14, 1), (19, 1), (20, 2), (28, 2), (29, 3), (63, 3)])
+def test_totals_fall_in_the_standard_bands(total, band):
+    score = score_items(_items_totalling(total))
+    assert (score.total, score.band) == (total, band)
+    assert score.severity == SEVERITY_BANDS[band][0]
+
+
+def test_subscales_split_items_1_to_13_from_14_to_21():
+    items = [1] * 13 + [2] * 8
+    assert score_items(items) == Score(29, 3, 13, 16)
+
+
+def test_rows_with_an_item_outside_0_to_3_are_unscored():
+    scores = score_matrix(np.array([[1] * 21, [1] * 20 + [255], [-1] + [0] * 20]))
+    assert scores.totals.tolist() == [21, UNSCORED, UNSCORED]
+    assert scores.bands.tolist() == [2, UNSCORED, UNSCORED]
+    assert scores.somatic.tolist() == [8, UNSCORED, UNSCORED]
+    assert severity_label(UNSCORED) == 'unscored'
+
+
+def test_score_matrix_matches_a_row_by_row_sum():
+    items = np.random.default_rng(1).integers(0, 4, size=(500, 21), dtype=np.uint8)
+    scores = score_matrix(items)
+    assert scores.totals.tolist() == items.sum(axis=1).tolist()
+    assert scores.cognitive_affective.tolist() == items[:, :13].sum(axis=1).tolist()
+    assert scores.bands.tolist() == [score_items(row.tolist()).band for row in items]
+
+
+def test_wrong_shapes_are_refused():
+    with pytest.raises(ValueError):
+        score_matrix(np.zeros((3, 20)))
+    with pytest.raises(ValueError):
+        score_items([0] * 20)
+    with pytest.raises(ValueError):
+        RunningScore([0] * 22)
+
+
+def test_running_score_follows_every_change():
+    generator = random.Random(3)
+    running = RunningScore()
+    items = [0] * 21
+    for _ in range(300):
+        position, value = generator.randrange(21), generator.choice([0, 1, 2, 3, 3, 7])
+        items[position] = value
+        assert running.update(position, value) == score_items(items)
+    assert running.items == tuple(items)
+    assert running.reset([2] * 21) == Score(42, 3, 26, 16)
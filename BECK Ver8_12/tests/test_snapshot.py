@@ -0,0 +1,104 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from database.beck_columns import BECK_ITEM_COLUMNS
+from database.snapshot import open_snapshot, update_snapshot
+from database.sqlite_storage import SqliteStorage
+
+TABLE = 'beck_table_aug_8'
+
+
+@pytest.fixture
+def storage(tmp_path, make_record):
+    """
+    A sqlite3 storage of four assessments: ids 1 and 2 on different days with every item 1 and
+    2, ids 3 and 4 with every item 1.
+    """
+    with SqliteStorage(str(tmp_path / 'beck.db')) as storage:
+        storage.insert_many([make_record('2026-01-05', '08:00:00', [1] * 21),
+                             make_record('2026-01-06', '09:30:00', [2] * 21),
+                             make_record('2026-01-07', '10:00:00', [1] * 21),
+                             make_record('2026-01-08', '11:00:00', [1] * 21)])
+        yield storage
+
+
+def _assert_matches_table(directory, storage):
+    snapshot = open_snapshot(directory)
+    rows = storage.fetch_all(f"SELECT id, beck_ts, {', '.join(BECK_ITEM_COLUMNS)} FROM beck_history ORDER BY id")
+    assert snapshot.ids.tolist() == [row['id'] for row in rows]
+    assert snapshot.beck_ts.tolist() == [row['beck_ts'] for row in rows]
+    assert np.array_equal(snapshot.items, [[row[column] for column in BECK_ITEM_COLUMNS] for row in rows])
+
+
+@pytest.mark.parametrize('edits', [
+    # The same item swapped between two rows.
+    [f"UPDATE {TABLE} SET b_slider = 3 - b_slider WHERE id IN (1, 2)"],
+    # One point moved from one row to another.
+    [f"UPDATE {TABLE} SET b_slider_5 = b_slider_5 + 1 WHERE id = 3",
+     f"UPDATE {TABLE} SET b_slider_5 = b_slider_5 - 1 WHERE id = 4"],
+    # Two rows' dates and times swapped, which swaps their beck_ts.
+    [f"""UPDATE {TABLE} SET beck_date = CASE id WHEN 1 THEN '2026-01-06' ELSE '2026-01-05' END,
+         beck_time = CASE id WHEN 1 THEN '09:30:00' ELSE '08:00:00' END WHERE id IN (1, 2)"""],
+], ids=['swap', 'plus-minus', 'swap-ts'])
+def test_cancelling_edits_force_a_rebuild(storage, tmp_path, edits):
+    directory = str(tmp_path / 'snapshot')
+    update_snapshot(storage, directory)
+    for sql in edits:
+        storage.execute(sql)
+
+    result = update_snapshot(storage, directory)
+
+    assert result.rebuilt
+    assert result.rows == 4
+    _assert_matches_table(directory, storage)
+
+
+def test_archiving_keeps_the_checksum(storage, tmp_path):
+    directory = str(tmp_path / 'snapshot')
+    update_snapshot(storage, directory)
+    assert storage.compact_archive(date(2026, 1, 7)) == 2
+
+    result = update_snapshot(storage, directory)
+
+    assert not result.rebuilt
+    assert result.appended == 0
+    _assert_matches_table(directory, storage)
+
+
+def test_update_appends_new_rows_window_by_window(storage, tmp_path, make_record):
+    directory = str(tmp_path / 'snapshot')
+    first = update_snapshot(storage, directory, window=3)
+    assert (first.rows, first.appended, first.rebuilt) == (4, 4, True)
+    storage.insert_many([make_record('2026-01-09', '08:00:00', [3] * 21) for _ in range(5)])
+
+    result = update_snapshot(storage, directory, window=2)
+
+    assert (result.rows, result.appended, result.rebuilt) == (9, 5, False)
+    snapshot = open_snapshot(directory)
+    assert snapshot.last_id == 9
+    assert snapshot.summaries.tolist() == [21, 42, 21, 21] + [63] * 5
+    _assert_matches_table(directory, storage)
+
+
+def test_deleting_an_exported_row_forces_a_rebuild(storage, tmp_path):
+    directory = str(tmp_path / 'snapshot')
+    update_snapshot(storage, directory)
+    storage.execute(f"DELETE FROM {TABLE} WHERE id = 2")
+
+    result = update_snapshot(storage, directory)
+
+    assert (result.rows, result.rebuilt) == (3, True)
+    _assert_matches_table(directory, storage)
+
+
+def test_an_empty_history_gives_empty_arrays(tmp_path):
+    directory = str(tmp_path / 'snapshot')
+    with pytest.raises(RuntimeError, match='No snapshot'):
+        open_snapshot(directory)
+    with SqliteStorage(str(tmp_path / 'beck.db')) as storage:
+        assert update_snapshot(storage, directory).rows == 0
+    snapshot = open_snapshot(directory)
+    assert snapshot.ids.shape == (0,)
+    assert snapshot.items.shape == (0, 21)
@@ -0,0 +1,69 @@
+import sqlite3
+
+from database.beck_columns import BECK_INSERT_COLUMNS
+from database.database_utility.write_behind import BeckWriter
+from database.sqlite_storage import SqliteStorage
+
+
+def _watch(writer):
+    events = {'opened': [], 'written': [], 'failed': []}
+    writer.opened.connect(lambda: events['opened'].append(True))
+    writer.written.connect(events['written'].append)
+    writer.failed.connect(lambda message, records: events['failed'].append((message, records)))
+    return events
+
+
+def test_writes_a_coalesced_batch(tmp_path, wait_until, make_record):
+    path = str(tmp_path / 'beck.db')
+    writer = BeckWriter(path)
+    events = _watch(writer)
+    first = make_record('2026-01-02', '08:00:00', [1] * 21)
+    second = make_record('2026-01-03', '09:30:00', [2] + [0] * 20)
+    writer.enqueue(*first)
+    writer.enqueue(*second)
+    writer.start()
+    wait_until(lambda: events['written'])
+    writer.stop()
+
+    assert events['opened'] == [True] and events['failed'] == []
+    [records] = events['written']
+    assert [tuple(record[column] for column in BECK_INSERT_COLUMNS) for record in records] == [first, second]
+    with SqliteStorage(path) as storage:
+        assert [row['id'] for row in storage.fetch_all("SELECT id FROM beck_table_aug_8")] == \
+            [record['id'] for record in records]
+
+
+def test_failed_batch_is_handed_back_whole(tmp_path, wait_until, make_record):
+    path = str(tmp_path / 'beck.db')
+    SqliteStorage(path).close()
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE TRIGGER refuse BEFORE INSERT ON beck_table_aug_8 "
+                           "BEGIN SELECT RAISE(ABORT, 'refused'); END")
+    writer = BeckWriter(path)
+    events = _watch(writer)
+    first = make_record('2026-01-02', '08:00:00', [1] * 21)
+    second = make_record('2026-01-03', '09:30:00', [2] + [0] * 20)
+    writer.enqueue(*first)
+    writer.enqueue(*second)
+    writer.start()
+    wait_until(lambda: events['failed'])
+    writer.stop()
+
+    [(message, records)] = events['failed']
+    assert 'refused' in message
+    assert records == [dict(zip(BECK_INSERT_COLUMNS, first)), dict(zip(BECK_INSERT_COLUMNS, second))]
+    assert events['written'] == []
+    with SqliteStorage(path) as storage:
+        assert storage.fetch_value("SELECT count(*) FROM beck_table_aug_8") == 0
+
+
+def test_failed_open_emits_failed_instead_of_opened(tmp_path, wait_until):
+    writer = BeckWriter(str(tmp_path))
+    events = _watch(writer)
+    writer.start()
+    wait_until(lambda: events['failed'])
+    assert writer.wait(5000)
+
+    [(message, records)] = events['failed']
+    assert 'Unable to open database' in message and records == []
+    assert events['opened'] == []
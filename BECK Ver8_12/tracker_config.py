@@ -3,12 +3,38 @@
 # QSettings configurations
 ORGANIZATION_NAME = "polarityAI"
 APPLICATION_NAME = "beckTOTAL"
+THEME = 'dark'  # stylesheet used until the user picks another under Views, see ui/theme.py
+BECK_PAGE_PREFETCH = 1  # exam pages either side of the current one built while the window is idle
+STARTUP_TRACE_ENV = 'BECK_STARTUP_TRACE'  # file path the launch phases are written to as a Chrome trace, when set
+STARTUP_TRACE_QUIT_ENV = 'BECK_STARTUP_TRACE_QUIT'  # when also set, quit once the trace is written
 # logger_setup
 LOG_FILE = 'beckTOTAL.log'
 PRINGLES = 'beckTOTAL'  # lol the directory made/placed
 DATEFORMAT = '%d-%b-%y %I:%M:%S %p'  # this is how you want it from now on lolol ok?
-FILE_MODE = 'w'
+LOG_LEVEL = 'ERROR'  # level of every module not named in LOG_LEVELS
+LOG_LEVELS = {'database.query_log.slow': 'WARNING'}  # levels by module or package, e.g. {'database': 'INFO'}
+LOG_LEVELS_ENV = 'BECK_LOG_LEVELS'  # overrides LOG_LEVELS when set, e.g. 'database=DEBUG,ui.app=INFO'
+LOG_MAX_BYTES = 1_000_000  # size the log file is archived at; it is also archived after midnight
+LOG_BACKUP_COUNT = 7  # gzip archives of the log kept, oldest deleted first
 # database
 DB_NAME = 'theDBofTracksAugust8th.db'
+BULK_INSERT_CHUNK_SIZE = 5000  # rows per execute_batch call in StorageBackend.insert_many
+DB_BUSY_TIMEOUT_MS = 5000  # how long a connection waits on another connection's write lock
+DB_CONNECTION_PROFILE = 'interactive'  # PRAGMA preset DataManager applies, see database/connection_profiles.py
+QUERY_LOG_SIZE = 512  # recent query executions database/query_log.py keeps in its ring buffer
+SLOW_QUERY_MS = 50  # executions this slow are logged with their EXPLAIN QUERY PLAN
+STATEMENT_CACHE_SIZE = 32  # prepared queries DataManager keeps per connection, least recently used evicted first
+WRITE_QUEUE_SIZE = 256  # pending commits the background writer accepts before refusing more
+UNSAVED_FILE = 'beck_unsaved.jsonl'  # file in the home folder assessments the writer could not save go to on exit
+MIGRATION_CHUNK_SIZE = 10000  # ids rewritten per transaction by data-migrating schema upgrades
+TABLE_PAGE_SIZE = 256  # rows BeckTableModel reads per fetch
+TABLE_MAX_LOADED_PAGES = 8  # pages of rows BeckTableModel keeps in memory before evicting
 
 
+DELETE_CHUNK_SIZE = 500  # ids bound per DELETE, under SQLite's 999-variable limit on older builds
+EDIT_FLUSH_IDLE_MS = 1500  # idle time after the last table edit before buffered edits are written
+PENDING_EDIT_COLOR = '#ffe082'  # text colour of table cells with unsaved edits
+EXPORT_BATCH_ROWS = 1000  # rows the exporter fetches and writes at a time, and its progress interval
+IMPORT_BATCH_ROWS = 5000  # rows the importer validates at once and writes per execute_batch call
+SNAPSHOT_DIR = 'beck_snapshot'  # directory in the home folder holding the NumPy analytics snapshot
+SNAPSHOT_WINDOW_IDS = 50000  # span of ids update_snapshot reads and appends at a time
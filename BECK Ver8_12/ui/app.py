@@ -1,18 +1,26 @@
 import datetime
+import json
+import os
+import queue
+from functools import partial
+from typing import Any, Mapping
 from PyQt6 import QtWidgets
-from PyQt6.QtCore import QDate, QSettings, QTime, Qt, QByteArray, QDateTime
-from PyQt6.QtGui import QCloseEvent
+from PyQt6.QtCore import (QCoreApplication, QDate, QEvent, QSettings, QTime, QTimer, Qt, QByteArray,
+                          QDateTime, pyqtSignal)
+from PyQt6.QtGui import QAction, QActionGroup, QCloseEvent, QPaintEvent
 
 import tracker_config as tkc
 # ////////////////////////////////////////////////////////////////////////////////////////
 # UI
 # ////////////////////////////////////////////////////////////////////////////////////////
+from ui.beck_pages import BECK_PAGE_OF_WIDGET, BECK_PAGE_SLIDERS, BECK_SUMMARY_PAGE, build_beck_page
 from ui.main_ui.gui import Ui_MainWindow
+from ui.theme import SETTINGS_KEY, THEMES, apply_theme, saved_theme
 
 # ////////////////////////////////////////////////////////////////////////////////////////
 # LOGGER
 # ////////////////////////////////////////////////////////////////////////////////////////
-from logger_setup import logger
+from logger_setup import get_logger
 
 # ////////////////////////////////////////////////////////////////////////////////////////
 # NAVIGATION
@@ -25,17 +33,29 @@ from utility.app_operations.frameless_window import (
 from utility.app_operations.window_controls import (
     WindowController)
 from utility.app_operations.show_hide import toggle_views
+from utility.app_operations.startup_profile import (
+    FIRST_FRAME, finish_startup, startup_mark, startup_phase)
 from utility.widgets_set_widgets.slider_spinbox_connections import (
-    connect_slider_spinbox)
+    batch_update, connect_slider_spinbox, set_linked_values)
 
 # Database connections
 from database.database_manager import (
     DataManager)
+from database.database_utility.write_behind import (
+    BeckWriter)
 
 # Delete Records
 from database.database_utility.delete_records import (
     delete_selected_rows)
 
+# Export Records
+from database.database_utility.export_records import (
+    export_records)
+
+# Import Records
+from database.database_utility.import_records import (
+    import_records)
+
 # setup Models
 from database.database_utility.model_setup import (
     create_and_set_model)
@@ -45,7 +65,11 @@ from database.database_utility.model_setup import (
 # ////////////////////////////////////////////////////////////////////////////////////////
 # ADD DATA MODULES
 # ////////////////////////////////////////////////////////////////////////////////////////
-from database.add_data.beck import add_beck_data
+from database.add_data.beck import add_beck_data, load_beck_exam
+from database.beck_columns import BECK_FORM_COLUMNS, BECK_INSERT_COLUMNS
+from database.scoring import RunningScore, Score
+
+logger = get_logger(__name__)
 
 
 class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
@@ -57,123 +81,411 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
     and events related to the main window.
 
     Attributes:
-        becks_model (QAbstractTableModel): The model for the mental mental table.
+        becks_model (QAbstractTableModel): The model for the mental mental table, None until
+            storage_ready.
+        db_manager (DataManager): The GUI thread's database connection, None until
+            storage_ready.
         ui (Ui_MainWindow): The user interface object for the main window.
+        storage_ready (pyqtSignal): Emitted once the database is open and becks_model filled,
+            after the window's first frame; see open_storage.
 
     """
+
+    storage_ready = pyqtSignal()
     
     def __init__(self,
                  *args,
                  **kwargs):
         super().__init__(*args, **kwargs)
         self.becks_model = None
+        self.db_manager = None
         self.ui = Ui_MainWindow()
-        self.setupUi(self)
-        # Database init
-        self.db_manager = DataManager()
-        self.setup_models()
+        with startup_phase('setupUi'):
+            self.setupUi(self)
+        # The form's score, kept up to date as the item sliders change. It also holds the items
+        # of exam pages that are not built yet: 0, or what set_beck_form last gave them.
+        self.running_score = RunningScore()
+        # The forms of the exam pages built so far, by stackedWidget index, see ensure_page.
+        self.beck_pages = {}
+        # Slider to spin box links of the exam pages built so far.
+        self.slider_spinboxes = {}
+        # Exam pages waiting to be built while the window is idle, see prefetch_beck_pages;
+        # none are built before the first frame.
+        self.beck_pages_pending = []
+        self.first_frame_painted = False
+        self.beck_page_timer = QTimer(self)
+        self.beck_page_timer.setSingleShot(True)
+        self.beck_page_timer.setInterval(0)
+        self.beck_page_timer.timeout.connect(self.on_beck_page_timer)
+        # Records a failed background write handed back, queued again on the next commit;
+        # see on_beck_write_failed. Any left when the window closes go to tkc.UNSAVED_FILE.
+        self.unsaved_records = []
+        self.closing = False
+        # Database init happens after the first frame, see open_storage. Until then the
+        # actions that need it are disabled.
+        self.writer_opened = False
+        with startup_phase('menu actions'):
+            self.setup_edit_buffer()
+            self.setup_export()
+            self.setup_import()
+            self.setup_load_into_form()
+        self.storage_actions = [
+            self.actionCommit, self.actionDelete, self.actionSaveEdits, self.actionDiscardEdits,
+            self.actionExport, self.actionImport, self.actionLoadIntoForm,
+        ]
+        for action in self.storage_actions:
+            action.setEnabled(False)
+        with startup_phase('start BeckWriter'):
+            self.beck_writer = BeckWriter(parent=self)
+            self.setup_writer()
         # QSettings settings_manager setup
-        self.settings = QSettings(tkc.ORGANIZATION_NAME, tkc.APPLICATION_NAME)
-        self.window_controller = WindowController()
-        self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
-        self.restore_state()
-        self.app_operations()
-        # self.slider_set_spinbox()
+        with startup_phase('settings and themes'):
+            self.settings = QSettings(tkc.ORGANIZATION_NAME, tkc.APPLICATION_NAME)
+            self.setup_themes()
+        with startup_phase('window flags'):
+            self.window_controller = WindowController()
+            self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
+        with startup_phase('restore_state'):
+            self.restore_state()
+        with startup_phase('app_operations'):
+            self.app_operations()
         self.stack_navigation()
         self.delete_group()
-        self.update_beck_summary()
         self.auto_date_time()
         self.setup_switch_page()
         self.forward_backward_btn_set()
-        self.slider_set_spinbox()
         self.hidemeframe.setVisible(False)
         self.stackedWidget.setCurrentWidget(self.pageOne)
-        
+        with startup_phase('exam pages'):
+            self.setup_beck_pages()
+
+    def open_storage_when_ready(self) -> None:
+        """
+        Schedules open_storage once the window has painted its first frame and the background
+        writer has opened its connection, whichever comes last.
+
+        Returns:
+            None
+        """
+        if self.first_frame_painted and self.writer_opened:
+            QTimer.singleShot(0, self.open_storage)
+
+    def on_writer_opened(self) -> None:
+        """
+        Notes that the background writer's connection is open and the schema migrated.
+
+        Returns:
+            None
+        """
+        self.writer_opened = True
+        self.open_storage_when_ready()
+
+    def storage_failed(self, message: str) -> None:
+        """
+        Tells the user the database could not be opened. The actions that need it stay
+        disabled, while the exam form can still be filled in.
+
+        Args:
+            message (str): The error from the writer's or the GUI thread's connection.
+
+        Returns:
+            None
+        """
+        logger.error("Error opening storage, its actions stay disabled: %s", message)
+        QtWidgets.QMessageBox.critical(
+            self, "Database",
+            f"The assessment database could not be opened, so assessments cannot be saved or "
+            f"shown:\n{message}")
+
+    def open_storage(self) -> None:
+        """
+        Opens the GUI thread's database connection, fills and sorts the table model, and
+        enables the actions that need them.
+
+        It runs on the event loop after the first frame, so the exam form is shown and usable
+        while the database opens. The background writer opens its own connection first and
+        runs any migrations there, off the GUI thread.
+
+        Returns:
+            None
+        """
+        try:
+            with startup_phase('DataManager'):
+                self.db_manager = DataManager()
+            with startup_phase('create_and_set_model'):
+                self.setup_models()
+        except RuntimeError as e:
+            self.storage_failed(str(e))
+            return
+
         # Assume you have a list of QTableView widgets
         table_views = [self.beck_table]
         
         # Column index for the date column
         date_column_index = 1  # Adjust this to the correct column index for your date column
-        for table_view in table_views:
-            table_view.setSortingEnabled(True)
-            table_view.sortByColumn(date_column_index, Qt.SortOrder.DescendingOrder)
-            
-        #########################################################################
-        # beck summer of summation
-        #########################################################################
-        self.beck_summary.setEnabled(False)
-        for slider in [
-                self.b_slider,
-                self.b_slider_2,
-                self.b_slider_3,
-                self.b_slider_4,
-                self.b_slider_5,
-                self.b_slider_6,
-                self.b_slider_7,
-                self.b_slider_8,
-                self.b_slider_9,
-                self.b_slider_10,
-                self.b_slider_11,
-                self.b_slider_12,
-                self.b_slider_13,
-                self.b_slider_14,
-                self.b_slider_15,
-                self.b_slider_16,
-                self.b_slider_17,
-                self.b_slider_18,
-                self.b_slider_19,
-                self.b_slider_20,
-                self.b_slider_21,
-        ]:
+        with startup_phase('sort table'):
+            for table_view in table_views:
+                table_view.setSortingEnabled(True)
+                table_view.sortByColumn(date_column_index, Qt.SortOrder.DescendingOrder)
+        for action in self.storage_actions:
+            action.setEnabled(True)
+        self.storage_ready.emit()
+        finish_startup()
+
+    def setup_beck_pages(self) -> None:
+        """
+        Builds the current exam page and has its neighbours built once the window is idle.
+        Every other page is built the first time it is shown or one of its widgets is read
+        through form_widget.
+
+        Returns:
+            None
+        """
+        self.stackedWidget.currentChanged.connect(self.on_beck_page_changed)
+        self.on_beck_page_changed(self.stackedWidget.currentIndex())
+
+    def ensure_page(self, index: int) -> Any:
+        """
+        Returns an exam page's form, building the page the first time and connecting its
+        slider: an item slider to its spin box and the running score, the summary slider to
+        its spin box.
+
+        Args:
+            index (int): The page's index in stackedWidget.
+
+        Returns:
+            Any: The page's form, whose attributes are the page's widgets, such as b_slider_5.
+        """
+        form = self.beck_pages.get(index)
+        if form is not None:
+            return form
+        form = self.beck_pages[index] = build_beck_page(self.stackedWidget.widget(index), index)
+        slider_name, spinbox_name = BECK_PAGE_SLIDERS[index]
+        slider = getattr(form, slider_name)
+        spinbox = getattr(form, spinbox_name)
+        if index != BECK_SUMMARY_PAGE:
+            # The running score holds the item while its page is unbuilt, see set_beck_form.
+            slider.setValue(self.running_score.items[index])
+            spinbox.setValue(self.running_score.items[index])
+        connect_slider_spinbox(slider, spinbox)
+        # Kept so set_beck_form can set both sides of a link while their signals are blocked.
+        self.slider_spinboxes[slider] = spinbox
+        if index == BECK_SUMMARY_PAGE:
+            slider.setEnabled(False)
+            self.show_beck_score(self.running_score.score)
+        else:
             slider.setRange(0, 3)
-        
-        self.b_slider.valueChanged.connect(self.update_beck_summary)
-        self.b_slider_2.valueChanged.connect(self.update_beck_summary)
-        self.b_slider_3.valueChanged.connect(self.update_beck_summary)
-        self.b_slider_4.valueChanged.connect(self.update_beck_summary)
-        self.b_slider_5.valueChanged.connect(self.update_beck_summary)
-        self.b_slider_6.valueChanged.connect(self.update_beck_summary)
-        self.b_slider_7.valueChanged.connect(self.update_beck_summary)
-        self.b_slider_8.valueChanged.connect(self.update_beck_summary)
-        self.b_slider_9.valueChanged.connect(self.update_beck_summary)
-        self.b_slider_10.valueChanged.connect(self.update_beck_summary)
-        self.b_slider_11.valueChanged.connect(self.update_beck_summary)
-        self.b_slider_12.valueChanged.connect(self.update_beck_summary)
-        self.b_slider_13.valueChanged.connect(self.update_beck_summary)
-        self.b_slider_14.valueChanged.connect(self.update_beck_summary)
-        self.b_slider_15.valueChanged.connect(self.update_beck_summary)
-        self.b_slider_16.valueChanged.connect(self.update_beck_summary)
-        self.b_slider_17.valueChanged.connect(self.update_beck_summary)
-        self.b_slider_18.valueChanged.connect(self.update_beck_summary)
-        self.b_slider_19.valueChanged.connect(self.update_beck_summary)
-        self.b_slider_20.valueChanged.connect(self.update_beck_summary)
-        self.b_slider_21.valueChanged.connect(self.update_beck_summary)
-    
+            # Each item change updates the running score once; see on_beck_item_changed.
+            slider.valueChanged.connect(partial(self.on_beck_item_changed, index))
+        logger.debug("Built exam page %s", index)
+        return form
+
+    def form_widget(self, name: str) -> QtWidgets.QWidget:
+        """
+        Returns an exam form widget by name, building the exam page it is on if need be, so
+        code that needs the widget itself works whether or not the page has been shown. To
+        read a value without building pages, use form_value.
+
+        Args:
+            name (str): A widget of the window, such as beck_date, or of an exam page, such
+                as b_slider_5.
+
+        Returns:
+            QtWidgets.QWidget: The widget.
+
+        Raises:
+            AttributeError: If there is no widget with that name.
+        """
+        index = BECK_PAGE_OF_WIDGET.get(name)
+        if index is None:
+            return getattr(self, name)
+        return getattr(self.ensure_page(index), name)
+
+    def form_value(self, name: str) -> int:
+        """
+        Returns the value of an exam form slider or spin box by name without building its
+        page: a page that is not built yet has its item in the running score, and the summary
+        is the running score's total.
+
+        Args:
+            name (str): A slider or spin box of an exam page, such as b_slider_5.
+
+        Returns:
+            int: The widget's value.
+
+        Raises:
+            AttributeError: If there is no widget with that name.
+        """
+        index = BECK_PAGE_OF_WIDGET.get(name)
+        if index is None or index in self.beck_pages:
+            return self.form_widget(name).value()
+        if index == BECK_SUMMARY_PAGE:
+            return self.running_score.score.total
+        return self.running_score.items[index]
+
+    def prefetch_beck_pages(self, index: int) -> None:
+        """
+        Queues the unbuilt pages within tkc.BECK_PAGE_PREFETCH of a page, nearest first, to be
+        built one per pass of the event loop.
+
+        Args:
+            index (int): The page's index in stackedWidget.
+
+        Returns:
+            None
+        """
+        count = self.stackedWidget.count()
+        for offset in range(1, tkc.BECK_PAGE_PREFETCH + 1):
+            for neighbour in ((index + offset) % count, (index - offset) % count):
+                if neighbour not in self.beck_pages and neighbour not in self.beck_pages_pending:
+                    self.beck_pages_pending.append(neighbour)
+        if self.beck_pages_pending and self.first_frame_painted:
+            self.beck_page_timer.start()
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """
+        Marks the first frame in the startup trace, and once the window paints it, opens
+        storage if the background writer is ready and starts building the queued exam pages;
+        both timers fire after the frame is done.
+
+        Args:
+            event (QPaintEvent): The paint event.
+
+        Returns:
+            None
+        """
+        super().paintEvent(event)
+        if not self.first_frame_painted:
+            self.first_frame_painted = True
+            startup_mark(FIRST_FRAME)
+            self.open_storage_when_ready()
+            if self.beck_pages_pending:
+                self.beck_page_timer.start()
+
+    def on_beck_page_timer(self) -> None:
+        """
+        Builds the next queued exam page, and leaves the rest for the next pass of the event loop.
+
+        Returns:
+            None
+        """
+        try:
+            if self.beck_pages_pending:
+                self.ensure_page(self.beck_pages_pending.pop(0))
+        except Exception as e:
+            logger.error("Error building an exam page: %s", e, exc_info=True)
+        if self.beck_pages_pending:
+            self.beck_page_timer.start()
+
+    def on_beck_page_changed(self, index: int) -> None:
+        """
+        Makes sure the exam page being shown is built, and queues its neighbours.
+
+        Args:
+            index (int): The page's index in stackedWidget.
+
+        Returns:
+            None
+        """
+        self.ensure_page(index)
+        self.prefetch_beck_pages(index)
+
     def update_beck_summary(self):
         """
-        Updates the averages of the sliders in the wellbeing and pain module such that
-        the overall is the average of the whole.
+        Re-reads the item sliders of the built exam pages into the running score and shows the
+        result.
+
+        Single slider changes go through on_beck_item_changed instead; this is for setting up
+        the form, when the running score may not match the sliders.
 
         :return: None
         """
         try:
-            values = [slider.value() for slider in
-                      [
-                          self.b_slider, self.b_slider_2, self.b_slider_3, self.b_slider_4,
-                          self.b_slider_5, self.b_slider_6, self.b_slider_7, self.b_slider_8,
-                          self.b_slider_9, self.b_slider_10, self.b_slider_11, self.b_slider_12,
-                          self.b_slider_13, self.b_slider_14, self.b_slider_15, self.b_slider_16,
-                          self.b_slider_17, self.b_slider_18, self.b_slider_19, self.b_slider_20,
-                          self.b_slider_21
-                      ] if
-                      slider.value() > 0]
+            items = list(self.running_score.items)
+            for index, form in self.beck_pages.items():
+                if index != BECK_SUMMARY_PAGE:
+                    items[index] = getattr(form, BECK_PAGE_SLIDERS[index][0]).value()
+            self.show_beck_score(self.running_score.reset(items))
+        except Exception as e:
+            logger.error("%s", e, exc_info=True)
+
+    def on_beck_item_changed(self, position: int, value: int) -> None:
+        """
+        Applies one item slider's new value to the running score in constant time.
 
-            sumabitch = sum(values)
+        Args:
+            position (int): The item's position in BECK_ITEM_COLUMNS order, which is also
+                its exam page's index.
+            value (int): The slider's new value.
+
+        Returns:
+            None
+        """
+        self.show_beck_score(self.running_score.update(position, value))
+
+    def set_beck_form(self, values: Mapping[str, Any]) -> None:
+        """
+        Sets many exam form widgets at once with their signals blocked, then scores the form
+        once.
 
-            self.beck_summary.setValue(int(sumabitch))
+        Setting the 21 sliders one by one would send every value through its spinbox link and
+        the running score; in a batch the linked spinboxes are set directly and
+        update_beck_summary makes the one consolidated change. Pages that are not built yet are
+        not built for this: their items go to the running score, which ensure_page starts
+        them from, and the summary is derived either way.
 
-        except Exception as e:
-            logger.error(f"{e}", exc_info=True)
+        Args:
+            values (Mapping[str, Any]): New values by widget name: a QDate for beck_date, a
+                QTime for beck_time and an int for a slider.
+
+        Returns:
+            None
+        """
+        sliders = {}
+        others = {}
+        unbuilt = list(self.running_score.items)
+        for name, value in values.items():
+            index = BECK_PAGE_OF_WIDGET.get(name)
+            if index is not None and index not in self.beck_pages:
+                if index != BECK_SUMMARY_PAGE:
+                    unbuilt[index] = value
+                continue
+            widget = self.form_widget(name)
+            if widget in self.slider_spinboxes or isinstance(widget, QtWidgets.QSlider):
+                sliders[widget] = value
+            else:
+                others[widget] = value
+        with batch_update(others):
+            for widget, value in others.items():
+                if isinstance(value, QDate):
+                    widget.setDate(value)
+                elif isinstance(value, QTime):
+                    widget.setTime(value)
+                else:
+                    widget.setValue(value)
+            set_linked_values(sliders, self.slider_spinboxes)
+        self.running_score.reset(unbuilt)
+        self.update_beck_summary()
+
+    def show_beck_score(self, score: Score) -> None:
+        """
+        Shows a score on the summary slider, and its severity band and subscales on the
+        summary spin box's tooltip. Until the summary page is built there is nothing to show;
+        building it shows the running score.
+
+        Args:
+            score (Score): The form's current score.
+
+        Returns:
+            None
+        """
+        form = self.beck_pages.get(BECK_SUMMARY_PAGE)
+        if form is None:
+            return
+        form.beck_summary.setValue(score.total)
+        form.sum_box.setToolTip(
+            f"{score.severity}: cognitive-affective {score.cognitive_affective}, "
+            f"somatic {score.somatic}")
     
     def forward_backward_btn_set(self):
         self.actionNext.triggered.connect(self.next_page)
@@ -187,11 +499,13 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
     def next_page(self):
         current_index = self.stackedWidget.currentIndex()
         next_index = (current_index + 1) % self.stackedWidget.count()
+        self.ensure_page(next_index)
         self.stackedWidget.setCurrentIndex(next_index)
     
     def prev_page(self):
         current_index = self.stackedWidget.currentIndex()
         prev_index = (current_index - 1) % self.stackedWidget.count()
+        self.ensure_page(prev_index)
         self.stackedWidget.setCurrentIndex(prev_index)
     
     def go_home(self):
@@ -249,7 +563,7 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
             last_index = self.settings.value("lastPageIndex", 0, type=int)
             self.mainStack.setCurrentIndex(last_index)
         except Exception as e:
-            logger.error(f"Error occurred while setting up app_operations : {e}", exc_info=True)
+            logger.error("Error occurred while setting up app_operations : %s", e, exc_info=True)
     
     def auto_date_time(self):
         self.beck_time.setTime(QTime.currentTime())
@@ -273,7 +587,7 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         try:
             self.settings.setValue("lastPageIndex", index)
         except Exception as e:
-            logger.error(f"{e}", exc_info=True)
+            logger.error("%s", e, exc_info=True)
     
     # ////////////////////////////////////////////////////////////////////////////////////////
     # Minder Navigation
@@ -300,55 +614,13 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
                 action.triggered.connect(lambda _, p=page: change_main_stack(self.mainStack, p))
         
         except Exception as e:
-            logger.error(f"An error has occurred: {e}", exc_info=True)
-    
-    # ////////////////////////////////////////////////////////////////////////////////////////
-    # SLIDER UPDATES SPINBOX/VICE VERSA SETUP
-    # ////////////////////////////////////////////////////////////////////////////////////////
-    def slider_set_spinbox(self):
-        """
-        Connects sliders to their corresponding spinboxes.
-
-        This method establishes a connection between sliders and spinboxes
-        by mapping each slider to its corresponding spinbox. It then calls
-        the `connect_slider_spinbox` function to establish the connection.
-
-        Returns:
-            None
-        """
-        connect_slider_to_spinbox = {
-            self.b_slider: self.b_box,
-            self.b_slider_2: self.b_box_2,
-            self.b_slider_3: self.b_box_3,
-            self.b_slider_4: self.b_box_4,
-            self.b_slider_5: self.b_box_5,
-            self.b_slider_6: self.b_box_6,
-            self.b_slider_7: self.b_box_7,
-            self.b_slider_8: self.b_box_8,
-            self.b_slider_9: self.b_box_9,
-            self.b_slider_10: self.b_box_10,
-            self.b_slider_11: self.b_box_11,
-            self.b_slider_12: self.b_box_12,
-            self.b_slider_13: self.b_box_13,
-            self.b_slider_14: self.b_box_14,
-            self.b_slider_15: self.b_box_15,
-            self.b_slider_16: self.b_box_16,
-            self.b_slider_17: self.b_box_17,
-            self.b_slider_18: self.b_box_18,
-            self.b_slider_19: self.b_box_19,
-            self.b_slider_20: self.b_box_20,
-            self.b_slider_21: self.b_box_21,
-            self.beck_summary: self.sum_box,
-        }
-        
-        for slider, spinbox in connect_slider_to_spinbox.items():
-            connect_slider_spinbox(slider, spinbox)
+            logger.error("An error has occurred: %s", e, exc_info=True)
     
     def beck_table_commit(self) -> None:
         """
         Connects the 'commit' action to the 'add_mentalsolo_data' function and inserts data into the altman_table.
 
-        This method connects the 'commit' action to the 'add_beck_data' function, which inserts data into the beck_table.
+        This method connects the 'commit' action to commit_beck_form, which queues the data with 'add_beck_data'.
         The data to be inserted is retrieved from various UI elements in the main window.
 
         Raises:
@@ -356,8 +628,8 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         """
         try:
             self.actionCommit.triggered.connect(
-                lambda: add_beck_data(
-                    self, {
+                lambda: self.commit_beck_form(
+                    {
                         "beck_date": "beck_date",
                         "beck_time": "beck_time",
                         "b_slider": "b_slider",
@@ -382,11 +654,35 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
                         "b_slider_20": "b_slider_20",
                         "b_slider_21": "b_slider_21",
                         "beck_summary": "beck_summary",
-                        "model": "becks_model"
-                    },
-                    self.db_manager.insert_into_beck_table_aug_8, ))
+                    }))
         except Exception as e:
-            logger.error(f"An Error has occurred {e}", exc_info=True)
+            logger.error("An Error has occurred %s", e, exc_info=True)
+
+    def commit_beck_form(self, widget_names: Mapping[str, str]) -> None:
+        """
+        Queues the exam form for the background writer, after any assessments an earlier
+        failed write handed back, see on_beck_write_failed. If they cannot be queued, the user
+        is told and the form keeps its values.
+
+        Args:
+            widget_names (Mapping[str, str]): The form's widget names by column, as add_beck_data
+                expects them.
+
+        Returns:
+            None
+        """
+        try:
+            while self.unsaved_records:
+                record = self.unsaved_records[0]
+                self.beck_writer.enqueue(*(record[column] for column in BECK_INSERT_COLUMNS))
+                self.unsaved_records.pop(0)
+            add_beck_data(self, widget_names, self.beck_writer.enqueue)
+        except (queue.Full, RuntimeError) as e:
+            logger.error("Assessment not queued, the form keeps its values: %s", e)
+            QtWidgets.QMessageBox.warning(
+                self, "Commit",
+                f"The assessment was not saved and is still in the form. Commit it again "
+                f"shortly.\n{str(e) or 'Too many assessments are already waiting to be written.'}")
             
     def delete_group(self):
         """
@@ -409,6 +705,234 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
             )
         )
         
+    def setup_writer(self) -> None:
+        """
+        Connects the background writer's signals and starts its thread.
+
+        Committed records are added to the becks_model; failed transactions are logged by the writer
+        and leave the model untouched. If the writer cannot open the database, it reports that
+        through failed instead of opened and storage is never opened.
+
+        Returns:
+            None
+        """
+        self.beck_writer.opened.connect(self.on_writer_opened)
+        self.beck_writer.written.connect(self.on_beck_written)
+        self.beck_writer.failed.connect(self.on_beck_write_failed)
+        self.beck_writer.start()
+
+    def on_beck_written(self, records: list) -> None:
+        """
+        Adds the records the background writer committed to the becks_model in sorted position.
+
+        Args:
+            records (list): The records committed in one transaction, keyed by column name.
+        """
+        try:
+            for record in records:
+                self.becks_model.insert_record(record)
+        except Exception as e:
+            logger.error("Error refreshing becks_model after write: %s", e, exc_info=True)
+
+    def on_beck_write_failed(self, message: str, records: list) -> None:
+        """
+        Reports a background write failure, or the writer's failure to open the database.
+
+        The records that failed are kept in unsaved_records and queued again ahead of the form
+        on the next commit. The form was reset when its assessment was queued, so if it is
+        still untouched, every item at 0, the latest record is put back in it instead; a form
+        the user has started filling in is left alone. While the window closes, the records
+        are only kept, for closeEvent to save to a file.
+
+        Args:
+            message (str): The error reported by the writer.
+            records (list): The records that were not written, keyed by column name.
+        """
+        if not self.writer_opened:
+            self.storage_failed(message)
+            return
+        logger.error("%s assessments could not be saved: %s", len(records), message)
+        if not records:
+            return
+        self.unsaved_records.extend(records)
+        if self.closing:
+            return
+        if not any(self.running_score.items):
+            load_beck_exam(self, {name: name for name in BECK_FORM_COLUMNS}, self.unsaved_records.pop())
+            waiting = (f" {len(self.unsaved_records)} more are kept and will be saved with it."
+                       if self.unsaved_records else "")
+            text = f"The assessment could not be saved and is back in the form; commit it again to retry.{waiting}"
+        else:
+            text = (f"{len(self.unsaved_records)} assessments could not be saved. They are kept and "
+                    f"will be saved with the next commit; the form was left as it is.")
+        QtWidgets.QMessageBox.warning(self, "Commit", f"{text}\n{message}")
+
+    def save_unsaved_records(self) -> None:
+        """
+        Appends the records that could not be written to tkc.UNSAVED_FILE in the home
+        directory as JSON Lines, which Import reads back, and tells the user. Called while the
+        window closes, after the writer has stopped.
+
+        Returns:
+            None
+        """
+        if not self.unsaved_records:
+            return
+        path = os.path.join(os.path.expanduser('~'), tkc.UNSAVED_FILE)
+        try:
+            with open(path, 'a', encoding='utf-8') as unsaved_file:
+                for record in self.unsaved_records:
+                    unsaved_file.write(json.dumps(record) + '\n')
+        except OSError as e:
+            logger.error("Error saving %s unsaved assessments to %s: %s %s",
+                         len(self.unsaved_records), path, e, self.unsaved_records)
+            text = (f"{len(self.unsaved_records)} assessments could not be saved, nor written to "
+                    f"{path}: {e}\nThey are listed in the log.")
+        else:
+            logger.warning("Saved %s unsaved assessments to %s", len(self.unsaved_records), path)
+            text = (f"{len(self.unsaved_records)} assessments could not be saved to the database. "
+                    f"They were written to {path}; import that file to add them.")
+        self.unsaved_records = []
+        QtWidgets.QMessageBox.warning(self, "Unsaved assessments", text)
+
+    def setup_edit_buffer(self) -> None:
+        """
+        Adds the actions that save or discard buffered table edits, and saves them whenever
+        focus leaves the table.
+
+        Returns:
+            None
+        """
+        self.actionSaveEdits = QAction("Save Table Edits", self)
+        self.actionSaveEdits.setShortcut("Ctrl+S")
+        self.actionSaveEdits.triggered.connect(lambda: self.becks_model.flush())
+        self.actionDiscardEdits = QAction("Discard Table Edits", self)
+        self.actionDiscardEdits.setShortcut("Ctrl+Shift+R")
+        self.actionDiscardEdits.triggered.connect(lambda: self.becks_model.discard())
+        self.menuData.addAction(self.actionSaveEdits)
+        self.menuData.addAction(self.actionDiscardEdits)
+        QtWidgets.QApplication.instance().focusChanged.connect(self.on_focus_changed)
+
+    def setup_export(self) -> None:
+        """
+        Adds the action that exports every assessment to a CSV or JSON Lines file.
+
+        Returns:
+            None
+        """
+        self.actionExport = QAction("Export Assessments...", self)
+        self.actionExport.setShortcut("Ctrl+E")
+        self.actionExport.triggered.connect(
+            lambda: export_records(
+                self,
+                self.db_manager,
+                'becks_model'
+            )
+        )
+        self.menuData.addAction(self.actionExport)
+
+    def setup_import(self) -> None:
+        """
+        Adds the action that imports assessments from a CSV or JSON Lines file.
+
+        Returns:
+            None
+        """
+        self.actionImport = QAction("Import Assessments...", self)
+        self.actionImport.setShortcut("Ctrl+I")
+        self.actionImport.triggered.connect(
+            lambda: import_records(
+                self,
+                self.db_manager,
+                'becks_model'
+            )
+        )
+        self.menuData.addAction(self.actionImport)
+
+    def setup_load_into_form(self) -> None:
+        """
+        Adds the action that copies the selected table row into the exam form.
+
+        Returns:
+            None
+        """
+        self.actionLoadIntoForm = QAction("Load Assessment into Form", self)
+        self.actionLoadIntoForm.setShortcut("Ctrl+L")
+        self.actionLoadIntoForm.triggered.connect(self.load_selected_into_form)
+        self.menuData.addAction(self.actionLoadIntoForm)
+
+    def load_selected_into_form(self) -> None:
+        """
+        Fills the exam form with the table's current row and shows the form, so a new
+        assessment can start from a previous one. The stored row is not changed.
+
+        Returns:
+            None
+        """
+        index = self.beck_table.currentIndex()
+        if not index.isValid():
+            return
+        model = self.beck_table.model()
+        record = {
+            model.headerData(column, Qt.Orientation.Horizontal): model.index(index.row(), column).data()
+            for column in range(model.columnCount())
+        }
+        load_beck_exam(self, {name: name for name in BECK_FORM_COLUMNS}, record)
+        self.switch_to_page0()
+
+    def setup_themes(self) -> None:
+        """
+        Adds a checkable action per theme to the Views menu; choosing one restyles the open
+        window and is remembered for the next start.
+
+        Returns:
+            None
+        """
+        self.themeActions = QActionGroup(self)
+        self.themeActions.setExclusive(True)
+        current = saved_theme(self.settings)
+        self.menuViews.addSeparator()
+        for name in THEMES:
+            action = QAction(f"{name.capitalize()} Theme", self)
+            action.setCheckable(True)
+            action.setChecked(name == current)
+            action.triggered.connect(partial(self.set_theme, name))
+            self.themeActions.addAction(action)
+            self.menuViews.addAction(action)
+
+    def set_theme(self, name: str) -> None:
+        """
+        Applies a theme to the application and saves it as the user's choice.
+
+        Args:
+            name (str): The theme, one of ui.theme.THEMES.
+
+        Returns:
+            None
+        """
+        try:
+            apply_theme(QtWidgets.QApplication.instance(), name)
+            self.settings.setValue(SETTINGS_KEY, name)
+        except (ValueError, RuntimeError) as e:
+            logger.error("Error switching to the %s theme: %s", name, e)
+
+    def on_focus_changed(self, old, new) -> None:
+        """
+        Flushes buffered table edits once focus moves away from the table and its editors.
+
+        Args:
+            old (QWidget): The widget that lost focus.
+            new (QWidget): The widget that gained focus, or None if the application lost it.
+        """
+        try:
+            if self.becks_model is None or not self.becks_model.has_pending_edits():
+                return
+            if new is not None and (new is self.beck_table or self.beck_table.isAncestorOf(new)):
+                return
+            self.becks_model.flush()
+        except Exception as e:
+            logger.error("Error saving table edits on focus change: %s", e, exc_info=True)
+
     def setup_models(self) -> None:
         """
         Set up the models for the main window.
@@ -439,11 +963,11 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
             try:
                 self.settings.setValue("geometry", self.saveGeometry())
             except Exception as e:
-                logger.error(f"Error saving the minds_module geo{e}", exc_info=True)
+                logger.error("Error saving the minds_module geo%s", e, exc_info=True)
             try:
                 self.settings.setValue("windowState", self.saveState())
             except Exception as e:
-                logger.error(f"Error saving the minds_module geo{e}", exc_info=True)
+                logger.error("Error saving the minds_module geo%s", e, exc_info=True)
     
     def restore_state(self) -> None:
         """
@@ -460,18 +984,19 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
             # restore window geometry state
             self.restoreGeometry(self.settings.value("geometry", QByteArray()))
         except Exception as e:
-            logger.error(f"Error restoring the minds module : stress state {e}")
+            logger.error("Error restoring the minds module : stress state %s", e)
         
         try:
             self.restoreState(self.settings.value("windowState", QByteArray()))
         except Exception as e:
-            logger.error(f"Error restoring WINDOW STATE {e}", exc_info=True)
+            logger.error("Error restoring WINDOW STATE %s", e, exc_info=True)
     
     def closeEvent(self, event: QCloseEvent) -> None:
             """
             Event handler for the close event of the window.
 
-            Saves the state before closing the window.
+            Saves the state before closing the window, then stops the background writer.
+            Records it could not write are saved to a file, see save_unsaved_records.
 
             Args:
                 event (QCloseEvent): The close event object.
@@ -482,4 +1007,20 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
             try:
                 self.save_state()
             except Exception as e:
-                logger.error(f"error saving state during closure: {e}", exc_info=True)
+                logger.error("error saving state during closure: %s", e, exc_info=True)
+            try:
+                if self.becks_model is not None:
+                    self.becks_model.flush()
+            except Exception as e:
+                logger.error("error saving table edits during closure: %s", e, exc_info=True)
+            self.closing = True
+            try:
+                self.beck_writer.stop()
+                # Failures the writer reported while stopping are still queued for this thread.
+                QCoreApplication.sendPostedEvents(None, QEvent.Type.MetaCall)
+            except Exception as e:
+                logger.error("error flushing pending writes during closure: %s", e, exc_info=True)
+            try:
+                self.save_unsaved_records()
+            except Exception as e:
+                logger.error("error saving unsaved assessments during closure: %s", e, exc_info=True)
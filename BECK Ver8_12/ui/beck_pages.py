@@ -0,0 +1,57 @@
+"""
+The exam pages of stackedWidget, each built from its own generated form the first time it is needed.
+
+beckyAug26.ui holds the exam pages empty. Each page's contents are in its own form,
+beck_pages/beck_page_NN.ui beside it, NN being the page's index in stackedWidget, and are
+generated the same way as gui.py:
+
+    pyuic6 beck_pages/beck_page_00.ui -o "BECK Ver8_12/ui/main_ui/beck_pages/beck_page_00.py"
+
+A page's module is only imported when the page is built. MainWindow.ensure_page builds a page
+and connects its slider; benchmarks/bench_exam_pages.py compares building them on demand with
+building them all up front.
+"""
+import importlib
+from typing import Any, Dict
+
+from PyQt6.QtWidgets import QWidget
+
+# The slider and spin box of each exam page, by stackedWidget index. Pages 0-20 hold the items
+# in BECK_ITEM_COLUMNS order and the last page the summary.
+BECK_PAGE_SLIDERS = (
+    ('b_slider', 'b_box'), ('b_slider_2', 'b_box_2'), ('b_slider_3', 'b_box_3'),
+    ('b_slider_4', 'b_box_4'), ('b_slider_5', 'b_box_5'), ('b_slider_6', 'b_box_6'),
+    ('b_slider_7', 'b_box_7'), ('b_slider_8', 'b_box_8'), ('b_slider_9', 'b_box_9'),
+    ('b_slider_10', 'b_box_10'), ('b_slider_11', 'b_box_11'), ('b_slider_12', 'b_box_12'),
+    ('b_slider_13', 'b_box_13'), ('b_slider_14', 'b_box_14'), ('b_slider_15', 'b_box_15'),
+    ('b_slider_16', 'b_box_16'), ('b_slider_17', 'b_box_17'), ('b_slider_18', 'b_box_18'),
+    ('b_slider_19', 'b_box_19'), ('b_slider_20', 'b_box_20'), ('b_slider_21', 'b_box_21'),
+    ('beck_summary', 'sum_box'),
+)
+BECK_SUMMARY_PAGE = len(BECK_PAGE_SLIDERS) - 1
+# The exam page each slider and spin box is on, by widget name.
+BECK_PAGE_OF_WIDGET: Dict[str, int] = {
+    name: index for index, names in enumerate(BECK_PAGE_SLIDERS) for name in names
+}
+
+
+def build_beck_page(page: QWidget, index: int) -> Any:
+    """
+    Builds an exam page's contents from its generated form.
+
+    Args:
+        page (QWidget): The empty page, stackedWidget.widget(index).
+        index (int): The page's index in stackedWidget.
+
+    Returns:
+        Any: The page's form object, Ui_BeckPageNN, whose attributes are the page's widgets.
+
+    Raises:
+        IndexError: If there is no exam page with that index.
+    """
+    if not 0 <= index < len(BECK_PAGE_SLIDERS):
+        raise IndexError(f"No exam page {index}, expected 0-{len(BECK_PAGE_SLIDERS) - 1}")
+    module = importlib.import_module(f'ui.main_ui.beck_pages.beck_page_{index:02d}')
+    form = getattr(module, f'Ui_BeckPage{index:02d}')()
+    form.setupUi(page)
+    return form
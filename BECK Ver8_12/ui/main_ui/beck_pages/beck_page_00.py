@@ -0,0 +1,72 @@
+# Form implementation generated from reading ui file 'beck_pages/beck_page_00.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_BeckPage00(object):
+    def setupUi(self, pageOne):
+        pageOne.setObjectName("pageOne")
+        self.gridLayout = QtWidgets.QGridLayout(pageOne)
+        self.gridLayout.setObjectName("gridLayout")
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout.addItem(spacerItem, 0, 0, 1, 1)
+        self.frame = QtWidgets.QFrame(parent=pageOne)
+        self.frame.setObjectName("frame")
+        self.gridLayout_2 = QtWidgets.QGridLayout(self.frame)
+        self.gridLayout_2.setContentsMargins(12, 0, 0, 0)
+        self.gridLayout_2.setObjectName("gridLayout_2")
+        self.b_slider = QtWidgets.QSlider(parent=self.frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.b_slider.sizePolicy().hasHeightForWidth())
+        self.b_slider.setSizePolicy(sizePolicy)
+        self.b_slider.setMaximum(3)
+        self.b_slider.setProperty("value", 0)
+        self.b_slider.setOrientation(QtCore.Qt.Orientation.Vertical)
+        self.b_slider.setInvertedAppearance(True)
+        self.b_slider.setObjectName("b_slider")
+        self.gridLayout_2.addWidget(self.b_slider, 1, 0, 1, 1)
+        self.frame1 = QtWidgets.QFrame(parent=self.frame)
+        self.frame1.setObjectName("frame1")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.frame1)
+        self.verticalLayout.setContentsMargins(9, 9, 9, 9)
+        self.verticalLayout.setSpacing(6)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.label_2 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_2.setObjectName("label_2")
+        self.verticalLayout.addWidget(self.label_2)
+        self.label_3 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_3.setObjectName("label_3")
+        self.verticalLayout.addWidget(self.label_3)
+        self.label_4 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_4.setObjectName("label_4")
+        self.verticalLayout.addWidget(self.label_4)
+        self.label_5 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_5.setObjectName("label_5")
+        self.verticalLayout.addWidget(self.label_5)
+        self.gridLayout_2.addWidget(self.frame1, 1, 1, 1, 1)
+        self.b_box = QtWidgets.QSpinBox(parent=self.frame)
+        self.b_box.setFrame(False)
+        self.b_box.setButtonSymbols(QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons)
+        self.b_box.setObjectName("b_box")
+        self.gridLayout_2.addWidget(self.b_box, 0, 0, 1, 2)
+        self.gridLayout.addWidget(self.frame, 3, 0, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout.addItem(spacerItem1, 4, 0, 1, 1)
+
+        self.retranslateUi(pageOne)
+        QtCore.QMetaObject.connectSlotsByName(pageOne)
+
+    def retranslateUi(self, pageOne):
+        _translate = QtCore.QCoreApplication.translate
+        self.label_2.setText(_translate("BeckPage00", "Today, I do not feel sad."))
+        self.label_3.setText(_translate("BeckPage00", "Today, I feel sad."))
+        self.label_4.setText(_translate("BeckPage00", "Today, I feel sad all the time and can\'t snap out of it."))
+        self.label_5.setText(_translate("BeckPage00", "Today, I feel so sad and unhappy that I can\'t stand it."))
@@ -0,0 +1,67 @@
+# Form implementation generated from reading ui file 'beck_pages/beck_page_01.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_BeckPage01(object):
+    def setupUi(self, pageOne1):
+        pageOne1.setObjectName("pageOne1")
+        self.gridLayout_5 = QtWidgets.QGridLayout(pageOne1)
+        self.gridLayout_5.setObjectName("gridLayout_5")
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_5.addItem(spacerItem, 0, 0, 1, 1)
+        self.frame_13 = QtWidgets.QFrame(parent=pageOne1)
+        self.frame_13.setObjectName("frame_13")
+        self.gridLayout_28 = QtWidgets.QGridLayout(self.frame_13)
+        self.gridLayout_28.setContentsMargins(12, 0, 0, 0)
+        self.gridLayout_28.setObjectName("gridLayout_28")
+        self.b_slider_2 = QtWidgets.QSlider(parent=self.frame_13)
+        self.b_slider_2.setMaximum(3)
+        self.b_slider_2.setProperty("value", 0)
+        self.b_slider_2.setOrientation(QtCore.Qt.Orientation.Vertical)
+        self.b_slider_2.setInvertedAppearance(True)
+        self.b_slider_2.setObjectName("b_slider_2")
+        self.gridLayout_28.addWidget(self.b_slider_2, 1, 0, 1, 1)
+        self.frame = QtWidgets.QFrame(parent=self.frame_13)
+        self.frame.setObjectName("frame")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.frame)
+        self.verticalLayout_3.setContentsMargins(9, 9, 9, 9)
+        self.verticalLayout_3.setSpacing(6)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.label_11 = QtWidgets.QLabel(parent=self.frame)
+        self.label_11.setObjectName("label_11")
+        self.verticalLayout_3.addWidget(self.label_11)
+        self.label_10 = QtWidgets.QLabel(parent=self.frame)
+        self.label_10.setObjectName("label_10")
+        self.verticalLayout_3.addWidget(self.label_10)
+        self.label_12 = QtWidgets.QLabel(parent=self.frame)
+        self.label_12.setObjectName("label_12")
+        self.verticalLayout_3.addWidget(self.label_12)
+        self.label_13 = QtWidgets.QLabel(parent=self.frame)
+        self.label_13.setObjectName("label_13")
+        self.verticalLayout_3.addWidget(self.label_13)
+        self.gridLayout_28.addWidget(self.frame, 1, 1, 1, 1)
+        self.b_box_2 = QtWidgets.QSpinBox(parent=self.frame_13)
+        self.b_box_2.setFrame(False)
+        self.b_box_2.setButtonSymbols(QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons)
+        self.b_box_2.setObjectName("b_box_2")
+        self.gridLayout_28.addWidget(self.b_box_2, 0, 0, 1, 2)
+        self.gridLayout_5.addWidget(self.frame_13, 2, 0, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_5.addItem(spacerItem1, 3, 0, 1, 1)
+
+        self.retranslateUi(pageOne1)
+        QtCore.QMetaObject.connectSlotsByName(pageOne1)
+
+    def retranslateUi(self, pageOne1):
+        _translate = QtCore.QCoreApplication.translate
+        self.label_11.setText(_translate("BeckPage01", "I feel fine about the future"))
+        self.label_10.setText(_translate("BeckPage01", "I am not particularly discouraged about the future."))
+        self.label_12.setText(_translate("BeckPage01", "I feel I have nothing to look forward to."))
+        self.label_13.setText(_translate("BeckPage01", "I feel the future is hopeless and that things cannot improve."))
@@ -0,0 +1,66 @@
+# Form implementation generated from reading ui file 'beck_pages/beck_page_02.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_BeckPage02(object):
+    def setupUi(self, pageOne2):
+        pageOne2.setObjectName("pageOne2")
+        self.gridLayout_4 = QtWidgets.QGridLayout(pageOne2)
+        self.gridLayout_4.setObjectName("gridLayout_4")
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_4.addItem(spacerItem, 2, 0, 1, 1)
+        self.frame = QtWidgets.QFrame(parent=pageOne2)
+        self.frame.setObjectName("frame")
+        self.gridLayout_29 = QtWidgets.QGridLayout(self.frame)
+        self.gridLayout_29.setContentsMargins(12, 0, 0, 0)
+        self.gridLayout_29.setObjectName("gridLayout_29")
+        self.b_slider_3 = QtWidgets.QSlider(parent=self.frame)
+        self.b_slider_3.setMaximum(3)
+        self.b_slider_3.setProperty("value", 0)
+        self.b_slider_3.setOrientation(QtCore.Qt.Orientation.Vertical)
+        self.b_slider_3.setInvertedAppearance(True)
+        self.b_slider_3.setObjectName("b_slider_3")
+        self.gridLayout_29.addWidget(self.b_slider_3, 1, 0, 1, 1)
+        self.frame1 = QtWidgets.QFrame(parent=self.frame)
+        self.frame1.setObjectName("frame1")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.frame1)
+        self.verticalLayout_2.setContentsMargins(9, 9, 9, 9)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.label_6 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_6.setObjectName("label_6")
+        self.verticalLayout_2.addWidget(self.label_6)
+        self.label_7 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_7.setObjectName("label_7")
+        self.verticalLayout_2.addWidget(self.label_7)
+        self.label_8 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_8.setObjectName("label_8")
+        self.verticalLayout_2.addWidget(self.label_8)
+        self.label_9 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_9.setObjectName("label_9")
+        self.verticalLayout_2.addWidget(self.label_9)
+        self.gridLayout_29.addWidget(self.frame1, 1, 1, 1, 1)
+        self.b_box_3 = QtWidgets.QSpinBox(parent=self.frame)
+        self.b_box_3.setFrame(False)
+        self.b_box_3.setButtonSymbols(QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons)
+        self.b_box_3.setObjectName("b_box_3")
+        self.gridLayout_29.addWidget(self.b_box_3, 0, 0, 1, 2)
+        self.gridLayout_4.addWidget(self.frame, 1, 0, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_4.addItem(spacerItem1, 0, 0, 1, 1)
+
+        self.retranslateUi(pageOne2)
+        QtCore.QMetaObject.connectSlotsByName(pageOne2)
+
+    def retranslateUi(self, pageOne2):
+        _translate = QtCore.QCoreApplication.translate
+        self.label_6.setText(_translate("BeckPage02", "I do not feel like a failure."))
+        self.label_7.setText(_translate("BeckPage02", "I feel I have failed more than the average person."))
+        self.label_8.setText(_translate("BeckPage02", "As I look back on my life, all I can see is a lot of failures."))
+        self.label_9.setText(_translate("BeckPage02", "I feel I am a complete failure as a person."))
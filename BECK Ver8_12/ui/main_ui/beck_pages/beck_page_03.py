@@ -0,0 +1,66 @@
+# Form implementation generated from reading ui file 'beck_pages/beck_page_03.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_BeckPage03(object):
+    def setupUi(self, pageOne3):
+        pageOne3.setObjectName("pageOne3")
+        self.gridLayout_8 = QtWidgets.QGridLayout(pageOne3)
+        self.gridLayout_8.setObjectName("gridLayout_8")
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_8.addItem(spacerItem, 3, 0, 1, 1)
+        self.frame_2 = QtWidgets.QFrame(parent=pageOne3)
+        self.frame_2.setObjectName("frame_2")
+        self.gridLayout_30 = QtWidgets.QGridLayout(self.frame_2)
+        self.gridLayout_30.setContentsMargins(12, 0, 0, 0)
+        self.gridLayout_30.setObjectName("gridLayout_30")
+        self.b_slider_4 = QtWidgets.QSlider(parent=self.frame_2)
+        self.b_slider_4.setMaximum(3)
+        self.b_slider_4.setOrientation(QtCore.Qt.Orientation.Vertical)
+        self.b_slider_4.setInvertedAppearance(True)
+        self.b_slider_4.setInvertedControls(False)
+        self.b_slider_4.setObjectName("b_slider_4")
+        self.gridLayout_30.addWidget(self.b_slider_4, 1, 0, 1, 1)
+        self.frame_20 = QtWidgets.QFrame(parent=self.frame_2)
+        self.frame_20.setObjectName("frame_20")
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout(self.frame_20)
+        self.verticalLayout_4.setContentsMargins(9, 9, 9, 9)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.label_14 = QtWidgets.QLabel(parent=self.frame_20)
+        self.label_14.setObjectName("label_14")
+        self.verticalLayout_4.addWidget(self.label_14)
+        self.label_15 = QtWidgets.QLabel(parent=self.frame_20)
+        self.label_15.setObjectName("label_15")
+        self.verticalLayout_4.addWidget(self.label_15)
+        self.label_16 = QtWidgets.QLabel(parent=self.frame_20)
+        self.label_16.setObjectName("label_16")
+        self.verticalLayout_4.addWidget(self.label_16)
+        self.label_17 = QtWidgets.QLabel(parent=self.frame_20)
+        self.label_17.setObjectName("label_17")
+        self.verticalLayout_4.addWidget(self.label_17)
+        self.gridLayout_30.addWidget(self.frame_20, 1, 1, 1, 1)
+        self.b_box_4 = QtWidgets.QSpinBox(parent=self.frame_2)
+        self.b_box_4.setFrame(False)
+        self.b_box_4.setButtonSymbols(QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons)
+        self.b_box_4.setObjectName("b_box_4")
+        self.gridLayout_30.addWidget(self.b_box_4, 0, 0, 1, 2)
+        self.gridLayout_8.addWidget(self.frame_2, 2, 0, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_8.addItem(spacerItem1, 0, 0, 1, 1)
+
+        self.retranslateUi(pageOne3)
+        QtCore.QMetaObject.connectSlotsByName(pageOne3)
+
+    def retranslateUi(self, pageOne3):
+        _translate = QtCore.QCoreApplication.translate
+        self.label_14.setText(_translate("BeckPage03", "I get as much satisfaction out of things as I used to."))
+        self.label_15.setText(_translate("BeckPage03", "I don\'t enjoy things the way I used to."))
+        self.label_16.setText(_translate("BeckPage03", "I don\'t get real satisfaction out of anything anymore."))
+        self.label_17.setText(_translate("BeckPage03", "I am dissatisfied or bored with everything."))
@@ -0,0 +1,64 @@
+# Form implementation generated from reading ui file 'beck_pages/beck_page_04.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_BeckPage04(object):
+    def setupUi(self, pageOne4):
+        pageOne4.setObjectName("pageOne4")
+        self.gridLayout_6 = QtWidgets.QGridLayout(pageOne4)
+        self.gridLayout_6.setObjectName("gridLayout_6")
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_6.addItem(spacerItem, 0, 0, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_6.addItem(spacerItem1, 3, 0, 1, 1)
+        self.frame = QtWidgets.QFrame(parent=pageOne4)
+        self.frame.setObjectName("frame")
+        self.gridLayout_31 = QtWidgets.QGridLayout(self.frame)
+        self.gridLayout_31.setContentsMargins(12, 0, 0, 0)
+        self.gridLayout_31.setObjectName("gridLayout_31")
+        self.b_slider_5 = QtWidgets.QSlider(parent=self.frame)
+        self.b_slider_5.setMaximum(3)
+        self.b_slider_5.setOrientation(QtCore.Qt.Orientation.Vertical)
+        self.b_slider_5.setInvertedAppearance(True)
+        self.b_slider_5.setObjectName("b_slider_5")
+        self.gridLayout_31.addWidget(self.b_slider_5, 1, 0, 1, 1)
+        self.frame1 = QtWidgets.QFrame(parent=self.frame)
+        self.frame1.setObjectName("frame1")
+        self.verticalLayout_8 = QtWidgets.QVBoxLayout(self.frame1)
+        self.verticalLayout_8.setObjectName("verticalLayout_8")
+        self.label_30 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_30.setObjectName("label_30")
+        self.verticalLayout_8.addWidget(self.label_30)
+        self.label_33 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_33.setObjectName("label_33")
+        self.verticalLayout_8.addWidget(self.label_33)
+        self.label_32 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_32.setObjectName("label_32")
+        self.verticalLayout_8.addWidget(self.label_32)
+        self.label_31 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_31.setObjectName("label_31")
+        self.verticalLayout_8.addWidget(self.label_31)
+        self.gridLayout_31.addWidget(self.frame1, 1, 1, 1, 1)
+        self.b_box_5 = QtWidgets.QSpinBox(parent=self.frame)
+        self.b_box_5.setFrame(False)
+        self.b_box_5.setButtonSymbols(QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons)
+        self.b_box_5.setObjectName("b_box_5")
+        self.gridLayout_31.addWidget(self.b_box_5, 0, 0, 1, 2)
+        self.gridLayout_6.addWidget(self.frame, 2, 0, 1, 1)
+
+        self.retranslateUi(pageOne4)
+        QtCore.QMetaObject.connectSlotsByName(pageOne4)
+
+    def retranslateUi(self, pageOne4):
+        _translate = QtCore.QCoreApplication.translate
+        self.label_30.setText(_translate("BeckPage04", "I don\'t feel particularly guilty"))
+        self.label_33.setText(_translate("BeckPage04", "I feel guilty a good part of the time."))
+        self.label_32.setText(_translate("BeckPage04", "I feel quite guilty most of the time."))
+        self.label_31.setText(_translate("BeckPage04", "I feel guilty all of the time."))
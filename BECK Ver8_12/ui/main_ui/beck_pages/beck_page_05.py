@@ -0,0 +1,64 @@
+# Form implementation generated from reading ui file 'beck_pages/beck_page_05.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_BeckPage05(object):
+    def setupUi(self, pageOne5):
+        pageOne5.setObjectName("pageOne5")
+        self.gridLayout_7 = QtWidgets.QGridLayout(pageOne5)
+        self.gridLayout_7.setObjectName("gridLayout_7")
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_7.addItem(spacerItem, 0, 0, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_7.addItem(spacerItem1, 3, 0, 1, 1)
+        self.frame = QtWidgets.QFrame(parent=pageOne5)
+        self.frame.setObjectName("frame")
+        self.gridLayout_32 = QtWidgets.QGridLayout(self.frame)
+        self.gridLayout_32.setContentsMargins(12, 0, 0, 0)
+        self.gridLayout_32.setObjectName("gridLayout_32")
+        self.frame1 = QtWidgets.QFrame(parent=self.frame)
+        self.frame1.setObjectName("frame1")
+        self.verticalLayout_21 = QtWidgets.QVBoxLayout(self.frame1)
+        self.verticalLayout_21.setObjectName("verticalLayout_21")
+        self.label_82 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_82.setObjectName("label_82")
+        self.verticalLayout_21.addWidget(self.label_82)
+        self.label_83 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_83.setObjectName("label_83")
+        self.verticalLayout_21.addWidget(self.label_83)
+        self.label_84 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_84.setObjectName("label_84")
+        self.verticalLayout_21.addWidget(self.label_84)
+        self.label_85 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_85.setObjectName("label_85")
+        self.verticalLayout_21.addWidget(self.label_85)
+        self.gridLayout_32.addWidget(self.frame1, 1, 1, 1, 1)
+        self.b_slider_6 = QtWidgets.QSlider(parent=self.frame)
+        self.b_slider_6.setMaximum(3)
+        self.b_slider_6.setOrientation(QtCore.Qt.Orientation.Vertical)
+        self.b_slider_6.setInvertedAppearance(True)
+        self.b_slider_6.setObjectName("b_slider_6")
+        self.gridLayout_32.addWidget(self.b_slider_6, 1, 0, 1, 1)
+        self.b_box_6 = QtWidgets.QSpinBox(parent=self.frame)
+        self.b_box_6.setFrame(False)
+        self.b_box_6.setButtonSymbols(QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons)
+        self.b_box_6.setObjectName("b_box_6")
+        self.gridLayout_32.addWidget(self.b_box_6, 0, 0, 1, 2)
+        self.gridLayout_7.addWidget(self.frame, 2, 0, 1, 1)
+
+        self.retranslateUi(pageOne5)
+        QtCore.QMetaObject.connectSlotsByName(pageOne5)
+
+    def retranslateUi(self, pageOne5):
+        _translate = QtCore.QCoreApplication.translate
+        self.label_82.setText(_translate("BeckPage05", "I don\'t feel I am being punished."))
+        self.label_83.setText(_translate("BeckPage05", "I feel I may be punished."))
+        self.label_84.setText(_translate("BeckPage05", "I expect to be punished."))
+        self.label_85.setText(_translate("BeckPage05", "I feel I am being punished."))
@@ -0,0 +1,64 @@
+# Form implementation generated from reading ui file 'beck_pages/beck_page_06.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_BeckPage06(object):
+    def setupUi(self, pageOne6):
+        pageOne6.setObjectName("pageOne6")
+        self.gridLayout_10 = QtWidgets.QGridLayout(pageOne6)
+        self.gridLayout_10.setObjectName("gridLayout_10")
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_10.addItem(spacerItem, 2, 0, 1, 1)
+        self.frame = QtWidgets.QFrame(parent=pageOne6)
+        self.frame.setObjectName("frame")
+        self.gridLayout_33 = QtWidgets.QGridLayout(self.frame)
+        self.gridLayout_33.setContentsMargins(12, 0, 0, 0)
+        self.gridLayout_33.setObjectName("gridLayout_33")
+        self.b_slider_7 = QtWidgets.QSlider(parent=self.frame)
+        self.b_slider_7.setMaximum(3)
+        self.b_slider_7.setOrientation(QtCore.Qt.Orientation.Vertical)
+        self.b_slider_7.setInvertedAppearance(True)
+        self.b_slider_7.setObjectName("b_slider_7")
+        self.gridLayout_33.addWidget(self.b_slider_7, 1, 0, 1, 1)
+        self.frame1 = QtWidgets.QFrame(parent=self.frame)
+        self.frame1.setObjectName("frame1")
+        self.verticalLayout_9 = QtWidgets.QVBoxLayout(self.frame1)
+        self.verticalLayout_9.setObjectName("verticalLayout_9")
+        self.label_34 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_34.setObjectName("label_34")
+        self.verticalLayout_9.addWidget(self.label_34)
+        self.label_35 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_35.setObjectName("label_35")
+        self.verticalLayout_9.addWidget(self.label_35)
+        self.label_36 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_36.setObjectName("label_36")
+        self.verticalLayout_9.addWidget(self.label_36)
+        self.label_37 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_37.setObjectName("label_37")
+        self.verticalLayout_9.addWidget(self.label_37)
+        self.gridLayout_33.addWidget(self.frame1, 1, 1, 1, 1)
+        self.b_box_7 = QtWidgets.QSpinBox(parent=self.frame)
+        self.b_box_7.setFrame(False)
+        self.b_box_7.setButtonSymbols(QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons)
+        self.b_box_7.setObjectName("b_box_7")
+        self.gridLayout_33.addWidget(self.b_box_7, 0, 0, 1, 2)
+        self.gridLayout_10.addWidget(self.frame, 1, 0, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_10.addItem(spacerItem1, 0, 0, 1, 1)
+
+        self.retranslateUi(pageOne6)
+        QtCore.QMetaObject.connectSlotsByName(pageOne6)
+
+    def retranslateUi(self, pageOne6):
+        _translate = QtCore.QCoreApplication.translate
+        self.label_34.setText(_translate("BeckPage06", "I don\'t feel disappointed in myself."))
+        self.label_35.setText(_translate("BeckPage06", "I am disappointed in myself."))
+        self.label_36.setText(_translate("BeckPage06", "I am disgusted with myself."))
+        self.label_37.setText(_translate("BeckPage06", "I hate myself."))
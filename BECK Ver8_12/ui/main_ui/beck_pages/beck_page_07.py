@@ -0,0 +1,64 @@
+# Form implementation generated from reading ui file 'beck_pages/beck_page_07.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_BeckPage07(object):
+    def setupUi(self, pageOne7):
+        pageOne7.setObjectName("pageOne7")
+        self.gridLayout_11 = QtWidgets.QGridLayout(pageOne7)
+        self.gridLayout_11.setObjectName("gridLayout_11")
+        self.frame = QtWidgets.QFrame(parent=pageOne7)
+        self.frame.setObjectName("frame")
+        self.gridLayout_34 = QtWidgets.QGridLayout(self.frame)
+        self.gridLayout_34.setContentsMargins(12, 0, 0, 0)
+        self.gridLayout_34.setObjectName("gridLayout_34")
+        self.frame1 = QtWidgets.QFrame(parent=self.frame)
+        self.frame1.setObjectName("frame1")
+        self.verticalLayout_7 = QtWidgets.QVBoxLayout(self.frame1)
+        self.verticalLayout_7.setObjectName("verticalLayout_7")
+        self.label_26 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_26.setObjectName("label_26")
+        self.verticalLayout_7.addWidget(self.label_26)
+        self.label_27 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_27.setObjectName("label_27")
+        self.verticalLayout_7.addWidget(self.label_27)
+        self.label_28 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_28.setObjectName("label_28")
+        self.verticalLayout_7.addWidget(self.label_28)
+        self.label_29 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_29.setObjectName("label_29")
+        self.verticalLayout_7.addWidget(self.label_29)
+        self.gridLayout_34.addWidget(self.frame1, 1, 1, 1, 1)
+        self.b_slider_8 = QtWidgets.QSlider(parent=self.frame)
+        self.b_slider_8.setMaximum(3)
+        self.b_slider_8.setOrientation(QtCore.Qt.Orientation.Vertical)
+        self.b_slider_8.setInvertedAppearance(True)
+        self.b_slider_8.setObjectName("b_slider_8")
+        self.gridLayout_34.addWidget(self.b_slider_8, 1, 0, 1, 1)
+        self.b_box_8 = QtWidgets.QSpinBox(parent=self.frame)
+        self.b_box_8.setFrame(False)
+        self.b_box_8.setButtonSymbols(QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons)
+        self.b_box_8.setObjectName("b_box_8")
+        self.gridLayout_34.addWidget(self.b_box_8, 0, 0, 1, 2)
+        self.gridLayout_11.addWidget(self.frame, 1, 0, 1, 1)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_11.addItem(spacerItem, 2, 0, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_11.addItem(spacerItem1, 0, 0, 1, 1)
+
+        self.retranslateUi(pageOne7)
+        QtCore.QMetaObject.connectSlotsByName(pageOne7)
+
+    def retranslateUi(self, pageOne7):
+        _translate = QtCore.QCoreApplication.translate
+        self.label_26.setText(_translate("BeckPage07", "I don\'t feel I am any worse than anybody else."))
+        self.label_27.setText(_translate("BeckPage07", "I am critical of myself for my weaknesses or mistakes."))
+        self.label_28.setText(_translate("BeckPage07", "I blame myself all the time for my faults."))
+        self.label_29.setText(_translate("BeckPage07", "I blame myself for everything bad that happens."))
@@ -0,0 +1,64 @@
+# Form implementation generated from reading ui file 'beck_pages/beck_page_08.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_BeckPage08(object):
+    def setupUi(self, pageOne8):
+        pageOne8.setObjectName("pageOne8")
+        self.gridLayout_12 = QtWidgets.QGridLayout(pageOne8)
+        self.gridLayout_12.setObjectName("gridLayout_12")
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_12.addItem(spacerItem, 2, 0, 1, 1)
+        self.frame = QtWidgets.QFrame(parent=pageOne8)
+        self.frame.setObjectName("frame")
+        self.gridLayout_35 = QtWidgets.QGridLayout(self.frame)
+        self.gridLayout_35.setContentsMargins(12, 0, 0, 0)
+        self.gridLayout_35.setObjectName("gridLayout_35")
+        self.b_slider_9 = QtWidgets.QSlider(parent=self.frame)
+        self.b_slider_9.setOrientation(QtCore.Qt.Orientation.Vertical)
+        self.b_slider_9.setInvertedAppearance(True)
+        self.b_slider_9.setObjectName("b_slider_9")
+        self.gridLayout_35.addWidget(self.b_slider_9, 1, 0, 1, 1)
+        self.frame1 = QtWidgets.QFrame(parent=self.frame)
+        self.frame1.setObjectName("frame1")
+        self.verticalLayout_6 = QtWidgets.QVBoxLayout(self.frame1)
+        self.verticalLayout_6.setContentsMargins(9, 9, 9, 9)
+        self.verticalLayout_6.setObjectName("verticalLayout_6")
+        self.label_22 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_22.setObjectName("label_22")
+        self.verticalLayout_6.addWidget(self.label_22)
+        self.label_23 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_23.setObjectName("label_23")
+        self.verticalLayout_6.addWidget(self.label_23)
+        self.label_24 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_24.setObjectName("label_24")
+        self.verticalLayout_6.addWidget(self.label_24)
+        self.label_25 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_25.setObjectName("label_25")
+        self.verticalLayout_6.addWidget(self.label_25)
+        self.gridLayout_35.addWidget(self.frame1, 1, 1, 1, 1)
+        self.b_box_9 = QtWidgets.QSpinBox(parent=self.frame)
+        self.b_box_9.setFrame(False)
+        self.b_box_9.setButtonSymbols(QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons)
+        self.b_box_9.setObjectName("b_box_9")
+        self.gridLayout_35.addWidget(self.b_box_9, 0, 0, 1, 2)
+        self.gridLayout_12.addWidget(self.frame, 1, 0, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_12.addItem(spacerItem1, 0, 0, 1, 1)
+
+        self.retranslateUi(pageOne8)
+        QtCore.QMetaObject.connectSlotsByName(pageOne8)
+
+    def retranslateUi(self, pageOne8):
+        _translate = QtCore.QCoreApplication.translate
+        self.label_22.setText(_translate("BeckPage08", "I don\'t have any thoughts of killing myself."))
+        self.label_23.setText(_translate("BeckPage08", "I have thoughts of killing myself, but I would not carry them out."))
+        self.label_24.setText(_translate("BeckPage08", "I would like to kill myself."))
+        self.label_25.setText(_translate("BeckPage08", "I would kill myself if I had the chance."))
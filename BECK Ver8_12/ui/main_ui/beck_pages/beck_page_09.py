@@ -0,0 +1,67 @@
+# Form implementation generated from reading ui file 'beck_pages/beck_page_09.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_BeckPage09(object):
+    def setupUi(self, pageOne9):
+        pageOne9.setObjectName("pageOne9")
+        self.gridLayout_13 = QtWidgets.QGridLayout(pageOne9)
+        self.gridLayout_13.setObjectName("gridLayout_13")
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_13.addItem(spacerItem, 2, 0, 1, 1)
+        self.frame = QtWidgets.QFrame(parent=pageOne9)
+        self.frame.setObjectName("frame")
+        self.gridLayout_36 = QtWidgets.QGridLayout(self.frame)
+        self.gridLayout_36.setContentsMargins(12, 0, 0, 0)
+        self.gridLayout_36.setObjectName("gridLayout_36")
+        self.b_slider_10 = QtWidgets.QSlider(parent=self.frame)
+        self.b_slider_10.setMaximum(3)
+        self.b_slider_10.setOrientation(QtCore.Qt.Orientation.Vertical)
+        self.b_slider_10.setInvertedAppearance(True)
+        self.b_slider_10.setInvertedControls(False)
+        self.b_slider_10.setObjectName("b_slider_10")
+        self.gridLayout_36.addWidget(self.b_slider_10, 1, 0, 1, 1)
+        self.frame1 = QtWidgets.QFrame(parent=self.frame)
+        self.frame1.setObjectName("frame1")
+        self.verticalLayout_5 = QtWidgets.QVBoxLayout(self.frame1)
+        self.verticalLayout_5.setContentsMargins(9, 9, 9, 9)
+        self.verticalLayout_5.setSpacing(6)
+        self.verticalLayout_5.setObjectName("verticalLayout_5")
+        self.label_19 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_19.setObjectName("label_19")
+        self.verticalLayout_5.addWidget(self.label_19)
+        self.label_18 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_18.setObjectName("label_18")
+        self.verticalLayout_5.addWidget(self.label_18)
+        self.label_20 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_20.setObjectName("label_20")
+        self.verticalLayout_5.addWidget(self.label_20)
+        self.label_21 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_21.setObjectName("label_21")
+        self.verticalLayout_5.addWidget(self.label_21)
+        self.gridLayout_36.addWidget(self.frame1, 1, 1, 1, 1)
+        self.b_box_10 = QtWidgets.QSpinBox(parent=self.frame)
+        self.b_box_10.setFrame(False)
+        self.b_box_10.setButtonSymbols(QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons)
+        self.b_box_10.setObjectName("b_box_10")
+        self.gridLayout_36.addWidget(self.b_box_10, 0, 0, 1, 2)
+        self.gridLayout_13.addWidget(self.frame, 1, 0, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_13.addItem(spacerItem1, 0, 0, 1, 1)
+
+        self.retranslateUi(pageOne9)
+        QtCore.QMetaObject.connectSlotsByName(pageOne9)
+
+    def retranslateUi(self, pageOne9):
+        _translate = QtCore.QCoreApplication.translate
+        self.label_19.setText(_translate("BeckPage09", "I don\'t cry any more than usual."))
+        self.label_18.setText(_translate("BeckPage09", "I cry more now than I used to."))
+        self.label_20.setText(_translate("BeckPage09", "I cry all the time now."))
+        self.label_21.setText(_translate("BeckPage09", "I used to be able to cry, but now I can\'t cry even though I want to."))
@@ -0,0 +1,66 @@
+# Form implementation generated from reading ui file 'beck_pages/beck_page_10.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_BeckPage10(object):
+    def setupUi(self, pageOne10):
+        pageOne10.setObjectName("pageOne10")
+        self.gridLayout_15 = QtWidgets.QGridLayout(pageOne10)
+        self.gridLayout_15.setObjectName("gridLayout_15")
+        self.frame = QtWidgets.QFrame(parent=pageOne10)
+        self.frame.setObjectName("frame")
+        self.gridLayout_37 = QtWidgets.QGridLayout(self.frame)
+        self.gridLayout_37.setContentsMargins(12, 0, 0, 0)
+        self.gridLayout_37.setObjectName("gridLayout_37")
+        self.frame1 = QtWidgets.QFrame(parent=self.frame)
+        self.frame1.setObjectName("frame1")
+        self.verticalLayout_10 = QtWidgets.QVBoxLayout(self.frame1)
+        self.verticalLayout_10.setContentsMargins(9, 9, 9, 9)
+        self.verticalLayout_10.setSpacing(6)
+        self.verticalLayout_10.setObjectName("verticalLayout_10")
+        self.label_38 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_38.setObjectName("label_38")
+        self.verticalLayout_10.addWidget(self.label_38)
+        self.label_39 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_39.setObjectName("label_39")
+        self.verticalLayout_10.addWidget(self.label_39)
+        self.label_40 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_40.setObjectName("label_40")
+        self.verticalLayout_10.addWidget(self.label_40)
+        self.label_41 = QtWidgets.QLabel(parent=self.frame1)
+        self.label_41.setObjectName("label_41")
+        self.verticalLayout_10.addWidget(self.label_41)
+        self.gridLayout_37.addWidget(self.frame1, 1, 1, 1, 1)
+        self.b_slider_11 = QtWidgets.QSlider(parent=self.frame)
+        self.b_slider_11.setMaximum(3)
+        self.b_slider_11.setOrientation(QtCore.Qt.Orientation.Vertical)
+        self.b_slider_11.setInvertedAppearance(True)
+        self.b_slider_11.setObjectName("b_slider_11")
+        self.gridLayout_37.addWidget(self.b_slider_11, 1, 0, 1, 1)
+        self.b_box_11 = QtWidgets.QSpinBox(parent=self.frame)
+        self.b_box_11.setFrame(False)
+        self.b_box_11.setButtonSymbols(QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons)
+        self.b_box_11.setObjectName("b_box_11")
+        self.gridLayout_37.addWidget(self.b_box_11, 0, 0, 1, 2)
+        self.gridLayout_15.addWidget(self.frame, 1, 0, 1, 1)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_15.addItem(spacerItem, 2, 0, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_15.addItem(spacerItem1, 0, 0, 1, 1)
+
+        self.retranslateUi(pageOne10)
+        QtCore.QMetaObject.connectSlotsByName(pageOne10)
+
+    def retranslateUi(self, pageOne10):
+        _translate = QtCore.QCoreApplication.translate
+        self.label_38.setText(_translate("BeckPage10", "I\'m not more irritable today than most days."))
+        self.label_39.setText(_translate("BeckPage10", "I am slightly more irritated now than usual."))
+        self.label_40.setText(_translate("BeckPage10", "I am quite annoyed or irritated a good deal of the time."))
+        self.label_41.setText(_translate("BeckPage10", "I feel irritated all the time."))
@@ -0,0 +1,64 @@
+# Form implementation generated from reading ui file 'beck_pages/beck_page_11.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_BeckPage11(object):
+    def setupUi(self, pageOne11):
+        pageOne11.setObjectName("pageOne11")
+        self.gridLayout_16 = QtWidgets.QGridLayout(pageOne11)
+        self.gridLayout_16.setObjectName("gridLayout_16")
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_16.addItem(spacerItem, 2, 0, 1, 1)
+        self.frame = QtWidgets.QFrame(parent=pageOne11)
+        self.frame.setObjectName("frame")
+        self.gridLayout_38 = QtWidgets.QGridLayout(self.frame)
+        self.gridLayout_38.setContentsMargins(12, 0, 0, 0)
+        self.gridLayout_38.setObjectName("gridLayout_38")
+        self.b_slider_12 = QtWidgets.QSlider(parent=self.frame)
+        self.b_slider_12.setMaximum(3)
+        self.b_slider_12.setOrientation(QtCore.Qt.Orientation.Vertical)
+        self.b_slider_12.setInvertedAppearance(True)
+        self.b_slider_12.setObjectName("b_slider_12")
+        self.gridLayout_38.addWidget(self.b_slider_12, 1, 0, 1, 1)
+        self.frame_2 = QtWidgets.QFrame(parent=self.frame)
+        self.frame_2.setObjectName("frame_2")
+        self.verticalLayout_11 = QtWidgets.QVBoxLayout(self.frame_2)
+        self.verticalLayout_11.setObjectName("verticalLayout_11")
+        self.label_42 = QtWidgets.QLabel(parent=self.frame_2)
+        self.label_42.setObjectName("label_42")
+        self.verticalLayout_11.addWidget(self.label_42)
+        self.label_43 = QtWidgets.QLabel(parent=self.frame_2)
+        self.label_43.setObjectName("label_43")
+        self.verticalLayout_11.addWidget(self.label_43)
+        self.label_44 = QtWidgets.QLabel(parent=self.frame_2)
+        self.label_44.setObjectName("label_44")
+        self.verticalLayout_11.addWidget(self.label_44)
+        self.label_45 = QtWidgets.QLabel(parent=self.frame_2)
+        self.label_45.setObjectName("label_45")
+        self.verticalLayout_11.addWidget(self.label_45)
+        self.gridLayout_38.addWidget(self.frame_2, 1, 1, 1, 1)
+        self.b_box_12 = QtWidgets.QSpinBox(parent=self.frame)
+        self.b_box_12.setFrame(False)
+        self.b_box_12.setButtonSymbols(QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons)
+        self.b_box_12.setObjectName("b_box_12")
+        self.gridLayout_38.addWidget(self.b_box_12, 0, 0, 1, 2)
+        self.gridLayout_16.addWidget(self.frame, 1, 0, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_16.addItem(spacerItem1, 0, 0, 1, 1)
+
+        self.retranslateUi(pageOne11)
+        QtCore.QMetaObject.connectSlotsByName(pageOne11)
+
+    def retranslateUi(self, pageOne11):
+        _translate = QtCore.QCoreApplication.translate
+        self.label_42.setText(_translate("BeckPage11", "Today I am as interested in others as I usually am."))
+        self.label_43.setText(_translate("BeckPage11", "I am less interested in other people than I used to be."))
+        self.label_44.setText(_translate("BeckPage11", "I have lost most of my interest in other people."))
+        self.label_45.setText(_translate("BeckPage11", "I have lost all of my interest in other people."))
@@ -0,0 +1,64 @@
+# Form implementation generated from reading ui file 'beck_pages/beck_page_12.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_BeckPage12(object):
+    def setupUi(self, pageOne12):
+        pageOne12.setObjectName("pageOne12")
+        self.gridLayout_18 = QtWidgets.QGridLayout(pageOne12)
+        self.gridLayout_18.setObjectName("gridLayout_18")
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_18.addItem(spacerItem, 2, 0, 1, 1)
+        self.frame = QtWidgets.QFrame(parent=pageOne12)
+        self.frame.setObjectName("frame")
+        self.gridLayout_39 = QtWidgets.QGridLayout(self.frame)
+        self.gridLayout_39.setContentsMargins(12, 0, 0, 0)
+        self.gridLayout_39.setObjectName("gridLayout_39")
+        self.frame_3 = QtWidgets.QFrame(parent=self.frame)
+        self.frame_3.setObjectName("frame_3")
+        self.verticalLayout_12 = QtWidgets.QVBoxLayout(self.frame_3)
+        self.verticalLayout_12.setObjectName("verticalLayout_12")
+        self.label_46 = QtWidgets.QLabel(parent=self.frame_3)
+        self.label_46.setObjectName("label_46")
+        self.verticalLayout_12.addWidget(self.label_46)
+        self.label_47 = QtWidgets.QLabel(parent=self.frame_3)
+        self.label_47.setObjectName("label_47")
+        self.verticalLayout_12.addWidget(self.label_47)
+        self.label_48 = QtWidgets.QLabel(parent=self.frame_3)
+        self.label_48.setObjectName("label_48")
+        self.verticalLayout_12.addWidget(self.label_48)
+        self.label_49 = QtWidgets.QLabel(parent=self.frame_3)
+        self.label_49.setObjectName("label_49")
+        self.verticalLayout_12.addWidget(self.label_49)
+        self.gridLayout_39.addWidget(self.frame_3, 1, 1, 1, 1)
+        self.b_slider_13 = QtWidgets.QSlider(parent=self.frame)
+        self.b_slider_13.setMaximum(3)
+        self.b_slider_13.setOrientation(QtCore.Qt.Orientation.Vertical)
+        self.b_slider_13.setInvertedAppearance(True)
+        self.b_slider_13.setObjectName("b_slider_13")
+        self.gridLayout_39.addWidget(self.b_slider_13, 1, 0, 1, 1)
+        self.b_box_13 = QtWidgets.QSpinBox(parent=self.frame)
+        self.b_box_13.setFrame(False)
+        self.b_box_13.setButtonSymbols(QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons)
+        self.b_box_13.setObjectName("b_box_13")
+        self.gridLayout_39.addWidget(self.b_box_13, 0, 0, 1, 2)
+        self.gridLayout_18.addWidget(self.frame, 1, 0, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_18.addItem(spacerItem1, 0, 0, 1, 1)
+
+        self.retranslateUi(pageOne12)
+        QtCore.QMetaObject.connectSlotsByName(pageOne12)
+
+    def retranslateUi(self, pageOne12):
+        _translate = QtCore.QCoreApplication.translate
+        self.label_46.setText(_translate("BeckPage12", "I make decisions about as well as I ever could."))
+        self.label_47.setText(_translate("BeckPage12", "I put off making decisions more than I used to."))
+        self.label_48.setText(_translate("BeckPage12", "I have greater difficulty in making decisions more than I used to."))
+        self.label_49.setText(_translate("BeckPage12", "I can\'t make decisions at all anymore."))
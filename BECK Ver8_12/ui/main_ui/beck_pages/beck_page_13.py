@@ -0,0 +1,64 @@
+# Form implementation generated from reading ui file 'beck_pages/beck_page_13.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_BeckPage13(object):
+    def setupUi(self, pageOne13):
+        pageOne13.setObjectName("pageOne13")
+        self.gridLayout_19 = QtWidgets.QGridLayout(pageOne13)
+        self.gridLayout_19.setObjectName("gridLayout_19")
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_19.addItem(spacerItem, 3, 0, 1, 1)
+        self.frame = QtWidgets.QFrame(parent=pageOne13)
+        self.frame.setObjectName("frame")
+        self.gridLayout_40 = QtWidgets.QGridLayout(self.frame)
+        self.gridLayout_40.setContentsMargins(12, 0, 0, 0)
+        self.gridLayout_40.setObjectName("gridLayout_40")
+        self.b_slider_14 = QtWidgets.QSlider(parent=self.frame)
+        self.b_slider_14.setMaximum(3)
+        self.b_slider_14.setOrientation(QtCore.Qt.Orientation.Vertical)
+        self.b_slider_14.setInvertedAppearance(True)
+        self.b_slider_14.setObjectName("b_slider_14")
+        self.gridLayout_40.addWidget(self.b_slider_14, 1, 0, 1, 1)
+        self.frame_4 = QtWidgets.QFrame(parent=self.frame)
+        self.frame_4.setObjectName("frame_4")
+        self.verticalLayout_13 = QtWidgets.QVBoxLayout(self.frame_4)
+        self.verticalLayout_13.setObjectName("verticalLayout_13")
+        self.label_50 = QtWidgets.QLabel(parent=self.frame_4)
+        self.label_50.setObjectName("label_50")
+        self.verticalLayout_13.addWidget(self.label_50)
+        self.label_51 = QtWidgets.QLabel(parent=self.frame_4)
+        self.label_51.setObjectName("label_51")
+        self.verticalLayout_13.addWidget(self.label_51)
+        self.label_52 = QtWidgets.QLabel(parent=self.frame_4)
+        self.label_52.setObjectName("label_52")
+        self.verticalLayout_13.addWidget(self.label_52)
+        self.label_53 = QtWidgets.QLabel(parent=self.frame_4)
+        self.label_53.setObjectName("label_53")
+        self.verticalLayout_13.addWidget(self.label_53)
+        self.gridLayout_40.addWidget(self.frame_4, 1, 1, 1, 1)
+        self.b_box_14 = QtWidgets.QSpinBox(parent=self.frame)
+        self.b_box_14.setFrame(False)
+        self.b_box_14.setButtonSymbols(QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons)
+        self.b_box_14.setObjectName("b_box_14")
+        self.gridLayout_40.addWidget(self.b_box_14, 0, 0, 1, 2)
+        self.gridLayout_19.addWidget(self.frame, 2, 0, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_19.addItem(spacerItem1, 0, 0, 1, 1)
+
+        self.retranslateUi(pageOne13)
+        QtCore.QMetaObject.connectSlotsByName(pageOne13)
+
+    def retranslateUi(self, pageOne13):
+        _translate = QtCore.QCoreApplication.translate
+        self.label_50.setText(_translate("BeckPage13", "I don\'t feel that I look any worse than I used to."))
+        self.label_51.setText(_translate("BeckPage13", "I am worried that I am looking old or ugly"))
+        self.label_52.setText(_translate("BeckPage13", "I feel there are permanent changes in my appearance that make me look ugly"))
+        self.label_53.setText(_translate("BeckPage13", "I believe I look ugly"))
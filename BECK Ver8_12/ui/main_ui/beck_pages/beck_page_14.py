@@ -0,0 +1,64 @@
+# Form implementation generated from reading ui file 'beck_pages/beck_page_14.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_BeckPage14(object):
+    def setupUi(self, pageOne14):
+        pageOne14.setObjectName("pageOne14")
+        self.gridLayout_20 = QtWidgets.QGridLayout(pageOne14)
+        self.gridLayout_20.setObjectName("gridLayout_20")
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_20.addItem(spacerItem, 2, 0, 1, 1)
+        self.frame = QtWidgets.QFrame(parent=pageOne14)
+        self.frame.setObjectName("frame")
+        self.gridLayout_41 = QtWidgets.QGridLayout(self.frame)
+        self.gridLayout_41.setContentsMargins(12, 0, 0, 0)
+        self.gridLayout_41.setObjectName("gridLayout_41")
+        self.frame_5 = QtWidgets.QFrame(parent=self.frame)
+        self.frame_5.setObjectName("frame_5")
+        self.verticalLayout_14 = QtWidgets.QVBoxLayout(self.frame_5)
+        self.verticalLayout_14.setObjectName("verticalLayout_14")
+        self.label_54 = QtWidgets.QLabel(parent=self.frame_5)
+        self.label_54.setObjectName("label_54")
+        self.verticalLayout_14.addWidget(self.label_54)
+        self.label_55 = QtWidgets.QLabel(parent=self.frame_5)
+        self.label_55.setObjectName("label_55")
+        self.verticalLayout_14.addWidget(self.label_55)
+        self.label_56 = QtWidgets.QLabel(parent=self.frame_5)
+        self.label_56.setObjectName("label_56")
+        self.verticalLayout_14.addWidget(self.label_56)
+        self.label_57 = QtWidgets.QLabel(parent=self.frame_5)
+        self.label_57.setObjectName("label_57")
+        self.verticalLayout_14.addWidget(self.label_57)
+        self.gridLayout_41.addWidget(self.frame_5, 1, 1, 1, 1)
+        self.b_slider_15 = QtWidgets.QSlider(parent=self.frame)
+        self.b_slider_15.setMaximum(3)
+        self.b_slider_15.setOrientation(QtCore.Qt.Orientation.Vertical)
+        self.b_slider_15.setInvertedAppearance(True)
+        self.b_slider_15.setObjectName("b_slider_15")
+        self.gridLayout_41.addWidget(self.b_slider_15, 1, 0, 1, 1)
+        self.b_box_15 = QtWidgets.QSpinBox(parent=self.frame)
+        self.b_box_15.setFrame(False)
+        self.b_box_15.setButtonSymbols(QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons)
+        self.b_box_15.setObjectName("b_box_15")
+        self.gridLayout_41.addWidget(self.b_box_15, 0, 0, 1, 2)
+        self.gridLayout_20.addWidget(self.frame, 1, 0, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_20.addItem(spacerItem1, 0, 0, 1, 1)
+
+        self.retranslateUi(pageOne14)
+        QtCore.QMetaObject.connectSlotsByName(pageOne14)
+
+    def retranslateUi(self, pageOne14):
+        _translate = QtCore.QCoreApplication.translate
+        self.label_54.setText(_translate("BeckPage14", "I can work about as well as before."))
+        self.label_55.setText(_translate("BeckPage14", "It takes an extra effort to get started at doing something."))
+        self.label_56.setText(_translate("BeckPage14", "I have to push myself very hard to do anything."))
+        self.label_57.setText(_translate("BeckPage14", "I can\'t do any work at all."))
@@ -0,0 +1,64 @@
+# Form implementation generated from reading ui file 'beck_pages/beck_page_15.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_BeckPage15(object):
+    def setupUi(self, pageOne15):
+        pageOne15.setObjectName("pageOne15")
+        self.gridLayout_9 = QtWidgets.QGridLayout(pageOne15)
+        self.gridLayout_9.setObjectName("gridLayout_9")
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_9.addItem(spacerItem, 2, 0, 1, 1)
+        self.frame = QtWidgets.QFrame(parent=pageOne15)
+        self.frame.setObjectName("frame")
+        self.gridLayout_42 = QtWidgets.QGridLayout(self.frame)
+        self.gridLayout_42.setContentsMargins(12, 0, 0, 0)
+        self.gridLayout_42.setObjectName("gridLayout_42")
+        self.frame_6 = QtWidgets.QFrame(parent=self.frame)
+        self.frame_6.setObjectName("frame_6")
+        self.verticalLayout_15 = QtWidgets.QVBoxLayout(self.frame_6)
+        self.verticalLayout_15.setObjectName("verticalLayout_15")
+        self.label_58 = QtWidgets.QLabel(parent=self.frame_6)
+        self.label_58.setObjectName("label_58")
+        self.verticalLayout_15.addWidget(self.label_58)
+        self.label_59 = QtWidgets.QLabel(parent=self.frame_6)
+        self.label_59.setObjectName("label_59")
+        self.verticalLayout_15.addWidget(self.label_59)
+        self.label_60 = QtWidgets.QLabel(parent=self.frame_6)
+        self.label_60.setObjectName("label_60")
+        self.verticalLayout_15.addWidget(self.label_60)
+        self.label_61 = QtWidgets.QLabel(parent=self.frame_6)
+        self.label_61.setObjectName("label_61")
+        self.verticalLayout_15.addWidget(self.label_61)
+        self.gridLayout_42.addWidget(self.frame_6, 1, 1, 1, 1)
+        self.b_slider_16 = QtWidgets.QSlider(parent=self.frame)
+        self.b_slider_16.setMaximum(3)
+        self.b_slider_16.setOrientation(QtCore.Qt.Orientation.Vertical)
+        self.b_slider_16.setInvertedAppearance(True)
+        self.b_slider_16.setObjectName("b_slider_16")
+        self.gridLayout_42.addWidget(self.b_slider_16, 1, 0, 1, 1)
+        self.b_box_16 = QtWidgets.QSpinBox(parent=self.frame)
+        self.b_box_16.setFrame(False)
+        self.b_box_16.setButtonSymbols(QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons)
+        self.b_box_16.setObjectName("b_box_16")
+        self.gridLayout_42.addWidget(self.b_box_16, 0, 0, 1, 2)
+        self.gridLayout_9.addWidget(self.frame, 1, 0, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_9.addItem(spacerItem1, 0, 0, 1, 1)
+
+        self.retranslateUi(pageOne15)
+        QtCore.QMetaObject.connectSlotsByName(pageOne15)
+
+    def retranslateUi(self, pageOne15):
+        _translate = QtCore.QCoreApplication.translate
+        self.label_58.setText(_translate("BeckPage15", "I can sleep as well as usual."))
+        self.label_59.setText(_translate("BeckPage15", "I don\'t sleep as well as I used to."))
+        self.label_60.setText(_translate("BeckPage15", "I wake up 1-2 hours earlier than usual and find it hard to get back to sleep."))
+        self.label_61.setText(_translate("BeckPage15", "I wake up several hours earlier than I used to and cannot get back to sleep"))
@@ -0,0 +1,64 @@
+# Form implementation generated from reading ui file 'beck_pages/beck_page_16.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_BeckPage16(object):
+    def setupUi(self, pageOne16):
+        pageOne16.setObjectName("pageOne16")
+        self.gridLayout_22 = QtWidgets.QGridLayout(pageOne16)
+        self.gridLayout_22.setObjectName("gridLayout_22")
+        self.frame = QtWidgets.QFrame(parent=pageOne16)
+        self.frame.setObjectName("frame")
+        self.gridLayout_43 = QtWidgets.QGridLayout(self.frame)
+        self.gridLayout_43.setContentsMargins(12, 0, 0, 0)
+        self.gridLayout_43.setObjectName("gridLayout_43")
+        self.b_slider_17 = QtWidgets.QSlider(parent=self.frame)
+        self.b_slider_17.setMaximum(3)
+        self.b_slider_17.setOrientation(QtCore.Qt.Orientation.Vertical)
+        self.b_slider_17.setInvertedAppearance(True)
+        self.b_slider_17.setObjectName("b_slider_17")
+        self.gridLayout_43.addWidget(self.b_slider_17, 1, 0, 1, 1)
+        self.frame_7 = QtWidgets.QFrame(parent=self.frame)
+        self.frame_7.setObjectName("frame_7")
+        self.verticalLayout_16 = QtWidgets.QVBoxLayout(self.frame_7)
+        self.verticalLayout_16.setObjectName("verticalLayout_16")
+        self.label_62 = QtWidgets.QLabel(parent=self.frame_7)
+        self.label_62.setObjectName("label_62")
+        self.verticalLayout_16.addWidget(self.label_62)
+        self.label_63 = QtWidgets.QLabel(parent=self.frame_7)
+        self.label_63.setObjectName("label_63")
+        self.verticalLayout_16.addWidget(self.label_63)
+        self.label_64 = QtWidgets.QLabel(parent=self.frame_7)
+        self.label_64.setObjectName("label_64")
+        self.verticalLayout_16.addWidget(self.label_64)
+        self.label_65 = QtWidgets.QLabel(parent=self.frame_7)
+        self.label_65.setObjectName("label_65")
+        self.verticalLayout_16.addWidget(self.label_65)
+        self.gridLayout_43.addWidget(self.frame_7, 1, 1, 1, 1)
+        self.b_box_17 = QtWidgets.QSpinBox(parent=self.frame)
+        self.b_box_17.setFrame(False)
+        self.b_box_17.setButtonSymbols(QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons)
+        self.b_box_17.setObjectName("b_box_17")
+        self.gridLayout_43.addWidget(self.b_box_17, 0, 0, 1, 2)
+        self.gridLayout_22.addWidget(self.frame, 1, 0, 1, 1)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_22.addItem(spacerItem, 2, 0, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_22.addItem(spacerItem1, 0, 0, 1, 1)
+
+        self.retranslateUi(pageOne16)
+        QtCore.QMetaObject.connectSlotsByName(pageOne16)
+
+    def retranslateUi(self, pageOne16):
+        _translate = QtCore.QCoreApplication.translate
+        self.label_62.setText(_translate("BeckPage16", "I don\'t get more tired than usual."))
+        self.label_63.setText(_translate("BeckPage16", "I get tired more easily than I used to."))
+        self.label_64.setText(_translate("BeckPage16", "I get tired from doing almost anything."))
+        self.label_65.setText(_translate("BeckPage16", "I am too tired to do anything."))
@@ -0,0 +1,64 @@
+# Form implementation generated from reading ui file 'beck_pages/beck_page_17.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_BeckPage17(object):
+    def setupUi(self, pageOne17):
+        pageOne17.setObjectName("pageOne17")
+        self.gridLayout_23 = QtWidgets.QGridLayout(pageOne17)
+        self.gridLayout_23.setObjectName("gridLayout_23")
+        self.frame = QtWidgets.QFrame(parent=pageOne17)
+        self.frame.setObjectName("frame")
+        self.gridLayout_44 = QtWidgets.QGridLayout(self.frame)
+        self.gridLayout_44.setContentsMargins(12, 0, 0, 0)
+        self.gridLayout_44.setObjectName("gridLayout_44")
+        self.b_slider_18 = QtWidgets.QSlider(parent=self.frame)
+        self.b_slider_18.setMaximum(3)
+        self.b_slider_18.setOrientation(QtCore.Qt.Orientation.Vertical)
+        self.b_slider_18.setInvertedAppearance(True)
+        self.b_slider_18.setObjectName("b_slider_18")
+        self.gridLayout_44.addWidget(self.b_slider_18, 1, 0, 1, 1)
+        self.frame_8 = QtWidgets.QFrame(parent=self.frame)
+        self.frame_8.setObjectName("frame_8")
+        self.verticalLayout_17 = QtWidgets.QVBoxLayout(self.frame_8)
+        self.verticalLayout_17.setObjectName("verticalLayout_17")
+        self.label_66 = QtWidgets.QLabel(parent=self.frame_8)
+        self.label_66.setObjectName("label_66")
+        self.verticalLayout_17.addWidget(self.label_66)
+        self.label_67 = QtWidgets.QLabel(parent=self.frame_8)
+        self.label_67.setObjectName("label_67")
+        self.verticalLayout_17.addWidget(self.label_67)
+        self.label_68 = QtWidgets.QLabel(parent=self.frame_8)
+        self.label_68.setObjectName("label_68")
+        self.verticalLayout_17.addWidget(self.label_68)
+        self.label_69 = QtWidgets.QLabel(parent=self.frame_8)
+        self.label_69.setObjectName("label_69")
+        self.verticalLayout_17.addWidget(self.label_69)
+        self.gridLayout_44.addWidget(self.frame_8, 1, 1, 1, 1)
+        self.b_box_18 = QtWidgets.QSpinBox(parent=self.frame)
+        self.b_box_18.setFrame(False)
+        self.b_box_18.setButtonSymbols(QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons)
+        self.b_box_18.setObjectName("b_box_18")
+        self.gridLayout_44.addWidget(self.b_box_18, 0, 0, 1, 2)
+        self.gridLayout_23.addWidget(self.frame, 1, 0, 1, 1)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_23.addItem(spacerItem, 2, 0, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_23.addItem(spacerItem1, 0, 0, 1, 1)
+
+        self.retranslateUi(pageOne17)
+        QtCore.QMetaObject.connectSlotsByName(pageOne17)
+
+    def retranslateUi(self, pageOne17):
+        _translate = QtCore.QCoreApplication.translate
+        self.label_66.setText(_translate("BeckPage17", "My appetite is no worse than usual."))
+        self.label_67.setText(_translate("BeckPage17", "My appetite is not as good as it used to be."))
+        self.label_68.setText(_translate("BeckPage17", "My appetite is much worse now."))
+        self.label_69.setText(_translate("BeckPage17", "I have no appetite at all anymore."))
@@ -0,0 +1,64 @@
+# Form implementation generated from reading ui file 'beck_pages/beck_page_18.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_BeckPage18(object):
+    def setupUi(self, pageOne18):
+        pageOne18.setObjectName("pageOne18")
+        self.gridLayout_24 = QtWidgets.QGridLayout(pageOne18)
+        self.gridLayout_24.setObjectName("gridLayout_24")
+        self.frame = QtWidgets.QFrame(parent=pageOne18)
+        self.frame.setObjectName("frame")
+        self.gridLayout_45 = QtWidgets.QGridLayout(self.frame)
+        self.gridLayout_45.setContentsMargins(12, 0, 0, 0)
+        self.gridLayout_45.setObjectName("gridLayout_45")
+        self.b_slider_19 = QtWidgets.QSlider(parent=self.frame)
+        self.b_slider_19.setMaximum(3)
+        self.b_slider_19.setOrientation(QtCore.Qt.Orientation.Vertical)
+        self.b_slider_19.setInvertedAppearance(True)
+        self.b_slider_19.setObjectName("b_slider_19")
+        self.gridLayout_45.addWidget(self.b_slider_19, 1, 0, 1, 1)
+        self.frame_9 = QtWidgets.QFrame(parent=self.frame)
+        self.frame_9.setObjectName("frame_9")
+        self.verticalLayout_18 = QtWidgets.QVBoxLayout(self.frame_9)
+        self.verticalLayout_18.setObjectName("verticalLayout_18")
+        self.label_70 = QtWidgets.QLabel(parent=self.frame_9)
+        self.label_70.setObjectName("label_70")
+        self.verticalLayout_18.addWidget(self.label_70)
+        self.label_71 = QtWidgets.QLabel(parent=self.frame_9)
+        self.label_71.setObjectName("label_71")
+        self.verticalLayout_18.addWidget(self.label_71)
+        self.label_72 = QtWidgets.QLabel(parent=self.frame_9)
+        self.label_72.setObjectName("label_72")
+        self.verticalLayout_18.addWidget(self.label_72)
+        self.label_73 = QtWidgets.QLabel(parent=self.frame_9)
+        self.label_73.setObjectName("label_73")
+        self.verticalLayout_18.addWidget(self.label_73)
+        self.gridLayout_45.addWidget(self.frame_9, 1, 1, 1, 1)
+        self.b_box_19 = QtWidgets.QSpinBox(parent=self.frame)
+        self.b_box_19.setFrame(False)
+        self.b_box_19.setButtonSymbols(QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons)
+        self.b_box_19.setObjectName("b_box_19")
+        self.gridLayout_45.addWidget(self.b_box_19, 0, 0, 1, 2)
+        self.gridLayout_24.addWidget(self.frame, 1, 0, 1, 1)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_24.addItem(spacerItem, 2, 0, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_24.addItem(spacerItem1, 0, 0, 1, 1)
+
+        self.retranslateUi(pageOne18)
+        QtCore.QMetaObject.connectSlotsByName(pageOne18)
+
+    def retranslateUi(self, pageOne18):
+        _translate = QtCore.QCoreApplication.translate
+        self.label_70.setText(_translate("BeckPage18", "I\'m no more hungry nor thirsty than I usually am."))
+        self.label_71.setText(_translate("BeckPage18", "I\'m less hungry or thirsty than usual."))
+        self.label_72.setText(_translate("BeckPage18", "I have barely eaten anything today."))
+        self.label_73.setText(_translate("BeckPage18", "I have not eaten anything today."))
@@ -0,0 +1,68 @@
+# Form implementation generated from reading ui file 'beck_pages/beck_page_19.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_BeckPage19(object):
+    def setupUi(self, pageOne19):
+        pageOne19.setObjectName("pageOne19")
+        self.gridLayout_14 = QtWidgets.QGridLayout(pageOne19)
+        self.gridLayout_14.setObjectName("gridLayout_14")
+        self.frame = QtWidgets.QFrame(parent=pageOne19)
+        self.frame.setObjectName("frame")
+        self.gridLayout_46 = QtWidgets.QGridLayout(self.frame)
+        self.gridLayout_46.setContentsMargins(12, 0, 0, 0)
+        self.gridLayout_46.setObjectName("gridLayout_46")
+        self.b_slider_20 = QtWidgets.QSlider(parent=self.frame)
+        self.b_slider_20.setMaximum(3)
+        self.b_slider_20.setOrientation(QtCore.Qt.Orientation.Vertical)
+        self.b_slider_20.setInvertedAppearance(True)
+        self.b_slider_20.setObjectName("b_slider_20")
+        self.gridLayout_46.addWidget(self.b_slider_20, 1, 0, 1, 1)
+        self.frame_10 = QtWidgets.QFrame(parent=self.frame)
+        self.frame_10.setObjectName("frame_10")
+        self.verticalLayout_19 = QtWidgets.QVBoxLayout(self.frame_10)
+        self.verticalLayout_19.setObjectName("verticalLayout_19")
+        self.label_74 = QtWidgets.QLabel(parent=self.frame_10)
+        self.label_74.setWordWrap(True)
+        self.label_74.setObjectName("label_74")
+        self.verticalLayout_19.addWidget(self.label_74)
+        self.label_75 = QtWidgets.QLabel(parent=self.frame_10)
+        self.label_75.setWordWrap(True)
+        self.label_75.setObjectName("label_75")
+        self.verticalLayout_19.addWidget(self.label_75)
+        self.label_76 = QtWidgets.QLabel(parent=self.frame_10)
+        self.label_76.setWordWrap(True)
+        self.label_76.setObjectName("label_76")
+        self.verticalLayout_19.addWidget(self.label_76)
+        self.label_77 = QtWidgets.QLabel(parent=self.frame_10)
+        self.label_77.setWordWrap(True)
+        self.label_77.setObjectName("label_77")
+        self.verticalLayout_19.addWidget(self.label_77)
+        self.gridLayout_46.addWidget(self.frame_10, 1, 1, 1, 1)
+        self.b_box_20 = QtWidgets.QSpinBox(parent=self.frame)
+        self.b_box_20.setFrame(False)
+        self.b_box_20.setButtonSymbols(QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons)
+        self.b_box_20.setObjectName("b_box_20")
+        self.gridLayout_46.addWidget(self.b_box_20, 0, 0, 1, 2)
+        self.gridLayout_14.addWidget(self.frame, 1, 0, 1, 1)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_14.addItem(spacerItem, 2, 0, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_14.addItem(spacerItem1, 0, 0, 1, 1)
+
+        self.retranslateUi(pageOne19)
+        QtCore.QMetaObject.connectSlotsByName(pageOne19)
+
+    def retranslateUi(self, pageOne19):
+        _translate = QtCore.QCoreApplication.translate
+        self.label_74.setText(_translate("BeckPage19", "I am no more worried about my health than usual."))
+        self.label_75.setText(_translate("BeckPage19", "I am worried about physical problems like aches, pains etc."))
+        self.label_76.setText(_translate("BeckPage19", "I am burdened by the thoughts of my poor physical health"))
+        self.label_77.setText(_translate("BeckPage19", "I cannot concentrate on anything other than my physical ailments."))
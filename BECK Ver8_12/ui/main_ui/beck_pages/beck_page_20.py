@@ -0,0 +1,64 @@
+# Form implementation generated from reading ui file 'beck_pages/beck_page_20.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_BeckPage20(object):
+    def setupUi(self, pageOne20):
+        pageOne20.setObjectName("pageOne20")
+        self.gridLayout_17 = QtWidgets.QGridLayout(pageOne20)
+        self.gridLayout_17.setObjectName("gridLayout_17")
+        self.frame_12 = QtWidgets.QFrame(parent=pageOne20)
+        self.frame_12.setObjectName("frame_12")
+        self.gridLayout_47 = QtWidgets.QGridLayout(self.frame_12)
+        self.gridLayout_47.setContentsMargins(12, 0, 0, 0)
+        self.gridLayout_47.setObjectName("gridLayout_47")
+        self.frame_11 = QtWidgets.QFrame(parent=self.frame_12)
+        self.frame_11.setObjectName("frame_11")
+        self.verticalLayout_20 = QtWidgets.QVBoxLayout(self.frame_11)
+        self.verticalLayout_20.setObjectName("verticalLayout_20")
+        self.label_78 = QtWidgets.QLabel(parent=self.frame_11)
+        self.label_78.setObjectName("label_78")
+        self.verticalLayout_20.addWidget(self.label_78)
+        self.label_79 = QtWidgets.QLabel(parent=self.frame_11)
+        self.label_79.setObjectName("label_79")
+        self.verticalLayout_20.addWidget(self.label_79)
+        self.label_80 = QtWidgets.QLabel(parent=self.frame_11)
+        self.label_80.setObjectName("label_80")
+        self.verticalLayout_20.addWidget(self.label_80)
+        self.label_81 = QtWidgets.QLabel(parent=self.frame_11)
+        self.label_81.setObjectName("label_81")
+        self.verticalLayout_20.addWidget(self.label_81)
+        self.gridLayout_47.addWidget(self.frame_11, 1, 1, 1, 1)
+        self.b_slider_21 = QtWidgets.QSlider(parent=self.frame_12)
+        self.b_slider_21.setMaximum(3)
+        self.b_slider_21.setOrientation(QtCore.Qt.Orientation.Vertical)
+        self.b_slider_21.setInvertedAppearance(True)
+        self.b_slider_21.setObjectName("b_slider_21")
+        self.gridLayout_47.addWidget(self.b_slider_21, 1, 0, 1, 1)
+        self.b_box_21 = QtWidgets.QSpinBox(parent=self.frame_12)
+        self.b_box_21.setFrame(False)
+        self.b_box_21.setButtonSymbols(QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons)
+        self.b_box_21.setObjectName("b_box_21")
+        self.gridLayout_47.addWidget(self.b_box_21, 0, 0, 1, 2)
+        self.gridLayout_17.addWidget(self.frame_12, 2, 0, 1, 1)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_17.addItem(spacerItem, 0, 0, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_17.addItem(spacerItem1, 3, 0, 1, 1)
+
+        self.retranslateUi(pageOne20)
+        QtCore.QMetaObject.connectSlotsByName(pageOne20)
+
+    def retranslateUi(self, pageOne20):
+        _translate = QtCore.QCoreApplication.translate
+        self.label_78.setText(_translate("BeckPage20", "I have not noticed any recent change in my interest in sex."))
+        self.label_79.setText(_translate("BeckPage20", "I am less interested in sex than I used to be."))
+        self.label_80.setText(_translate("BeckPage20", "I have almost no interest in sex."))
+        self.label_81.setText(_translate("BeckPage20", "I have lost interest in sex completely."))
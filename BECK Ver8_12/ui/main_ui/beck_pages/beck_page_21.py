@@ -0,0 +1,60 @@
+# Form implementation generated from reading ui file 'beck_pages/beck_page_21.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_BeckPage21(object):
+    def setupUi(self, pageOne21):
+        pageOne21.setObjectName("pageOne21")
+        self.gridLayout_26 = QtWidgets.QGridLayout(pageOne21)
+        self.gridLayout_26.setObjectName("gridLayout_26")
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_26.addItem(spacerItem, 2, 0, 1, 1)
+        self.frame = QtWidgets.QFrame(parent=pageOne21)
+        self.frame.setObjectName("frame")
+        self.gridLayout_48 = QtWidgets.QGridLayout(self.frame)
+        self.gridLayout_48.setContentsMargins(12, 0, 0, 0)
+        self.gridLayout_48.setObjectName("gridLayout_48")
+        self.scrollArea = QtWidgets.QScrollArea(parent=self.frame)
+        self.scrollArea.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.scrollArea.setWidgetResizable(True)
+        self.scrollArea.setObjectName("scrollArea")
+        self.scrollAreaWidgetContents = QtWidgets.QWidget()
+        self.scrollAreaWidgetContents.setGeometry(QtCore.QRect(0, 0, 471, 144))
+        self.scrollAreaWidgetContents.setObjectName("scrollAreaWidgetContents")
+        self.gridLayout_25 = QtWidgets.QGridLayout(self.scrollAreaWidgetContents)
+        self.gridLayout_25.setObjectName("gridLayout_25")
+        self.label = QtWidgets.QLabel(parent=self.scrollAreaWidgetContents)
+        self.label.setObjectName("label")
+        self.gridLayout_25.addWidget(self.label, 0, 0, 1, 1)
+        self.scrollArea.setWidget(self.scrollAreaWidgetContents)
+        self.gridLayout_48.addWidget(self.scrollArea, 1, 1, 1, 1)
+        self.beck_summary = QtWidgets.QSlider(parent=self.frame)
+        self.beck_summary.setMaximum(64)
+        self.beck_summary.setOrientation(QtCore.Qt.Orientation.Vertical)
+        self.beck_summary.setInvertedAppearance(True)
+        self.beck_summary.setObjectName("beck_summary")
+        self.gridLayout_48.addWidget(self.beck_summary, 1, 0, 1, 1)
+        self.sum_box = QtWidgets.QSpinBox(parent=self.frame)
+        self.sum_box.setFrame(False)
+        self.sum_box.setReadOnly(True)
+        self.sum_box.setButtonSymbols(QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons)
+        self.sum_box.setObjectName("sum_box")
+        self.gridLayout_48.addWidget(self.sum_box, 0, 0, 1, 2)
+        self.gridLayout_26.addWidget(self.frame, 1, 0, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_26.addItem(spacerItem1, 0, 0, 1, 1)
+
+        self.retranslateUi(pageOne21)
+        QtCore.QMetaObject.connectSlotsByName(pageOne21)
+
+    def retranslateUi(self, pageOne21):
+        _translate = QtCore.QCoreApplication.translate
+        self.label.setText(_translate("BeckPage21", "<html><head/><body><p><span style=\" font-family:\'TimesNewRoman\'; font-size:9pt; font-weight:600;\">1-10</span><span style=\" font-family:\'TimesNewRoman\'; font-size:9pt;\"> These ups and downs are considered normal </span></p><p><span style=\" font-family:\'TimesNewRoman\'; font-size:9pt; font-weight:600;\">11-16</span><span style=\" font-family:\'TimesNewRoman\'; font-size:9pt;\"> Mild mood disturbance </span></p><p><span style=\" font-family:\'TimesNewRoman\'; font-size:9pt; font-weight:600;\">17-20</span><span style=\" font-family:\'TimesNewRoman\'; font-size:9pt;\"> Borderline clinical depression </span></p><p><span style=\" font-family:\'TimesNewRoman\'; font-size:9pt; font-weight:600;\">21-30</span><span style=\" font-family:\'TimesNewRoman\'; font-size:9pt;\"> Moderate depression </span></p><p><span style=\" font-family:\'TimesNewRoman\'; font-size:9pt; font-weight:600;\">31-40</span><span style=\" font-family:\'TimesNewRoman\'; font-size:9pt;\"> Severe depression </span></p><p><span style=\" font-family:\'TimesNewRoman\'; font-size:9pt; font-weight:600;\">over 40</span><span style=\" font-family:\'TimesNewRoman\'; font-size:9pt;\"> Extreme depression </span></p></body></html>"))
+        self.sum_box.setSuffix(_translate("BeckPage21", " BECKys"))
@@ -0,0 +1,157 @@
+"""
+The application's themes: one stylesheet set on the QApplication instead of one per widget.
+
+The stylesheet is ui/themes/beck.qss with a theme's colours filled in, followed by one block
+of rules per slider that gives it its accent colour by object name. It is built once per theme
+and cached, so switching themes at runtime costs only Qt's re-polish of the open widgets.
+benchmarks/bench_stylesheets.py compares startup with the per-widget stylesheets this replaced.
+"""
+from functools import lru_cache
+from pathlib import Path
+from string import Template
+from typing import Dict, Tuple
+
+from PyQt6.QtCore import QSettings
+from PyQt6.QtWidgets import QApplication
+
+import tracker_config as tkc
+from logger_setup import get_logger
+
+logger = get_logger(__name__)
+
+STYLESHEET_PATH = Path(__file__).with_name('themes') / 'beck.qss'
+SETTINGS_KEY = 'theme'
+
+# The colours beck.qss refers to, per theme.
+THEMES: Dict[str, Dict[str, str]] = {
+    'dark': {
+        'window': '#121212',
+        'text': '#fff',
+        'groove': 'rgb(22, 24, 29)',
+        'horizontal_groove': 'rgba(22,22,22,100)',
+        'horizontal_groove_hover': 'rgb(32, 32, 32)',
+        'scroll_handle': 'rgb(22,22,22)',
+        'table_text': 'rgb(46,58,146)',
+        'table_item': 'rgb(111,123,211)',
+        'table_selected': 'rgb(23, 23, 23)',
+        'table_selection': '#7e57c2',
+        'tooltip_background': 'rgba(23,23,23, 150)',
+        'tooltip_text': 'rgb(100,199,211)',
+    },
+    'light': {
+        'window': '#f4f4f6',
+        'text': '#1c1c1c',
+        'groove': 'rgb(222, 224, 229)',
+        'horizontal_groove': 'rgba(0,0,0,25)',
+        'horizontal_groove_hover': 'rgb(215, 215, 215)',
+        'scroll_handle': 'rgb(200,200,200)',
+        'table_text': 'rgb(46,58,146)',
+        'table_item': 'rgb(215,219,245)',
+        'table_selected': 'rgb(235, 235, 240)',
+        'table_selection': '#b39ddb',
+        'tooltip_background': 'rgba(250,250,250, 230)',
+        'tooltip_text': 'rgb(30,110,120)',
+    },
+}
+
+# Every slider's accent colour, the same in every theme. The hover and pressed handles are
+# lighter and darker shades and the groove a translucent tint of it.
+SLIDER_ACCENTS: Dict[str, Tuple[int, int, int]] = {
+    'b_slider': (100, 150, 178),
+    'b_slider_2': (67, 149, 223),
+    'b_slider_3': (82, 145, 226),
+    'b_slider_4': (97, 141, 228),
+    'b_slider_5': (113, 136, 229),
+    'b_slider_6': (128, 131, 228),
+    'b_slider_7': (142, 125, 225),
+    'b_slider_8': (156, 119, 221),
+    'b_slider_9': (170, 112, 215),
+    'b_slider_10': (183, 104, 208),
+    'b_slider_11': (194, 96, 199),
+    'b_slider_12': (205, 88, 188),
+    'b_slider_13': (214, 79, 176),
+    'b_slider_14': (99, 160, 201),
+    'b_slider_15': (153, 102, 153),
+    'b_slider_16': (96, 175, 106),
+    'b_slider_17': (207, 86, 150),
+    'b_slider_18': (236, 46, 103),
+    'b_slider_19': (236, 47, 87),
+    'b_slider_20': (242, 89, 85),
+    'b_slider_21': (189, 97, 218),
+    'beck_summary': (96, 175, 106),
+}
+HOVER_LIGHTEN = 40
+PRESSED_DARKEN = 50
+
+
+def _shade(accent: Tuple[int, int, int], change: int) -> str:
+    return f"rgb({','.join(str(min(max(channel + change, 0), 255)) for channel in accent)})"
+
+
+def _slider_rules(name: str, accent: Tuple[int, int, int]) -> str:
+    tint = ','.join(str(channel) for channel in accent)
+    return (f"QSlider#{name}::handle:vertical {{background:{_shade(accent, 0)};}}\n"
+            f"QSlider#{name}::handle:vertical:hover {{background:{_shade(accent, HOVER_LIGHTEN)};}}\n"
+            f"QSlider#{name}::handle:vertical:pressed {{background:{_shade(accent, -PRESSED_DARKEN)};}}\n"
+            f"QSlider#{name}::groove:vertical:hover {{background:rgba({tint},0.25);}}\n"
+            f"QSlider#{name}::groove:vertical {{background:rgba({tint},0.15);}}\n")
+
+
+@lru_cache(maxsize=None)
+def stylesheet(name: str) -> str:
+    """
+    Builds a theme's stylesheet, once per theme.
+
+    Args:
+        name (str): The theme, one of THEMES.
+
+    Returns:
+        str: The stylesheet text.
+
+    Raises:
+        ValueError: If there is no theme with that name.
+        RuntimeError: If beck.qss cannot be read or refers to a colour the theme lacks.
+    """
+    if name not in THEMES:
+        raise ValueError(f"Unknown theme {name!r}, expected one of {', '.join(THEMES)}")
+    try:
+        template = Template(STYLESHEET_PATH.read_text(encoding='utf-8'))
+        base = template.substitute(THEMES[name])
+    except (OSError, KeyError, ValueError) as e:
+        error_message = f"Error building the {name} theme from {STYLESHEET_PATH}: {e}"
+        logger.error(error_message)
+        raise RuntimeError(error_message) from e
+    return base + '\n' + ''.join(_slider_rules(slider, accent) for slider, accent in SLIDER_ACCENTS.items())
+
+
+def apply_theme(app: QApplication, name: str) -> None:
+    """
+    Sets a theme's stylesheet on the application.
+
+    Applied before the main window is built, widgets are styled as they are first polished;
+    applied later, Qt re-polishes every widget once.
+
+    Args:
+        app (QApplication): The application.
+        name (str): The theme, one of THEMES.
+
+    Raises:
+        ValueError: If there is no theme with that name.
+        RuntimeError: If the stylesheet cannot be built.
+    """
+    app.setStyleSheet(stylesheet(name))
+    logger.info("Applied the %s theme", name)
+
+
+def saved_theme(settings: QSettings) -> str:
+    """
+    Reads the theme the user last chose.
+
+    Args:
+        settings (QSettings): The application settings.
+
+    Returns:
+        str: The saved theme, or tkc.THEME if none is saved or it no longer exists.
+    """
+    name = settings.value(SETTINGS_KEY, tkc.THEME, type=str)
+    return name if name in THEMES else tkc.THEME
@@ -0,0 +1,157 @@
+"""
+Times the phases of a launch and writes them as a Chrome trace.
+
+main.py imports this module before anything else and wraps each phase of run_app, and
+MainWindow each phase of its __init__ and of opening storage after the first frame, in
+startup_phase. Phases nest, so MainWindow's setupUi shows inside run_app's MainWindow.
+Timestamps come from time.perf_counter_ns, a monotonic clock, and count from this module's
+import. Recording costs two clock reads per phase and is always on; the trace is only written
+when the environment variable named by tkc.STARTUP_TRACE_ENV holds a file path, once storage
+is ready. Open the file in chrome://tracing or https://ui.perfetto.dev.
+
+Example:
+    BECK_STARTUP_TRACE=/tmp/startup.json python main.py
+
+benchmarks/bench_startup.py runs the application this way to compare cold and warm starts.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
+import tracker_config as tkc
+from logger_setup import get_logger
+
+logger = get_logger(__name__)
+
+CATEGORY = 'startup'
+FIRST_FRAME = 'first frame'
+READY = 'storage ready'
+
+
+class StartupProfile:
+    """
+    The phases of one launch, as Chrome trace events.
+
+    Attributes:
+        origin_ns (int): The perf_counter_ns reading every timestamp is relative to.
+        events (List[Dict[str, Any]]): Complete ('X') events for phases and instant ('i')
+            events for marks, in the order they ended.
+    """
+
+    def __init__(self, origin_ns: int) -> None:
+        self.origin_ns = origin_ns
+        self.events: List[Dict[str, Any]] = []
+
+    def _event(self, name: str, phase: str, start_ns: int) -> Dict[str, Any]:
+        return {'name': name, 'cat': CATEGORY, 'ph': phase,
+                'ts': (start_ns - self.origin_ns) / 1000,
+                'pid': os.getpid(), 'tid': threading.get_native_id()}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Records how long the body of a with statement takes, even if it raises.
+
+        Args:
+            name (str): The phase's name in the trace.
+        """
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            event = self._event(name, 'X', start_ns)
+            event['dur'] = (time.perf_counter_ns() - start_ns) / 1000
+            self.events.append(event)
+
+    def mark(self, name: str) -> None:
+        """
+        Records a moment, such as the first frame.
+
+        Args:
+            name (str): The mark's name in the trace.
+        """
+        event = self._event(name, 'i', time.perf_counter_ns())
+        event['s'] = 'p'
+        self.events.append(event)
+
+    def write(self, path: str) -> None:
+        """
+        Writes the events recorded so far as a Chrome trace-event JSON file.
+
+        Args:
+            path (str): The file to write.
+
+        Raises:
+            RuntimeError: If the file cannot be written.
+        """
+        trace = {
+            'traceEvents': [
+                {'name': 'process_name', 'ph': 'M', 'pid': os.getpid(),
+                 'args': {'name': tkc.APPLICATION_NAME}},
+                *self.events,
+            ],
+            'displayTimeUnit': 'ms',
+        }
+        try:
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump(trace, file, indent=1)
+        except OSError as e:
+            error_message = f"Error writing the startup trace to {path}: {e}"
+            logger.error(error_message)
+            raise RuntimeError(error_message) from e
+        logger.info("Wrote %s startup trace events to %s", len(self.events), path)
+
+
+startup_profile = StartupProfile(time.perf_counter_ns())
+
+
+def startup_phase(name: str):
+    """
+    Times a phase of the launch, see StartupProfile.phase.
+
+    Args:
+        name (str): The phase's name in the trace.
+
+    Returns:
+        A context manager.
+    """
+    return startup_profile.phase(name)
+
+
+def startup_mark(name: str) -> None:
+    """
+    Records a moment of the launch, see StartupProfile.mark.
+
+    Args:
+        name (str): The mark's name in the trace, such as FIRST_FRAME.
+
+    Returns:
+        None
+    """
+    startup_profile.mark(name)
+
+
+def finish_startup() -> None:
+    """
+    Marks that storage is ready, the end of the launch, and if tkc.STARTUP_TRACE_ENV is set,
+    writes the trace. If tkc.STARTUP_TRACE_QUIT_ENV is set as well, the application then quits,
+    for scripted runs.
+
+    Returns:
+        None
+    """
+    startup_profile.mark(READY)
+    path = os.environ.get(tkc.STARTUP_TRACE_ENV)
+    if not path:
+        return
+    try:
+        startup_profile.write(path)
+    except RuntimeError:
+        return
+    if os.environ.get(tkc.STARTUP_TRACE_QUIT_ENV):
+        from PyQt6.QtWidgets import QApplication
+
+        QApplication.instance().quit()
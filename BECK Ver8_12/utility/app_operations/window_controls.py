@@ -1,5 +1,7 @@
 from typing import Any
-from logger_setup import logger
+from logger_setup import get_logger
+
+logger = get_logger(__name__)
 
 
 class WindowController:
@@ -28,7 +30,7 @@ class WindowController:
                 window.showMinimized()
                 self.is_minimized = True
         except Exception as e:
-            logger.error(f"{e}", exc_info=True)
+            logger.error("%s", e, exc_info=True)
     
     def toggle_maximize(self, window: Any) -> None:
         """
@@ -1,5 +1,11 @@
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Mapping
+
+from PyQt6.QtCore import QObject, QSignalBlocker
 from PyQt6.QtWidgets import QSlider, QSpinBox
-from logger_setup import logger
+from logger_setup import get_logger
+
+logger = get_logger(__name__)
 
 
 def connect_slider_spinbox(slider: QSlider, spinbox: QSpinBox) -> None:
@@ -25,4 +31,50 @@ def connect_slider_spinbox(slider: QSlider, spinbox: QSpinBox) -> None:
                 spinbox.valueChanged.connect(slider.setValue)
                 # Add logger to track the success or failure of the connection process
     except Exception as e:
-        logger.error(f"Error connecting signals and slots: {e}")
+        logger.error("Error connecting signals and slots: %s", e)
+
+
+@contextmanager
+def batch_update(widgets: Iterable[QObject]) -> Iterator[None]:
+    """
+    Blocks the widgets' signals while the block runs.
+
+    Values set inside the block reach no slot, so linked widgets are not updated for you and
+    nothing that listens is told; the caller emits one consolidated change afterwards.
+    Repaints need no blocking: Qt already merges the widgets' updates into one paint per
+    event loop pass, while disabling updates on their page would repaint all of it.
+
+    Parameters:
+        widgets (Iterable[QObject]): The widgets whose signals to block.
+
+    Returns:
+        Iterator[None]: The context.
+    """
+    blockers = [QSignalBlocker(widget) for widget in widgets]
+    try:
+        yield
+    finally:
+        for blocker in blockers:
+            blocker.unblock()
+
+
+def set_linked_values(values: Mapping[QSlider, int], links: Mapping[QSlider, QSpinBox]) -> None:
+    """
+    Sets many sliders, and the spinboxes linked to them, without any signal in between.
+
+    Parameters:
+        values (Mapping[QSlider, int]): The new value of each slider.
+        links (Mapping[QSlider, QSpinBox]): The spinbox connect_slider_spinbox linked to each
+            slider; sliders without one are set alone.
+
+    Returns:
+        None
+    """
+    spinboxes = [links[slider] for slider in values if slider in links]
+    with batch_update([*values, *spinboxes]):
+        for slider, value in values.items():
+            slider.setValue(value)
+            spinbox = links.get(slider)
+            if spinbox is not None:
+                # The slider's value, clamped to its range, as its signal would have sent.
+                spinbox.setValue(slider.value())